@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-page field extraction with and without a shared PageContext
+
+Runs every extractor of ImprovedUSASkiResortScraper over the saved HTML
+fixtures twice:
+
+  * legacy  - each extractor is handed the raw soup (the pre-PageContext
+              call pattern, one full tree walk per extractor)
+  * context - extract_resort, which flattens the page once into a
+              PageContext shared by every extractor
+
+and reports full-document tree walks and parse time per page.
+
+Usage:
+    python3 bench_extraction.py [fixture_dir] [--rounds N]
+"""
+
+import argparse
+import glob
+import os
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Tuple
+
+from bs4 import BeautifulSoup
+from bs4.element import Tag
+
+from improved_usa_scraper import ImprovedUSASkiResortScraper
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def load_fixtures(fixture_dir: str) -> List[Tuple[str, bytes]]:
+    """Load (resort_url, html bytes) pairs from a directory of .html files"""
+    pages = []
+    for path in sorted(glob.glob(os.path.join(fixture_dir, '*.html'))):
+        slug = os.path.splitext(os.path.basename(path))[0]
+        with open(path, 'rb') as f:
+            pages.append((f"https://www.skiresort.info/ski-resort/{slug}/", f.read()))
+    return pages
+
+
+@contextmanager
+def count_tree_walks():
+    """Count get_text()/find_all() calls made on a document root"""
+    counter = {'walks': 0}
+    original_get_text = Tag.get_text
+    original_find_all = Tag.find_all
+
+    def get_text(self, *args, **kwargs):
+        if isinstance(self, BeautifulSoup):
+            counter['walks'] += 1
+        return original_get_text(self, *args, **kwargs)
+
+    def find_all(self, *args, **kwargs):
+        if isinstance(self, BeautifulSoup):
+            counter['walks'] += 1
+        return original_find_all(self, *args, **kwargs)
+
+    Tag.get_text = get_text
+    Tag.find_all = find_all
+    try:
+        yield counter
+    finally:
+        Tag.get_text = original_get_text
+        Tag.find_all = original_find_all
+
+
+def extract_legacy(scraper: ImprovedUSASkiResortScraper, soup: BeautifulSoup, url: str) -> Dict:
+    """Extract every field by handing each extractor the raw soup"""
+    return {
+        'name': scraper.extract_resort_name(soup),
+        'state': scraper.extract_state(soup, url),
+        'city': scraper.extract_city(soup),
+        'rating': scraper.extract_rating(soup),
+        'elevation_base': scraper.extract_elevation_base(soup),
+        'elevation_top': scraper.extract_elevation_top(soup),
+        'vertical_drop': scraper.extract_vertical_drop(soup),
+        'slopes_total_km': scraper.extract_slopes_total(soup),
+        'slopes_easy_km': scraper.extract_slopes_easy(soup),
+        'slopes_intermediate_km': scraper.extract_slopes_intermediate(soup),
+        'slopes_difficult_km': scraper.extract_slopes_difficult(soup),
+        'lifts_total': scraper.extract_lifts_total(soup),
+        'day_pass_price': scraper.extract_day_pass_price(soup),
+        'season_start': scraper.extract_season_start(soup),
+        'season_end': scraper.extract_season_end(soup),
+        'website': scraper.extract_website(soup),
+        'description': scraper.extract_description(soup),
+        'skiable_acres': scraper.extract_skiable_acres(soup),
+        'resort_url': url
+    }
+
+
+def extract_context(scraper: ImprovedUSASkiResortScraper, soup: BeautifulSoup, url: str) -> Dict:
+    """Extract every field through a single shared PageContext"""
+    resort = scraper.extract_resort(soup, url)
+    return resort.to_dict() if resort else {}
+
+
+def run(pages: List[Tuple[str, bytes]], rounds: int):
+    scraper = ImprovedUSASkiResortScraper(delay_between_requests=0)
+
+    # Tree construction is identical for both modes, so time it once
+    start = time.perf_counter()
+    for _ in range(rounds):
+        soups = [(url, BeautifulSoup(content, 'html.parser')) for url, content in pages]
+    build_ms = (time.perf_counter() - start) * 1000 / (rounds * len(pages))
+
+    results = {}
+    for label, extract in [('legacy', extract_legacy), ('context', extract_context)]:
+        with count_tree_walks() as counter:
+            for url, soup in soups:
+                extract(scraper, soup, url)
+        walks_per_page = counter['walks'] / len(pages)
+
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for url, soup in soups:
+                extract(scraper, soup, url)
+        extract_ms = (time.perf_counter() - start) * 1000 / (rounds * len(pages))
+
+        results[label] = (walks_per_page, extract_ms)
+
+    # Both paths must agree field for field
+    for url, soup in soups:
+        if extract_legacy(scraper, soup, url) != extract_context(scraper, soup, url):
+            print(f"⚠️ Field output differs for {url}")
+
+    print(f"📊 {len(pages)} fixture pages x {rounds} rounds (tree build: {build_ms:.3f} ms/page)")
+    print(f"  {'mode':<10}{'walks/page':>12}{'extract ms':>12}{'parse ms':>12}")
+    for label, (walks, extract_ms) in results.items():
+        print(f"  {label:<10}{walks:>12.1f}{extract_ms:>12.3f}{build_ms + extract_ms:>12.3f}")
+    speedup = results['legacy'][1] / results['context'][1]
+    print(f"  🚀 Extraction speedup: {speedup:.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('fixture_dir', nargs='?', default=FIXTURE_DIR)
+    parser.add_argument('--rounds', type=int, default=50)
+    args = parser.parse_args()
+
+    pages = load_fixtures(args.fixture_dir)
+    if not pages:
+        print(f"❌ No .html fixtures found in {args.fixture_dir}")
+        return
+    run(pages, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark: listing-page discovery with full trees vs anchor-only parsing
+
+Over the saved listing pages in fixtures/listing/, compares:
+
+  * full     - BeautifulSoup(html.parser) tree, then extract_resort_urls_from_page
+               and has_next_page (two anchor walks over the full tree)
+  * anchors  - scan_listing_page per backend: only anchors are built
+               (SoupStrainer / lxml pull parser) and URL filtering and
+               next-page detection share one pass
+
+Reports time per page and peak Python-heap allocation per page
+(tracemalloc; memory held by C parsers such as libxml2 is not counted).
+
+Usage:
+    python3 bench_listing.py [listing_dir] [--rounds N]
+"""
+
+import argparse
+import glob
+import os
+import time
+import tracemalloc
+from typing import Callable, List, Set, Tuple
+
+from bs4 import BeautifulSoup
+
+from bench_extraction import FIXTURE_DIR
+from html_backends import available_backends
+from improved_usa_scraper import ImprovedUSASkiResortScraper
+
+LISTING_DIR = os.path.join(FIXTURE_DIR, 'listing')
+
+
+def load_listing_pages(listing_dir: str) -> List[bytes]:
+    pages = []
+    for path in sorted(glob.glob(os.path.join(listing_dir, '*.html'))):
+        with open(path, 'rb') as f:
+            pages.append(f.read())
+    return pages
+
+
+def measure(scan: Callable[[bytes], Tuple[Set[str], bool]], pages: List[bytes], rounds: int) -> Tuple[float, float]:
+    """Return (ms per page, peak KiB per page)"""
+    peaks = []
+    for content in pages:
+        tracemalloc.start()
+        scan(content)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for content in pages:
+            scan(content)
+    elapsed = time.perf_counter() - start
+    return elapsed * 1000 / (rounds * len(pages)), sum(peaks) / len(peaks) / 1024
+
+
+def run(pages: List[bytes], rounds: int):
+    scraper = ImprovedUSASkiResortScraper(delay_between_requests=0)
+
+    def full(content: bytes) -> Tuple[Set[str], bool]:
+        soup = BeautifulSoup(content, 'html.parser')
+        return scraper.extract_resort_urls_from_page(soup), scraper.has_next_page(soup, 1)
+
+    modes = [('full (html.parser)', full)]
+    for backend in available_backends():
+        backend_scraper = ImprovedUSASkiResortScraper(delay_between_requests=0, parser_backend=backend)
+        modes.append((f'anchors ({backend})', lambda content, s=backend_scraper: s.scan_listing_page(content, 1)))
+
+    reference = [full(content) for content in pages]
+    for label, scan in modes[1:]:
+        if [scan(content) for content in pages] != reference:
+            print(f"⚠️ {label} disagrees with the full-tree result")
+
+    print(f"📊 {len(pages)} listing pages x {rounds} rounds, "
+          f"{sum(len(urls) for urls, _ in reference)} resort URLs")
+    print(f"  {'mode':<24}{'ms/page':>10}{'peak KiB':>10}")
+    for label, scan in modes:
+        ms, peak = measure(scan, pages, rounds)
+        print(f"  {label:<24}{ms:>10.3f}{peak:>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('listing_dir', nargs='?', default=LISTING_DIR)
+    parser.add_argument('--rounds', type=int, default=20)
+    args = parser.parse_args()
+
+    pages = load_listing_pages(args.listing_dir)
+    if not pages:
+        print(f"❌ No .html listing pages found in {args.listing_dir}")
+        return
+    run(pages, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark: in-process parsing vs the ParsePool worker processes
+
+Re-parses a corpus of N pages (the saved fixtures, repeated) with:
+
+  * inline    - parse_resort_page in the calling process, one core
+  * pool xP   - ParsePool.map with P worker processes
+
+and reports pages/second and speedup over inline, checking that every
+mode produces the same records. Worker start-up is excluded (a pool is
+warmed up before timing), matching a long re-parse of a cached corpus.
+
+Usage:
+    python3 bench_parse_pool.py [fixture_dir] [--pages N] [--processes 1 2 4]
+"""
+
+import argparse
+import os
+import time
+from typing import List, Tuple
+
+from bench_extraction import FIXTURE_DIR, load_fixtures
+from improved_usa_scraper import ImprovedUSASkiResortScraper
+from parse_pool import ParsePool
+
+
+def run(corpus: List[Tuple[str, bytes]], process_counts: List[int]):
+    scraper = ImprovedUSASkiResortScraper(delay_between_requests=0)
+
+    start = time.perf_counter()
+    reference = list(scraper.parse_resort_pages(corpus))
+    inline_rate = len(corpus) / (time.perf_counter() - start)
+
+    print(f"📊 {len(corpus)} pages, {os.cpu_count()} CPU cores")
+    print(f"  {'mode':<12}{'pages/s':>10}{'speedup':>10}")
+    print(f"  {'inline':<12}{inline_rate:>10.0f}{1:>9.2f}x")
+
+    mismatches = 0
+    for processes in process_counts:
+        with ParsePool(processes=processes) as pool:
+            # Spawn and initialise every worker before timing
+            list(pool.map(corpus[:processes * 2], chunksize=1))
+            start = time.perf_counter()
+            results = list(pool.map(corpus))
+            rate = len(corpus) / (time.perf_counter() - start)
+        mismatches += sum(result != expected for result, expected in zip(results, reference))
+        print(f"  {f'pool x{processes}':<12}{rate:>10.0f}{rate / inline_rate:>9.2f}x")
+
+    print("✅ All modes produce identical records" if not mismatches
+          else f"❌ {mismatches} records differ from inline parsing")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('fixture_dir', nargs='?', default=FIXTURE_DIR)
+    parser.add_argument('--pages', type=int, default=300, help='corpus size (fixtures are repeated)')
+    parser.add_argument('--processes', type=int, nargs='+', default=None,
+                        help='worker counts to try (default: 1, 2, 4 ... up to the core count)')
+    args = parser.parse_args()
+
+    fixtures = load_fixtures(args.fixture_dir)
+    if not fixtures:
+        print(f"❌ No .html fixtures found in {args.fixture_dir}")
+        return
+    corpus = [fixtures[i % len(fixtures)] for i in range(args.pages)]
+
+    process_counts = args.processes
+    if not process_counts:
+        cores = os.cpu_count() or 1
+        process_counts = sorted({1, cores} | {2 ** k for k in range(1, cores.bit_length()) if 2 ** k <= cores})
+    run(corpus, process_counts)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark: HTML parser backends over the saved fixtures
+
+For every installed backend in html_backends.py, reports:
+
+  * parse throughput - pages/second for parse + full field extraction
+  * memory           - resident memory held per parsed page, measured in
+                       a fresh interpreter so backends don't share heaps
+
+and checks that every backend produces identical field output to the
+html.parser reference.
+
+Usage:
+    python3 bench_parsers.py [fixture_dir] [--rounds N] [--hold N]
+"""
+
+import argparse
+import multiprocessing
+import os
+import time
+import tracemalloc
+from typing import Dict, List, Tuple
+
+from bench_extraction import FIXTURE_DIR, load_fixtures
+from html_backends import available_backends, parse_page
+from improved_usa_scraper import ImprovedUSASkiResortScraper
+
+
+def _rss_bytes() -> int:
+    """Current resident set size (Linux), or 0 if unavailable"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def _held_memory_per_page(args: Tuple[str, List[Tuple[str, bytes]], int]) -> Tuple[float, str]:
+    """Parse `hold` pages, keep them alive, and return (bytes per page, method)"""
+    backend, pages, hold = args
+    use_rss = _rss_bytes() > 0
+    if not use_rss:
+        tracemalloc.start()
+    before = _rss_bytes() if use_rss else tracemalloc.get_traced_memory()[0]
+
+    held = []
+    for i in range(hold):
+        _, content = pages[i % len(pages)]
+        page = parse_page(content, backend)
+        # Materialise everything the extractors read
+        page.text, page.links, page.heading, page.meta_description
+        held.append(page)
+
+    after = _rss_bytes() if use_rss else tracemalloc.get_traced_memory()[0]
+    return (after - before) / hold, 'rss' if use_rss else 'tracemalloc'
+
+
+def extract_fields(scraper: ImprovedUSASkiResortScraper, content: bytes, url: str, backend: str) -> Dict:
+    resort = scraper.extract_resort(parse_page(content, backend), url)
+    return resort.to_dict() if resort else {}
+
+
+def run(pages: List[Tuple[str, bytes]], rounds: int, hold: int):
+    scraper = ImprovedUSASkiResortScraper(delay_between_requests=0)
+    backends = available_backends()
+
+    # Identical field output across backends
+    mismatches = 0
+    for url, content in pages:
+        reference = extract_fields(scraper, content, url, 'html.parser')
+        for backend in backends[1:]:
+            fields = extract_fields(scraper, content, url, backend)
+            for field, value in fields.items():
+                if value != reference.get(field):
+                    mismatches += 1
+                    print(f"⚠️ {backend} {url} {field}: {value!r} != {reference.get(field)!r}")
+
+    results = {}
+    ctx = multiprocessing.get_context('spawn')
+    for backend in backends:
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for url, content in pages:
+                extract_fields(scraper, content, url, backend)
+        elapsed = time.perf_counter() - start
+        with ctx.Pool(1) as pool:
+            per_page, method = pool.map(_held_memory_per_page, [(backend, pages, hold)])[0]
+        results[backend] = (rounds * len(pages) / elapsed, per_page, method)
+
+    print(f"📊 {len(pages)} fixture pages x {rounds} rounds, memory held over {hold} pages")
+    print(f"  {'backend':<14}{'pages/s':>10}{'vs html.parser':>16}{'KiB/page':>10}")
+    baseline = results['html.parser'][0]
+    for backend, (throughput, per_page, method) in results.items():
+        print(f"  {backend:<14}{throughput:>10.0f}{throughput / baseline:>15.2f}x{per_page / 1024:>10.1f}")
+    print(f"  (memory measured with {results['html.parser'][2]})")
+    print("✅ All backends produce identical fields" if not mismatches
+          else f"❌ {mismatches} field mismatches between backends")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('fixture_dir', nargs='?', default=FIXTURE_DIR)
+    parser.add_argument('--rounds', type=int, default=50)
+    parser.add_argument('--hold', type=int, default=500,
+                        help='pages kept alive when measuring memory per page')
+    args = parser.parse_args()
+
+    pages = load_fixtures(args.fixture_dir)
+    if not pages:
+        print(f"❌ No .html fixtures found in {args.fixture_dir}")
+        return
+    run(pages, args.rounds, args.hold)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark: regex field matching modes of the field pattern registry
+
+Over the flattened text of each saved HTML fixture, compares:
+
+  * legacy     - pattern strings passed to re.search on every call (what
+                 the extractors did before the registry, via re's cache)
+  * sequential - match_fields over the precompiled registry
+  * combined   - scan_fields, one alternation scan for every field
+
+All three modes must produce the same values.
+
+Usage:
+    python3 bench_patterns.py [fixture_dir] [--rounds N] [--repeat-text N]
+"""
+
+import argparse
+import re
+import time
+from typing import Any, Dict, List
+
+from bs4 import BeautifulSoup
+
+from bench_extraction import FIXTURE_DIR, load_fixtures
+from field_patterns import FIELD_SPECS, match_fields, scan_fields
+
+
+def legacy_match_fields(text: str) -> Dict[str, Any]:
+    """Per-call pattern lookup, as the extractors used to do it"""
+    values = {}
+    for spec in FIELD_SPECS:
+        values[spec.field] = None
+        for pattern in spec.patterns:
+            match = re.search(pattern.pattern, text, pattern.flags)
+            if match:
+                value = spec.value_from(match)
+                if value is not None:
+                    values[spec.field] = value
+                    break
+    return values
+
+
+def run(texts: List[str], rounds: int):
+    modes = [('legacy', legacy_match_fields), ('sequential', match_fields), ('combined', scan_fields)]
+
+    for text in texts:
+        outputs = [fn(text) for _, fn in modes]
+        if any(output != outputs[0] for output in outputs[1:]):
+            print("⚠️ Matching modes disagree on a fixture")
+
+    print(f"📊 {len(texts)} pages x {rounds} rounds, {len(FIELD_SPECS)} fields, "
+          f"{sum(len(spec.patterns) for spec in FIELD_SPECS)} patterns")
+    print(f"  {'mode':<12}{'us/page':>12}")
+    for label, fn in modes:
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for text in texts:
+                fn(text)
+        elapsed = time.perf_counter() - start
+        print(f"  {label:<12}{elapsed * 1e6 / (rounds * len(texts)):>12.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('fixture_dir', nargs='?', default=FIXTURE_DIR)
+    parser.add_argument('--rounds', type=int, default=200)
+    parser.add_argument('--repeat-text', type=int, default=1,
+                        help='concatenate each page text N times to simulate larger pages')
+    args = parser.parse_args()
+
+    pages = load_fixtures(args.fixture_dir)
+    if not pages:
+        print(f"❌ No .html fixtures found in {args.fixture_dir}")
+        return
+    texts = [BeautifulSoup(content, 'html.parser').get_text() * args.repeat_text for _, content in pages]
+    run(texts, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
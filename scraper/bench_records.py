@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark: memory and serialization cost of DetailedUSASkiResort records
+
+Builds N synthetic resorts in two representations:
+
+  * dict-backed - the previous plain @dataclass (per-instance __dict__)
+  * slotted     - the current @dataclass(slots=True) DetailedUSASkiResort
+
+and reports the memory held by the records themselves (field values are
+shared between both, so only the per-record overhead is compared), plus
+time and peak allocation for turning every record into a dict for JSON:
+dataclasses.asdict vs DetailedUSASkiResort.to_dict.
+
+Usage:
+    python3 bench_records.py [--records N]
+"""
+
+import argparse
+import time
+import tracemalloc
+from dataclasses import asdict, fields, make_dataclass
+from typing import Callable, Dict, List, Tuple
+
+from improved_usa_scraper import US_STATES, DetailedUSASkiResort
+
+# The record type as it was before slots: same fields, same defaults
+DictBackedResort = make_dataclass(
+    'DictBackedResort',
+    [(f.name, f.type, f.default) if f.name != 'name' else (f.name, f.type) for f in fields(DetailedUSASkiResort)],
+)
+
+
+def synthetic_values(count: int) -> List[Dict]:
+    """Field values for count plausible, distinct resorts"""
+    values = []
+    for i in range(count):
+        base = 500 + (i * 37) % 2500
+        values.append({
+            'name': f'Synthetic Resort {i}',
+            'state': US_STATES[i % len(US_STATES)],
+            'city': f'Town {i % 900}',
+            'rating': round(1 + (i % 40) / 10, 1),
+            'elevation_base': base,
+            'elevation_top': base + 200 + (i * 13) % 1500,
+            'vertical_drop': 200 + (i * 13) % 1500,
+            'slopes_total_km': float(5 + i % 300),
+            'slopes_easy_km': float(i % 100),
+            'slopes_intermediate_km': float(i % 120),
+            'slopes_difficult_km': float(i % 80),
+            'lifts_total': 1 + i % 40,
+            'day_pass_price': f'US$ {50 + i % 200}',
+            'season_start': 'Nov',
+            'season_end': 'Apr',
+            'website': f'https://resort-{i}.example.com',
+            'description': f'Synthetic resort number {i} used for record benchmarks.',
+            'skiable_acres': 100 + i % 5000,
+            'resort_url': f'https://www.skiresort.info/ski-resort/synthetic-{i}/',
+        })
+    return values
+
+
+def measure(action: Callable[[], object]) -> Tuple[object, int, int, float]:
+    """(result, bytes still held, peak bytes, seconds) for one call of action
+
+    Timed on a separate untraced call, since tracemalloc slows allocation-heavy
+    code unevenly.
+    """
+    start = time.perf_counter()
+    action()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    result = action()
+    held, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, held, peak, elapsed
+
+
+def run(count: int):
+    values = synthetic_values(count)
+
+    print(f"📊 {count:,} synthetic resorts")
+    print(f"  {'representation':<16}{'bytes/record':>14}{'total MiB':>12}")
+    records = {}
+    for label, cls in [('dict-backed', DictBackedResort), ('slotted', DetailedUSASkiResort)]:
+        records[label], held, _, _ = measure(lambda: [cls(**v) for v in values])
+        print(f"  {label:<16}{held / count:>14.0f}{held / 2**20:>12.2f}")
+
+    print(f"\n  {'serialization':<16}{'ms':>10}{'peak MiB':>12}")
+    outputs = {}
+    for label, to_dict, source in [
+        ('asdict', asdict, records['dict-backed']),
+        ('to_dict', DetailedUSASkiResort.to_dict, records['slotted']),
+    ]:
+        outputs[label], _, peak, elapsed = measure(lambda: [to_dict(r) for r in source])
+        print(f"  {label:<16}{elapsed * 1000:>10.1f}{peak / 2**20:>12.2f}")
+
+    print("✅ to_dict output matches asdict" if outputs['asdict'] == outputs['to_dict']
+          else "❌ to_dict output differs from asdict")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--records', type=int, default=10000)
+    args = parser.parse_args()
+    run(args.records)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Load test: resort_service.py on localhost
+
+Starts the service on a free port (or targets --url) and hammers it from
+--connections client processes, each with one keep-alive connection,
+for --duration seconds. Requests are drawn from a mix of /resorts
+filters, /search terms, /states and /states/<state>, and latencies are
+measured per request. The report shows requests/second, latency
+percentiles, status codes, bytes received and the service's cache hit
+rate.
+
+By default the service gets a synthetic dataset of --records resorts
+(bench_records.synthetic_values). --gzip sends Accept-Encoding: gzip, and
+--revalidate sends If-None-Match with the ETag from the first response to
+each URL, so those requests answer 304.
+
+Usage:
+    python3 bench_service.py [--records N] [--connections N] [--duration S] [--gzip] [--revalidate]
+    python3 bench_service.py --url http://127.0.0.1:8787 [--connections N] ...
+"""
+
+import argparse
+import http.client
+import json
+import multiprocessing
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Tuple
+from urllib.parse import quote, urlsplit
+
+from bench_records import US_STATES, synthetic_values
+
+
+def request_mix(count: int = 200, seed: int = 7) -> List[str]:
+    """Paths in the proportions a search page would send them"""
+    rng = random.Random(seed)
+    paths = ['/states']
+    for _ in range(count):
+        state = rng.choice(US_STATES)
+        kind = rng.random()
+        if kind < 0.4:
+            paths.append(f"/resorts?state={quote(state)}&vertical__gt={rng.randrange(200, 1700, 100)}"
+                         f"&price__lt={rng.randrange(60, 250, 10)}")
+        elif kind < 0.6:
+            paths.append(f"/resorts?elevation__gte={rng.randrange(1000, 4000, 250)}&rating__gte=4&limit=20")
+        elif kind < 0.85:
+            paths.append(f"/search?q=resort+{rng.randrange(1000)}")
+        else:
+            paths.append(f"/states/{quote(state)}")
+    return paths
+
+
+def run_client(args: Tuple[str, int, List[str], float, bool, bool, int]) -> Dict:
+    """One keep-alive connection sending requests until the deadline"""
+    host, port, paths, duration, use_gzip, revalidate, seed = args
+    rng = random.Random(seed)
+    connection = http.client.HTTPConnection(host, port, timeout=30)
+    etags: Dict[str, str] = {}
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+    received = 0
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        path = rng.choice(paths)
+        headers = {'Accept-Encoding': 'gzip'} if use_gzip else {}
+        if revalidate and path in etags:
+            headers['If-None-Match'] = etags[path]
+        start = time.perf_counter()
+        try:
+            connection.request('GET', path, headers=headers)
+            response = connection.getresponse()
+            body = response.read()
+        except (OSError, http.client.HTTPException):
+            statuses[0] = statuses.get(0, 0) + 1
+            connection.close()
+            connection = http.client.HTTPConnection(host, port, timeout=30)
+            continue
+        latencies.append(time.perf_counter() - start)
+        statuses[response.status] = statuses.get(response.status, 0) + 1
+        received += len(body)
+        if revalidate and response.getheader('ETag'):
+            etags[path] = response.getheader('ETag')
+    connection.close()
+    return {'latencies': latencies, 'statuses': statuses, 'bytes': received}
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_until_up(host: str, port: int, timeout: float = 60.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=1):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"service did not start on {host}:{port}")
+
+
+def fetch_stats(host: str, port: int) -> Dict:
+    connection = http.client.HTTPConnection(host, port, timeout=10)
+    connection.request('GET', '/stats')
+    stats = json.loads(connection.getresponse().read())
+    connection.close()
+    return stats
+
+
+def load_test(host: str, port: int, connections: int, duration: float, use_gzip: bool, revalidate: bool):
+    paths = request_mix()
+    before = fetch_stats(host, port)
+    jobs = [(host, port, paths, duration, use_gzip, revalidate, seed) for seed in range(connections)]
+    with multiprocessing.Pool(connections) as pool:
+        results = pool.map(run_client, jobs)
+    after = fetch_stats(host, port)
+
+    latencies = sorted(latency for result in results for latency in result['latencies'])
+    statuses: Dict[int, int] = {}
+    for result in results:
+        for status, count in result['statuses'].items():
+            statuses[status] = statuses.get(status, 0) + count
+    received = sum(result['bytes'] for result in results)
+    hits = after['cache']['hits'] - before['cache']['hits']
+    lookups = hits + after['cache']['misses'] - before['cache']['misses']
+
+    mode = ', '.join(flag for flag, on in (('gzip', use_gzip), ('If-None-Match', revalidate)) if on) or 'plain'
+    print(f"🚀 {connections} connections for {duration:.0f}s against {after['resorts']:,} resorts ({mode})")
+    print(f"  {len(latencies):,} requests, {len(latencies) / duration:,.0f} requests/s, "
+          f"{received / duration / 1024:,.0f} KB/s received")
+    print(f"  latency ms: p50 {percentile(latencies, 0.5) * 1000:.2f}, p90 {percentile(latencies, 0.9) * 1000:.2f}, "
+          f"p99 {percentile(latencies, 0.99) * 1000:.2f}, max {(latencies[-1] if latencies else 0) * 1000:.1f}")
+    print(f"  statuses: {', '.join(f'{status}: {count:,}' for status, count in sorted(statuses.items()))}")
+    if lookups:
+        print(f"  cache: {hits / lookups:.1%} hits over {lookups:,} lookups, {after['cache']['entries']} entries")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', help='running service to test (default: start one on a free port)')
+    parser.add_argument('--records', type=int, default=100000, help='synthetic resorts for the started service')
+    parser.add_argument('--connections', type=int, default=4)
+    parser.add_argument('--duration', type=float, default=10.0)
+    parser.add_argument('--gzip', action='store_true', help='send Accept-Encoding: gzip')
+    parser.add_argument('--revalidate', action='store_true', help='send If-None-Match with the last ETag of each URL')
+    args = parser.parse_args()
+
+    if args.url:
+        url = urlsplit(args.url)
+        load_test(url.hostname, url.port or 80, args.connections, args.duration, args.gzip, args.revalidate)
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        dataset = os.path.join(directory, 'synthetic.jsonl')
+        with open(dataset, 'w', encoding='utf-8') as f:
+            for values in synthetic_values(args.records):
+                f.write(json.dumps(values) + '\n')
+        port = free_port()
+        service = subprocess.Popen(
+            [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resort_service.py'),
+             dataset, '--port', str(port)],
+            stdout=subprocess.DEVNULL)
+        try:
+            wait_until_up('127.0.0.1', port)
+            load_test('127.0.0.1', port, args.connections, args.duration, args.gzip, args.revalidate)
+        finally:
+            service.terminate()
+            service.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-row summary loop vs vectorized resort_stats
+
+Over N synthetic resorts, times:
+
+  * loop      - the old show_summary_stats approach: a Python loop over
+                resort objects with a regex per day pass price
+  * columns   - building ResortColumns from the resort objects (one pass)
+  * summarize - resort_stats.summarize on those columns: counts, means,
+                percentiles and histograms for every metric, plus per-state
+                counts and means
+  * from disk - load_columns (memory-mapped) + summarize, the analytics
+                path once a dataset has been exported
+
+and checks that the loop and the report agree on the shared numbers.
+
+Usage:
+    python3 bench_stats.py [--records N]
+"""
+
+import argparse
+import re
+import tempfile
+import time
+from typing import Dict, List
+
+from bench_records import synthetic_values
+from columnar import ResortColumns, load_columns, numpy_available
+from improved_usa_scraper import DetailedUSASkiResort
+from resort_stats import summarize
+
+_LOOP_PRICE = re.compile(r'US\$\s*(\d+(?:\.\d+)?)')
+
+
+def summary_loop(resorts: List[DetailedUSASkiResort]) -> Dict:
+    """State counts, average rating and average price, one resort at a time"""
+    states, ratings, prices = {}, [], []
+    for resort in resorts:
+        if resort.state:
+            states[resort.state] = states.get(resort.state, 0) + 1
+        if resort.rating:
+            ratings.append(resort.rating)
+        if resort.day_pass_price and 'US$' in resort.day_pass_price:
+            price_match = _LOOP_PRICE.search(resort.day_pass_price)
+            if price_match:
+                prices.append(float(price_match.group(1)))
+    return {
+        'states': states,
+        'rating': sum(ratings) / len(ratings) if ratings else None,
+        'price': sum(prices) / len(prices) if prices else None,
+    }
+
+
+def run(count: int):
+    resorts = [DetailedUSASkiResort(**values) for values in synthetic_values(count)]
+
+    start = time.perf_counter()
+    loop = summary_loop(resorts)
+    loop_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    columns = ResortColumns.from_records(resorts)
+    columns_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    report = summarize(columns)
+    summarize_ms = (time.perf_counter() - start) * 1000
+
+    with tempfile.TemporaryDirectory() as directory:
+        columns.save(directory)
+        start = time.perf_counter()
+        summarize(load_columns(directory))
+        disk_ms = (time.perf_counter() - start) * 1000
+
+    print(f"📊 {count:,} synthetic resorts")
+    print(f"  {'stage':<12}{'ms':>10}   computes")
+    print(f"  {'loop':<12}{loop_ms:>10.1f}   state counts, 2 means")
+    print(f"  {'columns':<12}{columns_ms:>10.1f}   one-off conversion from resort objects")
+    print(f"  {'summarize':<12}{summarize_ms:>10.1f}   {len(report['metrics'])} metrics: mean/min/max/"
+          f"percentiles/histogram, per-state counts and means")
+    print(f"  {'from disk':<12}{disk_ms:>10.1f}   load_columns (mmap) + summarize")
+
+    agree = (
+        {state: group['count'] for state, group in report['groups'].items()} == loop['states']
+        and abs(report['metrics']['rating']['mean'] - loop['rating']) < 1e-3
+        and abs(report['metrics']['day_pass_usd']['mean'] - loop['price']) < 1e-3
+    )
+    print("✅ Vectorized report matches the loop" if agree else "❌ Vectorized report differs from the loop")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--records', type=int, default=100000)
+    args = parser.parse_args()
+    if not numpy_available():
+        parser.error('bench_stats.py requires numpy')
+    run(args.records)
+
+
+if __name__ == "__main__":
+    main()
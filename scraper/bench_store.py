@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark: ResortStore index lookups vs a linear scan
+
+Over N synthetic resorts (bench_records.synthetic_values), times building
+the store and then a set of compound queries, each answered two ways:
+
+  * scan  - a list comprehension over the records, the way ad-hoc jobs
+            filter the dataset (with prices already parsed, so the scan
+            is not charged for regexes)
+  * store - ResortStore.query_rows (hash and sorted index lookups,
+            intersected smallest first)
+
+and checks that both return the same resorts.
+
+Usage:
+    python3 bench_store.py [--records N] [--rounds N]
+"""
+
+import argparse
+import time
+from typing import Callable, Dict, List
+
+from bench_records import synthetic_values
+from columnar import parse_price
+from resort_store import ResortStore
+
+# (description, store conditions, equivalent scan predicate)
+QUERIES = [
+    ("state=Utah, vertical > 1500, price < 80",
+     {'state': 'Utah', 'vertical__gt': 1500, 'price__lt': 80},
+     lambda r: r['state'] == 'Utah' and r['vertical_drop'] > 1500 and r['price'] < 80),
+    ("state=Vermont, lifts <= 5",
+     {'state': 'Vermont', 'lifts__lte': 5},
+     lambda r: r['state'] == 'Vermont' and r['lifts_total'] <= 5),
+    ("elevation >= 4000, rating >= 4.5",
+     {'elevation__gte': 4000, 'rating__gte': 4.5},
+     lambda r: r['elevation_top'] >= 4000 and r['rating'] >= 4.5),
+    ("acres > 4990, price <= 60, lifts >= 30",
+     {'acres__gt': 4990, 'price__lte': 60, 'lifts__gte': 30},
+     lambda r: r['skiable_acres'] > 4990 and r['price'] <= 60 and r['lifts_total'] >= 30),
+    ("rating = 4.9",
+     {'rating': 4.9},
+     lambda r: r['rating'] == 4.9),
+    ("vertical > 200 (nearly everything)",
+     {'vertical__gt': 200},
+     lambda r: r['vertical_drop'] > 200),
+]
+
+
+def best_ms(action: Callable[[], object], rounds: int) -> float:
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        action()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def run(count: int, rounds: int):
+    records: List[Dict] = synthetic_values(count)
+
+    start = time.perf_counter()
+    store = ResortStore(records)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    scanned = [dict(record, price=parse_price(record['day_pass_price'])) for record in records]
+
+    print(f"📊 {count:,} synthetic resorts, store built in {build_ms:.0f} ms (best of {rounds} per query)")
+    print(f"  {'query':<42}{'rows':>8}{'scan ms':>10}{'store ms':>10}{'speedup':>9}")
+    agree = True
+    for description, conditions, predicate in QUERIES:
+        expected = [row for row, record in enumerate(scanned) if predicate(record)]
+        found = store.query_rows(**conditions)
+        agree = agree and found == expected
+        scan_ms = best_ms(lambda: [row for row, record in enumerate(scanned) if predicate(record)], rounds)
+        store_ms = best_ms(lambda: store.query_rows(**conditions), rounds)
+        print(f"  {description:<42}{len(found):>8,}{scan_ms:>10.2f}{store_ms:>10.3f}{scan_ms / store_ms:>8.0f}x")
+    print("✅ Index lookups match the scan" if agree else "❌ Index lookups differ from the scan")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--records', type=int, default=100000)
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+    run(args.records, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Columnar export of the resort dataset for analytics
+
+Writes the numeric DetailedUSASkiResort fields as typed NumPy columns,
+one .npy file per column plus a boolean validity mask, and a
+manifest.json describing them:
+
+    detailed_usa_ski_resorts.columns/
+        manifest.json
+        rating.npy          rating.valid.npy
+        elevation_base.npy  elevation_base.valid.npy
+        ...
+        state.npy           (int16 codes into manifest["categories"]["state"])
+
+day_pass_price is parsed once into a numeric day_pass_usd column. Nulls
+are NaN (floats) or 0 (ints) in the values and False in the mask.
+
+load_columns memory-maps the .npy files, so opening a dataset costs no
+parsing and only the pages an aggregation touches are read. If pyarrow
+is installed, export_parquet writes the same columns (with native nulls)
+as one Parquet file.
+
+numpy is an optional dependency, needed only for this module.
+
+Usage:
+    python3 columnar.py [dataset.json|dataset.jsonl] [--out DIR] [--parquet FILE]
+"""
+
+import argparse
+import json
+import os
+import re
+from operator import attrgetter, itemgetter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from resort_stream import iter_resort_records
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+# Numeric columns and their storage dtype
+NUMERIC_COLUMNS = {
+    'rating': 'float64',
+    'elevation_base': 'int32',
+    'elevation_top': 'int32',
+    'vertical_drop': 'int32',
+    'slopes_total_km': 'float64',
+    'slopes_easy_km': 'float64',
+    'slopes_intermediate_km': 'float64',
+    'slopes_difficult_km': 'float64',
+    'lifts_total': 'int32',
+    'skiable_acres': 'int32',
+    'day_pass_usd': 'float64',
+}
+
+# Low-cardinality string columns, stored as int16 codes into a category list
+CATEGORY_COLUMNS = ('state',)
+
+MANIFEST = 'manifest.json'
+
+_US_DOLLARS = re.compile(r'US\$\s*(\d[\d.,]*)')
+_AMOUNT = re.compile(r'\d[\d.,]*')
+# A comma is the decimal separator only before 1-2 final digits ("45,50");
+# otherwise it separates thousands ("1,200")
+_DECIMAL_COMMA = re.compile(r',\d{1,2}$')
+
+
+def numpy_available() -> bool:
+    return np is not None
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("columnar export needs numpy (pip install numpy)")
+
+
+def parse_amount(text: Optional[str]) -> Optional[float]:
+    """First number in text, with either separator convention; None if there is none
+
+    '€45,50' -> 45.5, '1,200' -> 1200.0, '1.200,50' -> 1200.5, '79.50' -> 79.5
+    """
+    match = _AMOUNT.search(text) if text else None
+    if not match:
+        return None
+    amount = match.group().rstrip('.,')
+    if _DECIMAL_COMMA.search(amount):
+        amount = amount.replace('.', '').replace(',', '.')
+    else:
+        amount = amount.replace(',', '')
+    try:
+        return float(amount)
+    except ValueError:
+        return None
+
+
+def parse_price(price: Optional[str]) -> Optional[float]:
+    """'US$79' / 'US$79,50' / 'US$1,200' -> 79.0 / 79.5 / 1200.0; None for anything else"""
+    match = _US_DOLLARS.search(price) if price else None
+    return parse_amount(match.group(1)) if match else None
+
+
+def default_columns_dir(dataset_path: str) -> str:
+    """detailed_usa_ski_resorts.json -> detailed_usa_ski_resorts.columns"""
+    return f'{os.path.splitext(dataset_path)[0]}.columns'
+
+
+class ResortColumns:
+    """Typed columns plus validity masks for a resort dataset"""
+
+    def __init__(self, values: Dict[str, 'np.ndarray'], valid: Dict[str, 'np.ndarray'],
+                 categories: Dict[str, List[str]]):
+        self.values = values
+        self.valid = valid
+        self.categories = categories
+        self.rows = len(next(iter(values.values()))) if values else 0
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def masked(self, column: str) -> 'np.ma.MaskedArray':
+        """Column as a masked array (nulls masked out), without copying"""
+        return np.ma.MaskedArray(self.values[column], mask=~self.valid[column])
+
+    def present(self, column: str) -> 'np.ndarray':
+        """Only the non-null values of a column"""
+        return self.values[column][self.valid[column]]
+
+    def decode(self, column: str) -> List[Optional[str]]:
+        """Category column back to strings (None for nulls)"""
+        names = self.categories[column]
+        return [names[code] if code >= 0 else None for code in self.values[column].tolist()]
+
+    @classmethod
+    def from_records(cls, resorts: Iterable, category_columns: Tuple[str, ...] = CATEGORY_COLUMNS) -> 'ResortColumns':
+        """Build columns from resort dataclasses or dicts
+
+        Rows are gathered as plain tuples in one pass; each column is then
+        converted as a whole (None -> NaN via a float array, which also
+        yields the mask), with prices parsed once per distinct string.
+        """
+        _require_numpy()
+        sources = [column for column in NUMERIC_COLUMNS if column != 'day_pass_usd']
+        fields = sources + ['day_pass_price'] + list(category_columns)
+        get_items, get_attrs = itemgetter(*fields), attrgetter(*fields)
+        rows = []
+        for resort in resorts:
+            is_dict = isinstance(resort, dict)
+            try:
+                rows.append(get_items(resort) if is_dict else get_attrs(resort))
+            except (KeyError, AttributeError):
+                # Record type without some of the fields (e.g. no day_pass_price)
+                rows.append(tuple(resort.get(field) if is_dict else getattr(resort, field, None)
+                                  for field in fields))
+        raw = dict(zip(fields, zip(*rows))) if rows else {field: () for field in fields}
+
+        prices = {price: parse_price(price) for price in set(raw['day_pass_price'])}
+        raw['day_pass_usd'] = [prices[price] for price in raw['day_pass_price']]
+
+        values, valid = {}, {}
+        for column, dtype in NUMERIC_COLUMNS.items():
+            as_float = np.array(raw[column], dtype='float64')
+            valid[column] = ~np.isnan(as_float)
+            values[column] = as_float if dtype == 'float64' else np.where(valid[column], as_float, 0).astype(dtype)
+
+        categories = {}
+        for column in category_columns:
+            lookup: Dict[str, int] = {}
+            codes = [-1 if value is None else lookup.setdefault(value, len(lookup)) for value in raw[column]]
+            values[column] = np.array(codes, dtype='int16')
+            valid[column] = values[column] >= 0
+            categories[column] = list(lookup)
+        return cls(values, valid, categories)
+
+    def save(self, directory: str):
+        """Write one .npy per column and mask, plus manifest.json"""
+        os.makedirs(directory, exist_ok=True)
+        manifest_path = os.path.join(directory, MANIFEST)
+        if os.path.exists(manifest_path):
+            os.remove(manifest_path)
+        manifest = {'rows': self.rows, 'columns': {}, 'categories': self.categories}
+        for column, array in self.values.items():
+            np.save(os.path.join(directory, f'{column}.npy'), array)
+            np.save(os.path.join(directory, f'{column}.valid.npy'), self.valid[column])
+            manifest['columns'][column] = {
+                'dtype': str(array.dtype),
+                'values': f'{column}.npy',
+                'valid': f'{column}.valid.npy',
+                'kind': 'category' if column in self.categories else 'numeric',
+            }
+        # Manifest last: its presence marks a complete export
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+
+
+def export_columns(dataset_path: str, directory: str = None) -> ResortColumns:
+    """Columnar export of a .json/.jsonl dataset (streamed, one record at a time)"""
+    columns = ResortColumns.from_records(iter_resort_records(dataset_path))
+    columns.save(directory or default_columns_dir(dataset_path))
+    return columns
+
+
+def load_columns(directory: str, mmap: bool = True) -> ResortColumns:
+    """Open an exported dataset; with mmap the arrays are read lazily from disk"""
+    _require_numpy()
+    with open(os.path.join(directory, MANIFEST), 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    mode = 'r' if mmap else None
+    values, valid = {}, {}
+    for column, info in manifest['columns'].items():
+        values[column] = np.load(os.path.join(directory, info['values']), mmap_mode=mode)
+        valid[column] = np.load(os.path.join(directory, info['valid']), mmap_mode=mode)
+    return ResortColumns(values, valid, manifest['categories'])
+
+
+def export_parquet(columns: ResortColumns, path: str):
+    """Write the columns to one Parquet file (requires pyarrow)"""
+    if pyarrow is None:
+        raise ImportError("Parquet export needs pyarrow (pip install pyarrow)")
+    arrays = {}
+    for column, values in columns.values.items():
+        if column in columns.categories:
+            arrays[column] = pyarrow.DictionaryArray.from_arrays(
+                pyarrow.array(values, mask=~columns.valid[column]),
+                pyarrow.array(columns.categories[column], type=pyarrow.string()))
+        else:
+            arrays[column] = pyarrow.array(values, mask=~columns.valid[column])
+    pyarrow.parquet.write_table(pyarrow.table(arrays), path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('dataset', nargs='?', default='detailed_usa_ski_resorts.json')
+    parser.add_argument('--out', default=None,
+                        help='output directory (default: <dataset>.columns)')
+    parser.add_argument('--parquet', default=None,
+                        help='also write a Parquet file here (requires pyarrow)')
+    args = parser.parse_args()
+
+    directory = args.out or default_columns_dir(args.dataset)
+    columns = export_columns(args.dataset, directory)
+    print(f"📦 {columns.rows} resorts x {len(columns.values)} columns written to '{directory}'")
+    if args.parquet:
+        export_parquet(columns, args.parquet)
+        print(f"📦 Parquet written to '{args.parquet}'")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,102 +1,258 @@
 #!/usr/bin/env python3
 """
-Convert detailed USA ski resort data to TypeScript format for React app
+Convert detailed USA ski resort data to the React app's data files
+
+Resorts are read one at a time from the scraper's dataset (.json array or
+.jsonl, see resort_stream.py) and written as per-state JSON shards plus a
+small index.json (--shards, served from public/ by the app), which
+SkiResortAPI fetches on demand:
+
+    index.json      {"total": N, "states": [{"state", "slug", "count", "file", "bytes"}, ...]}
+    <slug>.json     [resort, ...] for one state, compact JSON
+    search.json     search index over all states (see search_index.py)
+
+--output FILE also writes the whole catalogue as a TypeScript module
+(the app no longer imports it; e.g. src/data/usa-ski-resorts.ts for tools
+that still do), element by element so memory stays flat. --compact
+writes it with one resort per line without indentation.
+
+Usage:
+    python3 convert_usa_data.py [--input FILE] [--shards DIR] [--output FILE [--compact]]
 """
 
+import argparse
 import json
+import os
+import re
 from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, TextIO, Tuple
 
-def convert_usa_data_to_typescript():
-    """Convert detailed USA ski resort data to TypeScript format"""
-    
-    # Load the detailed USA data
-    with open('detailed_usa_ski_resorts.json', 'r', encoding='utf-8') as f:
-        usa_resorts = json.load(f)
-    
-    print(f"📊 Converting {len(usa_resorts)} USA ski resorts to TypeScript format...")
-    
-    converted_resorts = []
-    
-    for i, resort in enumerate(usa_resorts, 1):
-        # Convert to match SkiResort interface
-        converted_resort = {
-            "id": f"usa-resort-{i}",
-            "name": resort.get("name", "Unknown Resort"),
-            "location": {
-                "state": resort.get("state") or "Unknown",  # Ensure no null values
-                **({} if not resort.get("city") else {"city": resort.get("city")}),
-                "coordinates": {
-                    "latitude": 0.0,  # Not available in current dataset
-                    "longitude": 0.0
-                }
-            },
-            "elevation": {
-                "base": resort.get("elevation_base", 0) or 0,
-                "summit": resort.get("elevation_summit", 0) or 0,
-                "vertical": resort.get("vertical_drop", 0) or 0
-            },
-            "lifts": {
-                "total": resort.get("lifts_total", 0) or 0,
-                "chairlifts": 0,  # Not specified in current dataset
-                "surfaceLifts": 0,
-                "gondolas": 0
-            },
-            "trails": {
-                "total": resort.get("trails_total", 0) or 0,
-                "beginner": resort.get("trails_beginner", 0) or 0,
-                "intermediate": resort.get("trails_intermediate", 0) or 0,
-                "advanced": resort.get("trails_advanced", 0) or 0,
-                "expert": resort.get("trails_expert", 0) or 0
-            },
-            "skiableAcres": resort.get("skiable_acres", 0) or 0,
-            "snowmaking": {
-                "percentage": resort.get("snowmaking_percentage", 50) or 50,  # Default reasonable value
-                "acres": resort.get("snowmaking_acres", 0) or 0
-            },
-            "seasonDates": {
-                "opening": resort.get("season_start") or "December",
-                "closing": resort.get("season_end") or "April"
-            },
-            "website": resort.get("website", ""),
-            "description": resort.get("description", f"Ski resort in {resort.get('state', 'USA')}"),
-            "amenities": resort.get("amenities", []),
-            "liftTicketPrice": {
-                "adult": resort.get("ticket_price", 75) or 75  # Default reasonable price
+from resort_stream import iter_resort_records
+from search_index import SearchIndexBuilder, write_search_index
+
+INPUT_FILE = 'detailed_usa_ski_resorts.json'
+OUTPUT_FILE = '../src/data/usa-ski-resorts.ts'
+SHARD_DIR = '../public/data/resorts'
+SHARD_INDEX = 'index.json'
+SEARCH_INDEX = 'search.json'
+
+
+def convert_resort(resort: Dict, index: int) -> Dict:
+    """Convert one scraped resort to the SkiResort interface of the React app"""
+    return {
+        "id": f"usa-resort-{index}",
+        "name": resort.get("name", "Unknown Resort"),
+        "location": {
+            "state": resort.get("state") or "Unknown",  # Ensure no null values
+            **({} if not resort.get("city") else {"city": resort.get("city")}),
+            "coordinates": {
+                "latitude": 0.0,  # Not available in current dataset
+                "longitude": 0.0
             }
+        },
+        "elevation": {
+            "base": resort.get("elevation_base", 0) or 0,
+            "summit": resort.get("elevation_summit", 0) or 0,
+            "vertical": resort.get("vertical_drop", 0) or 0
+        },
+        "lifts": {
+            "total": resort.get("lifts_total", 0) or 0,
+            "chairlifts": 0,  # Not specified in current dataset
+            "surfaceLifts": 0,
+            "gondolas": 0
+        },
+        "trails": {
+            "total": resort.get("trails_total", 0) or 0,
+            "beginner": resort.get("trails_beginner", 0) or 0,
+            "intermediate": resort.get("trails_intermediate", 0) or 0,
+            "advanced": resort.get("trails_advanced", 0) or 0,
+            "expert": resort.get("trails_expert", 0) or 0
+        },
+        "skiableAcres": resort.get("skiable_acres", 0) or 0,
+        "snowmaking": {
+            "percentage": resort.get("snowmaking_percentage", 50) or 50,  # Default reasonable value
+            "acres": resort.get("snowmaking_acres", 0) or 0
+        },
+        "seasonDates": {
+            "opening": resort.get("season_start") or "December",
+            "closing": resort.get("season_end") or "April"
+        },
+        "website": resort.get("website", ""),
+        "description": resort.get("description", f"Ski resort in {resort.get('state', 'USA')}"),
+        "amenities": resort.get("amenities", []),
+        "liftTicketPrice": {
+            "adult": resort.get("ticket_price", 75) or 75  # Default reasonable price
         }
-        
-        converted_resorts.append(converted_resort)
-    
-    # Generate TypeScript file
+    }
+
+
+def iter_converted_resorts(input_path: str) -> Iterator[Dict]:
+    """Converted resorts, read lazily from the scraper's dataset"""
+    for index, resort in enumerate(iter_resort_records(input_path), 1):
+        yield convert_resort(resort, index)
+
+
+def write_ts_array(resorts: Iterator[Dict], f: TextIO, compact: bool = False) -> Tuple[int, Dict[str, int]]:
+    """Write resorts as a TypeScript array literal; returns the count and resorts per state
+
+    The indented form is byte-identical to json.dumps(list, indent=2).
+    """
+    count = 0
+    states: Dict[str, int] = {}
+    for resort in resorts:
+        if compact:
+            element = json.dumps(resort, ensure_ascii=False, separators=(',', ':'))
+        else:
+            element = '  ' + json.dumps(resort, indent=2, ensure_ascii=False).replace('\n', '\n  ')
+        f.write(('[\n' if count == 0 else ',\n') + element)
+        count += 1
+        state = resort["location"]["state"]
+        states[state] = states.get(state, 0) + 1
+    f.write('\n]' if count else '[]')
+    return count, states
+
+
+def state_slug(state: str) -> str:
+    """File-name-safe shard name for a state ("New Hampshire" -> "new-hampshire")"""
+    return re.sub(r'[^a-z0-9]+', '-', state.lower()).strip('-') or 'unknown'
+
+
+def write_state_shards(resorts: Iterable[Dict], directory: str) -> Dict:
+    """Stream converted resorts into one compact JSON array per state plus index.json
+
+    Each shard is written under a temporary name and every shard is in
+    place before the index that references it. Shards listed in the
+    previous index.json for states no longer in the data are removed;
+    nothing else in the directory is touched. Returns the index.
+    """
+    os.makedirs(directory, exist_ok=True)
+    index_path = os.path.join(directory, SHARD_INDEX)
+    previous = set()
+    if os.path.exists(index_path):
+        with open(index_path, encoding='utf-8') as f:
+            previous = {os.path.basename(shard['file']) for shard in json.load(f).get('states', [])}
+    shards: Dict[str, Dict] = {}
+    files: Dict[str, TextIO] = {}
+    try:
+        for resort in resorts:
+            state = resort["location"]["state"]
+            shard = shards.get(state)
+            if shard is None:
+                slug = state_slug(state)
+                shard = shards[state] = {'state': state, 'slug': slug, 'count': 0, 'file': f'{slug}.json'}
+                files[state] = open(os.path.join(directory, shard['file'] + '.tmp'), 'w', encoding='utf-8')
+            files[state].write(('[' if shard['count'] == 0 else ',\n')
+                               + json.dumps(resort, ensure_ascii=False, separators=(',', ':')))
+            shard['count'] += 1
+        for f in files.values():
+            f.write(']\n')
+            f.close()
+
+        states: List[Dict] = sorted(shards.values(), key=lambda shard: shard['state'])
+        for shard in states:
+            path = os.path.join(directory, shard['file'])
+            os.replace(path + '.tmp', path)
+            shard['bytes'] = os.path.getsize(path)
+        index = {
+            'generated': datetime.now().isoformat(timespec='seconds'),
+            'total': sum(shard['count'] for shard in states),
+            'states': states,
+        }
+        with open(index_path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(index, f, ensure_ascii=False, indent=2)
+            f.write('\n')
+        os.replace(index_path + '.tmp', index_path)
+    except BaseException:
+        # Leave no half-written shards behind; shards already moved into place stay
+        for f in files.values():
+            f.close()
+        tmp_paths = [os.path.join(directory, shard['file'] + '.tmp') for shard in shards.values()]
+        for tmp_path in tmp_paths + [index_path + '.tmp']:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        raise
+
+    for name in previous - {shard['file'] for shard in states} - {SHARD_INDEX, SEARCH_INDEX}:
+        path = os.path.join(directory, name)
+        if os.path.exists(path):
+            os.remove(path)
+    return index
+
+
+def write_state_shards_from(input_path: str, directory: str) -> Dict:
+    """Convert the scraper's dataset straight into per-state shards and their search index
+
+    The dataset is read once; the search index is built from the same stream.
+    """
+    search = SearchIndexBuilder()
+
+    def resorts() -> Iterator[Dict]:
+        for resort in iter_converted_resorts(input_path):
+            search.add(resort)
+            yield resort
+
+    index = write_state_shards(resorts(), directory)
+    size = sum(shard['bytes'] for shard in index['states'])
+    index_size = os.path.getsize(os.path.join(directory, SHARD_INDEX))
+    print(f"🧩 {index['total']} resorts sharded into {len(index['states'])} state files "
+          f"({size / 1024:.0f} KB) in {directory}, index {index_size / 1024:.1f} KB")
+
+    search_path = os.path.join(directory, SEARCH_INDEX)
+    search_index = search.build()
+    write_search_index(search_index, search_path)
+    print(f"🔎 Search index: {len(search_index['tokens'])} words, {len(search_index['trigrams'])} trigrams "
+          f"({os.path.getsize(search_path) / 1024:.0f} KB)")
+    return index
+
+
+def convert_usa_data_to_typescript(input_path: str = INPUT_FILE, output_path: str = OUTPUT_FILE,
+                                   compact: bool = False) -> int:
+    """Convert detailed USA ski resort data to TypeScript format"""
+    print(f"📊 Converting USA ski resorts from '{input_path}' to TypeScript format...")
+
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    ts_content = f'''// Auto-generated USA ski resort data from comprehensive web scraping
+
+    # Written under a temporary name and moved into place, so the app never
+    # imports a half-written module
+    tmp_path = f'{output_path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(f'''// Auto-generated USA ski resort data from comprehensive web scraping
 // Generated on {timestamp}
 // Source: skiresort.info comprehensive USA dataset
 
-export const usaSkiResorts = {json.dumps(converted_resorts, indent=2, ensure_ascii=False)};
-'''
-    
-    # Write TypeScript file
-    output_path = "../src/data/usa-ski-resorts.ts"
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(ts_content)
-    
-    print(f"✅ Successfully converted {len(converted_resorts)} USA ski resorts")
-    print(f"📁 TypeScript file saved to: {output_path}")
+export const usaSkiResorts = ''')
+        count, states = write_ts_array(iter_converted_resorts(input_path), f, compact)
+        f.write(';\n')
+    os.replace(tmp_path, output_path)
+
+    print(f"✅ Successfully converted {count} USA ski resorts")
+    print(f"📁 TypeScript file saved to: {output_path} ({os.path.getsize(output_path) / 1024:.0f} KB)")
     print(f"🎿 Data includes resorts from multiple US states")
-    
+
     # Show some stats
-    states = {}
-    for resort in converted_resorts:
-        state = resort["location"]["state"]
-        if state and state != "None" and state != "Unknown":
-            states[state] = states.get(state, 0) + 1
-    
+    states = {state: n for state, n in states.items() if state and state != "None" and state != "Unknown"}
     print(f"📊 States covered: {len(states)}")
-    for state, count in sorted(states.items()):
-        if state:  # Only show valid states
-            print(f"   • {state}: {count} resorts")
+    for state, n in sorted(states.items()):
+        print(f"   • {state}: {n} resorts")
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--input', default=INPUT_FILE, help=f'scraped dataset, .json or .jsonl (default: {INPUT_FILE})')
+    parser.add_argument('--output', help=f'also write a TypeScript module, e.g. {OUTPUT_FILE} (default: skip)')
+    parser.add_argument('--compact', action='store_true',
+                        help='TypeScript module with one resort per line without indentation (smaller file)')
+    parser.add_argument('--shards', default=SHARD_DIR,
+                        help=f"per-state JSON shards and index.json for the app (default: {SHARD_DIR}, '' to skip)")
+    args = parser.parse_args()
+    if not args.output and not args.shards:
+        parser.error("nothing to write: pass --output and/or --shards")
+    if args.output:
+        convert_usa_data_to_typescript(args.input, args.output, args.compact)
+    if args.shards:
+        write_state_shards_from(args.input, args.shards)
+
 
 if __name__ == "__main__":
-    convert_usa_data_to_typescript()
\ No newline at end of file
+    main()
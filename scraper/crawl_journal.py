@@ -0,0 +1,121 @@
+"""
+Resumable crawl checkpoints for the ski resort scrapers
+
+CrawlJournal is an append-only JSONL log with one line per scraped URL:
+
+    {"url": "...", "status": "ok", "resort": {...}, "at": 1700000000.0}
+    {"url": "...", "status": "failed", "error": "...", "at": 1700000000.0}
+
+Each line is flushed as soon as the URL is done, so a crawl that dies
+part-way keeps everything scraped so far. Reopening the journal replays
+it; the latest line per URL wins, so a restarted run can skip completed
+URLs and retry only the failed or missing ones.
+
+Only each URL's status and line number are kept in memory; iter_resorts
+streams the resort records back from the file.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+
+class CrawlJournal:
+    """Append-only per-URL crawl status log"""
+
+    OK = 'ok'
+    FAILED = 'failed'
+
+    def __init__(self, path: str, fresh: bool = False):
+        self.path = path
+        # url -> (status, line number of its latest record)
+        self._latest: Dict[str, Tuple[str, int]] = {}
+        self._lines = 0
+        self._lock = threading.Lock()
+        if fresh and os.path.exists(path):
+            os.remove(path)
+        self._replay()
+        self._file = open(path, 'a', encoding='utf-8')
+        if self._lines and not self._ends_with_newline():
+            # Terminate a crash-truncated last line so it stays one bad line
+            self._file.write('\n')
+            self._file.flush()
+
+    def _replay(self):
+        if not os.path.exists(self.path):
+            return
+        for line_number, record in self._records():
+            self._lines = line_number + 1
+            if record:
+                self._latest[record['url']] = (record['status'], line_number)
+
+    def _records(self) -> Iterator[Tuple[int, Optional[Dict]]]:
+        """(line number, record) for every line; record is None for unreadable lines"""
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f):
+                try:
+                    yield line_number, json.loads(line)
+                except ValueError:
+                    # Partially written last line from a crash
+                    yield line_number, None
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b'\n'
+
+    def _append(self, record: Dict):
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + '\n')
+            self._file.flush()
+            self._latest[record['url']] = (record['status'], self._lines)
+            self._lines += 1
+
+    def record_success(self, url: str, resort: Dict):
+        """Checkpoint a successfully parsed resort (as a plain dict)"""
+        self._append({'url': url, 'status': self.OK, 'resort': resort, 'at': time.time()})
+
+    def record_failure(self, url: str, error: str):
+        """Checkpoint a URL that could not be scraped"""
+        self._append({'url': url, 'status': self.FAILED, 'error': error, 'at': time.time()})
+
+    def status(self, url: str) -> Optional[str]:
+        latest = self._latest.get(url)
+        return latest[0] if latest else None
+
+    def is_completed(self, url: str) -> bool:
+        return self.status(url) == self.OK
+
+    def completed_urls(self) -> Set[str]:
+        return {url for url, (status, _) in self._latest.items() if status == self.OK}
+
+    def failed_urls(self) -> Set[str]:
+        return {url for url, (status, _) in self._latest.items() if status == self.FAILED}
+
+    def pending(self, urls: Iterable[str]) -> List[str]:
+        """URLs from urls that still need scraping (failed or never attempted)"""
+        return [url for url in urls if not self.is_completed(url)]
+
+    def iter_resorts(self) -> Iterator[Dict]:
+        """Latest parsed resort dict for every completed URL, read lazily from the file"""
+        latest_ok = {line for status, line in self._latest.values() if status == self.OK}
+        for line_number, record in self._records():
+            if line_number in latest_ok:
+                yield record['resort']
+
+    def resorts(self) -> List[Dict]:
+        """Latest parsed resort dict for every completed URL"""
+        return list(self.iter_resorts())
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
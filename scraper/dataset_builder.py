@@ -5,22 +5,52 @@ This script builds a comprehensive ski resort dataset by discovering
 resort URLs from category pages and then scraping detailed data.
 """
 
-import requests
-import json
-import time
-import re
-from bs4 import BeautifulSoup
-from typing import List, Set, Dict
+import os
+from typing import Iterable, List, Optional, Set
 from enhanced_scraper import ImprovedSkiResortScraper, SkiResort
-from dataclasses import asdict
+from http_cache import CachingSession, HttpCache
+from rate_limit import HostRateLimiter, RateLimitedSession
+from transport import mount_transport
+from html_backends import DEFAULT_BACKEND, parse_page
+from resort_stream import JsonlWriter, iter_resort_records, resort_dict, write_resorts
+from resort_urls import SEEN_INDEX_FILE, SeenUrlIndex, canonical_resort_url
+from columnar import ResortColumns, numpy_available
+from resort_stats import print_summary, summarize
 
 class SkiResortDatasetBuilder:
     """Build comprehensive ski resort dataset"""
     
-    def __init__(self):
+    def __init__(self, cache: HttpCache = None, parser_backend: str = DEFAULT_BACKEND,
+                 stream_path: str = None, seen_index: SeenUrlIndex = None):
         self.scraper = ImprovedSkiResortScraper(delay_between_requests=2.0)
+        self.parser_backend = parser_backend
+        # Optional JSONL file each resort is appended to as soon as it is scraped
+        self.stream_path = stream_path
+        # One session for discovery and the scraper: a single keep-alive pool,
+        # compressed transfers, retries and one rate limit per host
+        # The rate adapts to errors and latency but never exceeds one request per delay
+        rate = 1.0 / self.scraper.delay
+        self.session = RateLimitedSession(HostRateLimiter(rate, adaptive=True, max_requests_per_second=rate))
+        self.session.headers.update(self.scraper.session.headers)
+        self.transport_stats = mount_transport(self.session, pool_maxsize=1)
+        # Serve listing and resort pages from the disk cache when possible
+        if cache:
+            self.session = CachingSession(self.session, cache)
+        self.scraper.session = self.session
         self.discovered_urls: Set[str] = set()
         self.scraped_resorts: List[SkiResort] = []
+        # Canonical URLs fetched by this or earlier runs (persistent if given a path)
+        self.seen_index = seen_index if seen_index is not None else SeenUrlIndex()
+        # Earlier runs' resorts are already in stream_path, so keep appending to it
+        self.resuming = len(self.seen_index) > 0
+    
+    def _new_resort_url(self, href: str) -> Optional[str]:
+        """Canonical resort URL for href, or None if it is not a resort or was already found/fetched"""
+        url = canonical_resort_url(href)
+        if not url or url in self.discovered_urls or url in self.seen_index:
+            return None
+        self.discovered_urls.add(url)
+        return url
         
     def discover_resort_urls_from_country(self, country: str) -> List[str]:
         """Discover resort URLs from a country page"""
@@ -42,23 +72,21 @@ class SkiResortDatasetBuilder:
         
         try:
             print(f"🔍 Discovering resorts in {country.title()}...")
-            response = self.scraper.session.get(url)
+            response = self.session.get(url)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            page = parse_page(response.content, self.parser_backend)
             
             resort_urls = []
             # Look for resort links in the page
-            links = soup.find_all('a', href=True)
+            links = page.links
             
-            for link in links:
-                href = link.get('href', '')
-                if '/ski-resort/' in href and href.startswith('/ski-resort/'):
-                    full_url = f"https://www.skiresort.info{href}"
+            for href, _ in links:
+                full_url = self._new_resort_url(href)
+                if full_url:
                     resort_urls.append(full_url)
-                    self.discovered_urls.add(full_url)
             
-            print(f"✅ Discovered {len(resort_urls)} resorts in {country.title()}")
-            return list(set(resort_urls))  # Remove duplicates
+            print(f"✅ Discovered {len(resort_urls)} new resorts in {country.title()}")
+            return resort_urls
             
         except Exception as e:
             print(f"❌ Error discovering resorts in {country}: {e}")
@@ -80,23 +108,16 @@ class SkiResortDatasetBuilder:
             
             for ranking_url in rankings_urls:
                 try:
-                    response = self.scraper.session.get(ranking_url)
+                    response = self.session.get(ranking_url)
                     response.raise_for_status()
-                    soup = BeautifulSoup(response.content, 'html.parser')
+                    page = parse_page(response.content, self.parser_backend)
                     
-                    links = soup.find_all('a', href=True)
+                    links = page.links
                     
-                    for link in links:
-                        href = link.get('href', '')
-                        if '/ski-resort/' in href:
-                            if href.startswith('/'):
-                                full_url = f"https://www.skiresort.info{href}"
-                            else:
-                                full_url = href
-                            
-                            if full_url not in self.discovered_urls:
-                                resort_urls.append(full_url)
-                                self.discovered_urls.add(full_url)
+                    for href, _ in links:
+                        full_url = self._new_resort_url(href)
+                        if full_url:
+                            resort_urls.append(full_url)
                         
                         if len(resort_urls) >= limit:
                             break
@@ -137,7 +158,6 @@ class SkiResortDatasetBuilder:
                 country_urls = self.discover_resort_urls_from_country(country)
                 # Limit per country to avoid overwhelming
                 all_urls.extend(country_urls[:max_per_country])
-                time.sleep(1)  # Be respectful between countries
         
         # Remove duplicates while preserving order
         unique_urls = []
@@ -159,6 +179,7 @@ class SkiResortDatasetBuilder:
         
         successful_count = 0
         failed_count = 0
+        live = JsonlWriter(self.stream_path, append=self.resuming) if self.stream_path else None
         
         for i, url in enumerate(unique_urls):
             print(f"\n🎿 Resort {i+1}/{len(unique_urls)}")
@@ -166,7 +187,10 @@ class SkiResortDatasetBuilder:
             
             resort = self.scraper.scrape_resort_details(url)
             if resort:
+                self.seen_index.add(url)
                 self.scraped_resorts.append(resort)
+                if live:
+                    live.write(resort)
                 successful_count += 1
                 print(f"✅ Success: {resort.name} ({resort.country}) - {resort.rating}/5 ⭐")
             else:
@@ -176,43 +200,50 @@ class SkiResortDatasetBuilder:
             # Progress update every 5 resorts
             if (i + 1) % 5 == 0:
                 print(f"\n📊 Progress: {successful_count} successful, {failed_count} failed")
-            
-            # Be respectful to the server
-            if i < len(unique_urls) - 1:
-                print(f"⏳ Waiting {self.scraper.delay} seconds...")
-                time.sleep(self.scraper.delay)
+        
+        if live:
+            live.close()
         
         print(f"\n🎉 Dataset building complete!")
         print(f"📊 Final stats: {successful_count} successful, {failed_count} failed")
+        print(self.transport_stats.summary())
         
         return self.scraped_resorts
     
+    def _all_resorts(self) -> Iterable:
+        """Every resort built so far: the live stream (all runs) if there is one, else this run's"""
+        if self.stream_path and os.path.exists(self.stream_path):
+            return iter_resort_records(self.stream_path)
+        return self.scraped_resorts
+    
     def save_dataset(self, filename: str = "comprehensive_ski_resorts.json"):
         """Save the dataset to JSON file"""
-        if not self.scraped_resorts:
+        if not self.scraped_resorts and not self.resuming:
             print("❌ No resorts to save")
             return
         
-        # Convert to dictionaries for JSON serialization
-        resort_dicts = [asdict(resort) for resort in self.scraped_resorts]
-        
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(resort_dicts, f, indent=2, ensure_ascii=False)
+        # Streamed one record at a time (.jsonl for one resort per line)
+        total = write_resorts(self._all_resorts(), filename)
         
         print(f"📁 Dataset saved to '{filename}'")
         
         # Show summary statistics
+        if numpy_available():
+            columns = ResortColumns.from_records(self._all_resorts(), category_columns=('country',))
+            print_summary(summarize(columns, group_by='country'))
+            return
+        
         countries = {}
         ratings = []
         
-        for resort in self.scraped_resorts:
-            if resort.country:
-                countries[resort.country] = countries.get(resort.country, 0) + 1
-            if resort.rating:
-                ratings.append(resort.rating)
+        for resort in map(resort_dict, self._all_resorts()):
+            if resort.get('country'):
+                countries[resort['country']] = countries.get(resort['country'], 0) + 1
+            if resort.get('rating'):
+                ratings.append(resort['rating'])
         
         print(f"\n📈 Dataset Summary:")
-        print(f"  📊 Total resorts: {len(self.scraped_resorts)}")
+        print(f"  📊 Total resorts: {total}")
         print(f"  🌍 Countries: {len(countries)}")
         print(f"  ⭐ Average rating: {sum(ratings)/len(ratings):.1f}" if ratings else "  ⭐ No ratings available")
         print(f"  🏆 Top countries:")
@@ -221,7 +252,11 @@ class SkiResortDatasetBuilder:
 
 def main():
     """Main function to build ski resort dataset"""
-    builder = SkiResortDatasetBuilder()
+    # The seen index and the JSONL stream carry over between runs: resorts
+    # fetched before are skipped and the saved dataset covers every run
+    builder = SkiResortDatasetBuilder(cache=HttpCache('.http_cache'),
+                                      stream_path='comprehensive_ski_resorts.jsonl',
+                                      seen_index=SeenUrlIndex(SEEN_INDEX_FILE))
     
     # Configuration - adjust as needed
     config = {
@@ -243,7 +278,7 @@ def main():
     # Build the dataset
     resorts = builder.build_dataset(**config)
     
-    if resorts:
+    if resorts or builder.resuming:
         # Save the results
         builder.save_dataset()
         
@@ -0,0 +1,218 @@
+"""
+Declarative field pattern registry for resort pages
+
+Maps each regex-extracted DetailedUSASkiResort field to its precompiled
+patterns (in priority order) and a converter for the captured value.
+Patterns are compiled once at import time instead of on every call.
+
+Two lookup modes are offered:
+
+  * match_field / match_fields - per field, try each pattern in priority
+    order and take its first match (one scan of the text per pattern)
+  * CombinedFieldScanner - all patterns joined into one alternation that
+    finds every field in a single left-to-right scan of the page text
+
+Both modes return identical values. Adding a field is one FieldSpec entry
+in FIELD_SPECS; the combined scanner picks it up without another pass.
+
+Every pattern captures the field value in its first group; any other
+groups must be non-capturing.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Pattern, Tuple
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """Precompiled patterns and converter for a single resort field"""
+    field: str
+    patterns: Tuple[Pattern, ...]
+    convert: Callable[[str], Any]
+    accept: Optional[Callable[[Any], bool]] = None
+
+    def value_from(self, match) -> Optional[Any]:
+        """Convert a match of one of this field's patterns, or None if rejected"""
+        value = self.convert(match.group(1))
+        if self.accept and not self.accept(value):
+            return None
+        return value
+
+
+def _spec(field: str, convert: Callable[[str], Any], *patterns: str,
+          flags: int = 0, accept: Optional[Callable[[Any], bool]] = None) -> FieldSpec:
+    return FieldSpec(field, tuple(re.compile(p, flags) for p in patterns), convert, accept)
+
+
+def _price(value: str) -> str:
+    return f"US${value}"
+
+
+def _acres(value: str) -> int:
+    return int(value.replace(',', ''))
+
+
+def _city(value: str) -> str:
+    return value.strip()
+
+
+def _slope_spec(field: str, difficulty: str) -> FieldSpec:
+    return _spec(field, float,
+                 rf'{difficulty.capitalize()}\s*(\d+(?:\.\d+)?)\s*km',
+                 rf'{difficulty}:\s*(\d+(?:\.\d+)?)\s*km',
+                 flags=re.IGNORECASE)
+
+
+FIELD_SPECS: Tuple[FieldSpec, ...] = (
+    _spec('city', _city,
+          r'›\s*([A-Za-z\s]+)\s*›\s*USA',
+          r'City:\s*([A-Za-z\s]+)',
+          r'Location:\s*([A-Za-z\s]+)',
+          accept=lambda city: len(city) > 1 and city != 'USA'),
+    _spec('rating', float,
+          r'(\d+\.\d+)\s+out of\s+\d+\s+stars?',
+          r'Test report\s+(\d+\.\d+)\s+out of\s+\d+',
+          r'Rating:\s*(\d+\.\d+)',
+          r'(\d+\.\d+)\s*/\s*5'),
+    _spec('elevation_base', int,
+          r'(\d+)\s*m\s*[-–]\s*\d+\s*m',  # "800 m - 2000 m"
+          r'Base:\s*(\d+)\s*m',
+          r'Valley station:\s*(\d+)\s*m'),
+    _spec('elevation_top', int,
+          r'\d+\s*m\s*[-–]\s*(\d+)\s*m',  # "800 m - 2000 m"
+          r'Top:\s*(\d+)\s*m',
+          r'Summit:\s*(\d+)\s*m',
+          r'Mountain station:\s*(\d+)\s*m'),
+    _spec('vertical_drop', int,
+          r'Difference\s+(\d+)\s*m',
+          r'Vertical\s*drop:\s*(\d+)\s*m',
+          r'\((\d+)\s*m\s*difference\)'),
+    _spec('slopes_total_km', float,
+          r'Total:\s*(\d+(?:\.\d+)?)\s*km',
+          r'Slopes:\s*(\d+(?:\.\d+)?)\s*km',
+          r'Pistes:\s*(\d+(?:\.\d+)?)\s*km'),
+    _slope_spec('slopes_easy_km', 'easy'),
+    _slope_spec('slopes_intermediate_km', 'intermediate'),
+    _slope_spec('slopes_difficult_km', 'difficult'),
+    _spec('lifts_total', int,
+          r'(\d+)\s+ski lifts?',
+          r'Total lifts?:\s*(\d+)',
+          r'Lifts?:\s*(\d+)',
+          r'(\d+)\s+lifts?'),
+    _spec('day_pass_price', _price,
+          r'US\$\s*(\d+(?:[\.,]\d{2})?)',
+          r'\$\s*(\d+(?:[\.,]\d{2})?)',
+          r'Day pass:\s*US\$\s*(\d+(?:[\.,]\d{2})?)'),
+    _spec('season_start', str,
+          r'Season:\s*(\w+\s+\d{4})',
+          r'Opens?:\s*(\w+)',
+          r'Opening:\s*(\w+)'),
+    _spec('season_end', str,
+          r'Closes?:\s*(\w+)',
+          r'Closing:\s*(\w+)',
+          r'Until:\s*(\w+)'),
+    _spec('skiable_acres', _acres,
+          r'(\d+(?:,\d+)?)\s*acres?',
+          r'Skiable area:\s*(\d+(?:,\d+)?)\s*acres?'),
+)
+
+FIELD_PATTERNS: Dict[str, FieldSpec] = {spec.field: spec for spec in FIELD_SPECS}
+
+
+def match_field(text: str, field: str) -> Optional[Any]:
+    """Return the converted value of field from its highest-priority matching pattern"""
+    spec = FIELD_PATTERNS[field]
+    for pattern in spec.patterns:
+        match = pattern.search(text)
+        if match:
+            value = spec.value_from(match)
+            if value is not None:
+                return value
+    return None
+
+
+def match_fields(text: str, fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """Run match_field for every (or the given) registered field"""
+    return {field: match_field(text, field) for field in (fields or FIELD_PATTERNS)}
+
+
+class CombinedFieldScanner:
+    """Single-scan matcher over every registered pattern
+
+    All patterns are joined into one lookahead alternation so that one
+    finditer pass over the text visits every position once. The first
+    match of each pattern is recorded and the highest-priority accepted
+    pattern wins per field, which gives the same result as match_fields.
+    """
+
+    def __init__(self, specs: Iterable[FieldSpec] = FIELD_SPECS):
+        self.specs = tuple(specs)
+        # (spec, priority, pattern) for every alternative, in alternation order
+        self._alternatives: List[Tuple[FieldSpec, int, Pattern]] = []
+        # Index of each field's priority-0 alternative
+        self._first_index: Dict[str, int] = {}
+        branches = []
+        for spec in self.specs:
+            self._first_index[spec.field] = len(self._alternatives)
+            for priority, pattern in enumerate(spec.patterns):
+                source = pattern.pattern
+                if pattern.flags & re.IGNORECASE:
+                    source = f'(?i:{source})'
+                branches.append(f'({source})')
+                self._alternatives.append((spec, priority, pattern))
+        self._combined = re.compile('(?=' + '|'.join(branches) + ')')
+
+        # Each branch is wrapped in an outer group, which is the last group
+        # closed when that branch matches (match.lastindex)
+        self._group_to_alternative: Dict[int, int] = {}
+        group = 1
+        for index, (_, _, pattern) in enumerate(self._alternatives):
+            self._group_to_alternative[group] = index
+            group += 1 + pattern.groups
+
+    def scan(self, text: str) -> Dict[str, Any]:
+        """Find every registered field in one pass over text"""
+        # Best (lowest) priority accepted so far per field, and its value
+        best: Dict[str, Tuple[int, Any]] = {}
+        seen = set()
+        unresolved = {spec.field for spec in self.specs}
+
+        for match in self._combined.finditer(text):
+            position = match.start()
+            # The alternation only reports the first branch matching at this
+            # position; later branches may match here too, so try them directly
+            for index in range(self._group_to_alternative[match.lastindex], len(self._alternatives)):
+                spec, priority, pattern = self._alternatives[index]
+                if index in seen or spec.field not in unresolved:
+                    continue
+                alt_match = pattern.match(text, position)
+                if not alt_match:
+                    continue
+                seen.add(index)
+                value = spec.value_from(alt_match)
+                if value is not None and (spec.field not in best or priority < best[spec.field][0]):
+                    best[spec.field] = (priority, value)
+                if spec.field in best and self._settled(spec, best[spec.field][0], seen):
+                    unresolved.discard(spec.field)
+            if not unresolved:
+                break
+
+        return {spec.field: best[spec.field][1] if spec.field in best else None for spec in self.specs}
+
+    def _settled(self, spec: FieldSpec, priority: int, seen: set) -> bool:
+        # A field is settled once every higher-priority pattern has already
+        # had its first match (and was rejected), so nothing can outrank it
+        base = self._first_index[spec.field]
+        return all(base + p in seen for p in range(priority))
+
+
+_default_scanner: Optional[CombinedFieldScanner] = None
+
+
+def scan_fields(text: str) -> Dict[str, Any]:
+    """Find every registered field in a single scan using the shared scanner"""
+    global _default_scanner
+    if _default_scanner is None:
+        _default_scanner = CombinedFieldScanner()
+    return _default_scanner.scan(text)
@@ -0,0 +1,103 @@
+"""
+Permanent archive of fetched resort pages
+
+Unlike the HTTP cache (http_cache.py), which expires and evicts entries,
+the archive keeps the raw HTML of every resort page the crawler fetched,
+so the current extractors can be re-run over all of it offline
+(reparse.py) after an extractor fix instead of crawling again.
+
+Layout under the archive directory:
+
+    index.jsonl                        one line per stored page version
+    pages/<url hash[:2]>/<url hash>.html.gz
+
+index.jsonl is append-only ({"url", "file", "sha256", "bytes", "at"});
+the latest line per URL wins. Storing a page whose body is unchanged
+does not rewrite anything.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, Iterator, List, Tuple
+
+from http_cache import _atomic_write
+
+
+class HtmlArchive:
+    """One gzipped HTML file per URL plus an append-only JSONL index"""
+
+    INDEX = 'index.jsonl'
+
+    def __init__(self, directory: str, compresslevel: int = 6):
+        self.directory = directory
+        self.compresslevel = compresslevel
+        self._entries: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        os.makedirs(os.path.join(directory, 'pages'), exist_ok=True)
+        index_path = os.path.join(directory, self.INDEX)
+        if os.path.exists(index_path):
+            with open(index_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # Partially written last line from a crash
+                        continue
+                    self._entries[entry['url']] = entry
+        self._index = open(index_path, 'a', encoding='utf-8')
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._entries
+
+    def _relative_path(self, url: str) -> str:
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return os.path.join('pages', key[:2], f'{key}.html.gz')
+
+    def store(self, url: str, content: bytes) -> bool:
+        """Archive a page body; returns False if the archived copy is already identical"""
+        digest = hashlib.sha256(content).hexdigest()
+        entry = self._entries.get(url)
+        if entry and entry['sha256'] == digest:
+            return False
+
+        relative_path = self._relative_path(url)
+        _atomic_write(os.path.join(self.directory, relative_path),
+                      gzip.compress(content, compresslevel=self.compresslevel, mtime=0))
+        entry = {'url': url, 'file': relative_path, 'sha256': digest,
+                 'bytes': len(content), 'at': time.time()}
+        with self._lock:
+            self._index.write(json.dumps(entry) + '\n')
+            self._index.flush()
+            self._entries[url] = entry
+        return True
+
+    def read(self, url: str) -> bytes:
+        """Decompressed HTML of the archived page (KeyError if not archived)"""
+        entry = self._entries[url]
+        with gzip.open(os.path.join(self.directory, entry['file']), 'rb') as f:
+            return f.read()
+
+    def urls(self) -> List[str]:
+        return list(self._entries)
+
+    def iter_pages(self) -> Iterator[Tuple[str, bytes]]:
+        """(url, html) for every archived page, read one at a time in index order"""
+        for url in self.urls():
+            yield url, self.read(url)
+
+    def close(self):
+        with self._lock:
+            self._index.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
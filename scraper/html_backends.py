@@ -0,0 +1,166 @@
+"""
+Switchable HTML parser backends for the ski resort scrapers
+
+Every backend produces a PageContext, so the field extractors in
+improved_usa_scraper.py run unchanged whichever parser built the page:
+
+  * html.parser - BeautifulSoup with the pure-Python tree builder
+  * lxml        - BeautifulSoup with the lxml tree builder (default)
+  * lxml-html   - raw lxml.html tree, no BeautifulSoup objects at all
+  * selectolax  - selectolax's lexbor parser, if installed
+
+bench_parsers.py compares their throughput and memory and checks that
+all of them produce identical field output.
+
+parse_links is the listing-page mode: it only materialises anchors
+(a SoupStrainer for the BeautifulSoup backends, an event-based pull
+parser for lxml-html) since discovery never reads anything else.
+"""
+
+from typing import List, Tuple, Union
+
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+
+from page_context import PageContext
+
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:
+    lxml = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+PARSER_BACKENDS = ('html.parser', 'lxml', 'lxml-html', 'selectolax')
+DEFAULT_BACKEND = 'lxml' if lxml is not None else 'html.parser'
+
+# BeautifulSoup's get_text() leaves out the contents of these elements
+_NON_TEXT_TAGS = ('script', 'style', 'template')
+
+
+class LxmlPageContext(PageContext):
+    """PageContext over a raw lxml.html document"""
+
+    __slots__ = ('tree',)
+
+    def __init__(self, tree):
+        super().__init__(None)
+        self.tree = tree
+
+    def _compute_text(self) -> str:
+        # Mutates the tree, which is owned by this context
+        etree.strip_elements(self.tree, *_NON_TEXT_TAGS, with_tail=False)
+        return ''.join(self.tree.itertext())
+
+    def _compute_links(self) -> List[Tuple[str, str]]:
+        return [
+            (link.get('href'), ''.join(s.strip() for s in link.itertext()))
+            for link in self.tree.iter('a') if link.get('href') is not None
+        ]
+
+    def _compute_heading(self) -> str:
+        h1 = next(self.tree.iter('h1'), None)
+        return ''.join(s.strip() for s in h1.itertext()) if h1 is not None else ''
+
+    def _compute_meta_description(self) -> str:
+        for meta in self.tree.iter('meta'):
+            if meta.get('name') == 'description':
+                return meta.get('content') or ''
+        return ''
+
+
+class SelectolaxPageContext(PageContext):
+    """PageContext over a selectolax (lexbor) document"""
+
+    __slots__ = ('tree',)
+
+    def __init__(self, tree):
+        super().__init__(None)
+        self.tree = tree
+
+    def _compute_text(self) -> str:
+        # Mutates the tree, which is owned by this context
+        self.tree.strip_tags(list(_NON_TEXT_TAGS))
+        return self.tree.root.text(deep=True) if self.tree.root else ''
+
+    def _compute_links(self) -> List[Tuple[str, str]]:
+        return [
+            (link.attributes.get('href') or '', link.text(deep=True, strip=True))
+            for link in self.tree.css('a[href]')
+        ]
+
+    def _compute_heading(self) -> str:
+        h1 = self.tree.css_first('h1')
+        return h1.text(deep=True, strip=True) if h1 else ''
+
+    def _compute_meta_description(self) -> str:
+        meta = self.tree.css_first('meta[name="description"]')
+        return (meta.attributes.get('content') or '') if meta else ''
+
+
+def available_backends() -> List[str]:
+    """Backends whose parser libraries are installed"""
+    backends = ['html.parser']
+    if lxml is not None:
+        backends += ['lxml', 'lxml-html']
+    if LexborHTMLParser is not None:
+        backends.append('selectolax')
+    return backends
+
+
+def _check_backend(backend: str):
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown parser backend '{backend}' (choose from {', '.join(PARSER_BACKENDS)})")
+    if backend not in available_backends():
+        raise FeatureNotFound(f"Parser backend '{backend}' is not installed")
+
+
+def parse_page(content: Union[bytes, str], backend: str = DEFAULT_BACKEND) -> PageContext:
+    """Parse an HTML document with the given backend into a PageContext"""
+    _check_backend(backend)
+
+    if backend in ('html.parser', 'lxml'):
+        return PageContext(BeautifulSoup(content, backend))
+    if backend == 'lxml-html':
+        return LxmlPageContext(lxml.html.document_fromstring(content))
+    return SelectolaxPageContext(LexborHTMLParser(content))
+
+
+_ANCHORS_ONLY = SoupStrainer('a', href=True)
+
+
+def parse_links(content: Union[bytes, str], backend: str = DEFAULT_BACKEND) -> List[Tuple[str, str]]:
+    """(href, stripped anchor text) for every <a href>, without building the full tree"""
+    _check_backend(backend)
+
+    if backend in ('html.parser', 'lxml'):
+        return PageContext(BeautifulSoup(content, backend, parse_only=_ANCHORS_ONLY)).links
+    if backend == 'lxml-html':
+        return _stream_lxml_links(content)
+    # selectolax has no partial mode; its full parse is already cheaper than a strainer
+    return SelectolaxPageContext(LexborHTMLParser(content)).links
+
+
+def _stream_lxml_links(content: Union[bytes, str], chunk_size: int = 16384) -> List[Tuple[str, str]]:
+    parser = etree.HTMLPullParser(events=('end',), tag='a')
+    links = []
+
+    def drain():
+        for _, link in parser.read_events():
+            href = link.get('href')
+            if href is not None:
+                links.append((href, ''.join(s.strip() for s in link.itertext())))
+            # Drop the anchor's subtree and any finished siblings before it
+            link.clear(keep_tail=True)
+            while link.getprevious() is not None:
+                del link.getparent()[0]
+
+    for start in range(0, len(content), chunk_size):
+        parser.feed(content[start:start + chunk_size])
+        drain()
+    parser.close()
+    drain()
+    return links
@@ -0,0 +1,327 @@
+"""
+On-disk HTTP response cache for the ski resort scrapers
+
+Sits in front of a requests session's get(). Bodies are stored
+content-addressed (by SHA-256 of the body) so identical pages share one
+file; a small JSON entry per URL records status, headers, the body hash
+and when the entry was last validated.
+
+  * Entries younger than ttl are served without touching the network.
+  * Older entries are revalidated with If-None-Match / If-Modified-Since;
+    a 304 refreshes the entry and serves the stored body.
+  * max_bytes bounds the total body size; least recently used entries are
+    evicted first.
+  * offline=True never touches the network: cached entries are served
+    regardless of age and misses raise CacheMiss.
+
+Layout under the cache directory:
+
+    entries/<url hash[:2]>/<url hash>.json
+    bodies/<body hash[:2]>/<body hash>
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, Iterator, Optional, Tuple
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# Headers that describe the wire encoding rather than the stored (decoded) body
+_TRANSPORT_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection'}
+
+
+class CacheMiss(requests.RequestException):
+    """Raised in offline mode when a URL is not in the cache"""
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _atomic_write(path: str, data: bytes):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class HttpCache:
+    """Content-addressed disk cache of HTTP responses keyed by URL"""
+
+    def __init__(self, directory: str, ttl: Optional[float] = None,
+                 max_bytes: Optional[int] = None, offline: bool = False):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+        # Entries per body hash, counted from disk the first time a page changes
+        self._references: Optional[Dict[str, int]] = None
+        os.makedirs(os.path.join(directory, 'entries'), exist_ok=True)
+        os.makedirs(os.path.join(directory, 'bodies'), exist_ok=True)
+
+    def _entry_path(self, url: str) -> str:
+        key = _digest(url.encode('utf-8'))
+        return os.path.join(self.directory, 'entries', key[:2], f'{key}.json')
+
+    def _body_path(self, body_hash: str) -> str:
+        return os.path.join(self.directory, 'bodies', body_hash[:2], body_hash)
+
+    def lookup(self, url: str) -> Optional[Dict]:
+        """Return the stored entry for url, or None"""
+        try:
+            with open(self._entry_path(url), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+        if not os.path.exists(self._body_path(entry['body_sha256'])):
+            return None
+        return entry
+
+    def is_fresh(self, entry: Dict) -> bool:
+        """True if entry can be served without revalidation"""
+        if self.offline:
+            return True
+        return self.ttl is not None and time.time() - entry['validated_at'] < self.ttl
+
+    def read_body(self, entry: Dict) -> bytes:
+        with open(self._body_path(entry['body_sha256']), 'rb') as f:
+            return f.read()
+
+    def store(self, url: str, response: requests.Response) -> Dict:
+        """Store a 200 response for url and return its entry"""
+        body = response.content
+        body_hash = _digest(body)
+        body_path = self._body_path(body_hash)
+        now = time.time()
+        entry = {
+            'url': url,
+            'status': response.status_code,
+            'headers': {k: v for k, v in response.headers.items() if k.lower() not in _TRANSPORT_HEADERS},
+            'body_sha256': body_hash,
+            'size': len(body),
+            'stored_at': now,
+            'validated_at': now,
+            'accessed_at': now,
+        }
+        with self._lock:
+            previous = self._read_entry(url)
+            changed = previous is None or previous['body_sha256'] != body_hash
+            if previous and changed:
+                self._body_references()
+            if not os.path.exists(body_path):
+                _atomic_write(body_path, body)
+                if self._total_bytes is not None:
+                    self._total_bytes += len(body)
+            self._write_entry(url, entry)
+            if changed and self._references is not None:
+                self._references[body_hash] = self._references.get(body_hash, 0) + 1
+            # The page changed: drop the old body unless another URL shares it
+            if previous and changed:
+                self._release_body(previous['body_sha256'])
+        if self.max_bytes is not None and self.total_bytes() > self.max_bytes:
+            self.evict(self.max_bytes)
+        return entry
+
+    def touch(self, url: str, entry: Dict, revalidated: bool = False):
+        """Record an access (and optionally a successful revalidation)"""
+        now = time.time()
+        entry['accessed_at'] = now
+        if revalidated:
+            entry['validated_at'] = now
+        with self._lock:
+            self._write_entry(url, entry)
+
+    def _read_entry(self, url: str) -> Optional[Dict]:
+        try:
+            with open(self._entry_path(url), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _body_references(self) -> Dict[str, int]:
+        """Entries per body hash, counted once from disk (caller holds the lock)"""
+        if self._references is None:
+            references: Dict[str, int] = {}
+            for _, entry in self.iter_entries():
+                references[entry['body_sha256']] = references.get(entry['body_sha256'], 0) + 1
+            self._references = references
+        return self._references
+
+    def _release_body(self, body_hash: str):
+        """Drop one reference to a body, deleting it with the last one (caller holds the lock)"""
+        references = self._body_references()
+        references[body_hash] = references.get(body_hash, 0) - 1
+        if references[body_hash] > 0:
+            return
+        del references[body_hash]
+        path = self._body_path(body_hash)
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+        except FileNotFoundError:
+            return
+        if self._total_bytes is not None:
+            self._total_bytes -= size
+
+    def _write_entry(self, url: str, entry: Dict):
+        _atomic_write(self._entry_path(url), json.dumps(entry).encode('utf-8'))
+
+    def iter_entries(self) -> Iterator[Tuple[str, Dict]]:
+        """Yield (entry path, entry) for every stored entry"""
+        root = os.path.join(self.directory, 'entries')
+        for dirpath, _, filenames in os.walk(root):
+            for filename in filenames:
+                if not filename.endswith('.json'):
+                    continue
+                path = os.path.join(dirpath, filename)
+                try:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        yield path, json.load(f)
+                except (FileNotFoundError, ValueError):
+                    continue
+
+    def total_bytes(self) -> int:
+        """Total size of all stored bodies"""
+        with self._lock:
+            if self._total_bytes is None:
+                total = 0
+                for dirpath, _, filenames in os.walk(os.path.join(self.directory, 'bodies')):
+                    total += sum(os.path.getsize(os.path.join(dirpath, name))
+                                 for name in filenames if not name.startswith('.tmp-'))
+                self._total_bytes = total
+            return self._total_bytes
+
+    def evict(self, max_bytes: int) -> int:
+        """Evict least recently used entries until bodies fit in max_bytes; return entries removed
+
+        Bodies no entry references (left by an interrupted write or an older
+        version) are removed first, and the total is recounted from disk.
+        """
+        with self._lock:
+            entries = sorted(self.iter_entries(), key=lambda item: item[1].get('accessed_at', 0))
+            references: Dict[str, int] = {}
+            for _, entry in entries:
+                references[entry['body_sha256']] = references.get(entry['body_sha256'], 0) + 1
+
+            total = 0
+            for dirpath, _, filenames in os.walk(os.path.join(self.directory, 'bodies')):
+                for name in filenames:
+                    if name.startswith('.tmp-'):
+                        continue
+                    path = os.path.join(dirpath, name)
+                    if name in references:
+                        total += os.path.getsize(path)
+                    else:
+                        os.remove(path)
+            removed = 0
+            for path, entry in entries:
+                if total <= max_bytes:
+                    break
+                os.remove(path)
+                removed += 1
+                body_hash = entry['body_sha256']
+                references[body_hash] -= 1
+                if references[body_hash] == 0:
+                    try:
+                        os.remove(self._body_path(body_hash))
+                        total -= entry['size']
+                    except FileNotFoundError:
+                        pass
+            self._total_bytes = total
+            self._references = {body_hash: count for body_hash, count in references.items() if count > 0}
+            return removed
+
+    def prune_expired(self, max_age: float) -> int:
+        """Remove entries not validated within max_age seconds; return entries removed"""
+        cutoff = time.time() - max_age
+        removed = 0
+        for path, entry in list(self.iter_entries()):
+            if entry['validated_at'] < cutoff:
+                os.remove(path)
+                removed += 1
+        if removed:
+            self._remove_orphan_bodies()
+        return removed
+
+    def _remove_orphan_bodies(self):
+        with self._lock:
+            referenced = {entry['body_sha256'] for _, entry in self.iter_entries()}
+            for dirpath, _, filenames in os.walk(os.path.join(self.directory, 'bodies')):
+                for name in filenames:
+                    if name not in referenced and not name.startswith('.tmp-'):
+                        os.remove(os.path.join(dirpath, name))
+            self._total_bytes = None
+            self._references = None
+
+
+class CachingSession:
+    """Wrap a requests session so get() is served from an HttpCache
+
+    Every other attribute (headers, mount, ...) is delegated to the
+    wrapped session, so it can stand in for self.session anywhere.
+    """
+
+    def __init__(self, session: requests.Session, cache: HttpCache):
+        self.session = session
+        self.cache = cache
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    def __getattr__(self, name):
+        return getattr(self.session, name)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        entry = self.cache.lookup(url)
+
+        if entry and self.cache.is_fresh(entry):
+            self.cache.touch(url, entry)
+            self.hits += 1
+            return self._cached_response(entry)
+
+        if self.cache.offline:
+            raise CacheMiss(f"{url} is not cached (offline mode)")
+
+        headers = dict(kwargs.pop('headers', None) or {})
+        if entry:
+            stored = CaseInsensitiveDict(entry['headers'])
+            if 'ETag' in stored:
+                headers['If-None-Match'] = stored['ETag']
+            if 'Last-Modified' in stored:
+                headers['If-Modified-Since'] = stored['Last-Modified']
+
+        response = self.session.get(url, headers=headers, **kwargs)
+
+        if entry and response.status_code == 304:
+            self.cache.touch(url, entry, revalidated=True)
+            self.revalidated += 1
+            return self._cached_response(entry)
+
+        self.misses += 1
+        if response.status_code == 200:
+            self.cache.store(url, response)
+        return response
+
+    def _cached_response(self, entry: Dict) -> requests.Response:
+        response = requests.Response()
+        response.status_code = entry['status']
+        response.reason = 'OK'
+        response.url = entry['url']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response._content = self.cache.read_body(entry)
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.from_cache = True
+        return response
@@ -5,18 +5,40 @@ This script scrapes USA ski resort URLs first, then fetches detailed
 data from each individual resort page for better accuracy.
 """
 
+import argparse
+import os
 import requests
-import json
 import time
 import re
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from bs4 import BeautifulSoup
-from typing import List, Dict, Optional, Set
-from dataclasses import dataclass, asdict
-from urllib.parse import urljoin
+from typing import Iterable, Iterator, List, Dict, Optional, Set, Tuple, Union
+from dataclasses import dataclass
+from page_context import PageContext
+from html_backends import DEFAULT_BACKEND, PARSER_BACKENDS, available_backends, parse_links, parse_page
+from field_patterns import match_field, scan_fields
+from rate_limit import HostRateLimiter, RateLimitedSession, RetryPolicy
+from http_cache import CachingSession, HttpCache
+from transport import http2_available, mount_transport
+from crawl_journal import CrawlJournal
+from incremental import FingerprintStore
+from resort_stream import JsonlWriter, iter_resort_records, write_resorts
+from columnar import ResortColumns, default_columns_dir, export_columns, numpy_available, parse_price
+from resort_stats import print_summary, summarize
+from parse_pool import ParsePool
+from html_archive import HtmlArchive
+from resort_urls import SEEN_INDEX_FILE, SeenUrlIndex, canonical_resort_url
+from metrics import CrawlMetrics
 
-@dataclass
+@dataclass(slots=True)
 class DetailedUSASkiResort:
-    """Detailed data structure for USA ski resort"""
+    """Detailed data structure for USA ski resort
+    
+    Slotted: no per-instance __dict__, so large crawls hold less memory per
+    record (see bench_records.py).
+    """
     name: str
     state: str = None
     city: str = None
@@ -36,26 +58,129 @@ class DetailedUSASkiResort:
     description: str = None
     skiable_acres: int = None
     resort_url: str = None
+    
+    def to_dict(self) -> Dict:
+        """Field dict for JSON output
+        
+        Every field is a str/int/float/None, so this reads the slots directly
+        instead of going through dataclasses.asdict's recursive deepcopy.
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+# Common US states that have ski resorts
+US_STATES = (
+    'Alaska', 'California', 'Colorado', 'Connecticut', 'Idaho', 'Illinois',
+    'Maine', 'Massachusetts', 'Michigan', 'Minnesota', 'Montana', 'Nevada',
+    'New Hampshire', 'New Mexico', 'New York', 'North Carolina', 'Oregon', 
+    'Pennsylvania', 'Rhode Island', 'South Dakota', 'Tennessee', 'Utah', 
+    'Vermont', 'Virginia', 'Washington', 'West Virginia', 'Wisconsin', 'Wyoming'
+)
+
+SKI_RESORT_PREFIX = re.compile(r'^Ski resort\s+')
+
+# Resort sub-pages that discovery skips (we only want main resort pages)
+RESORT_SUBPAGES = ('/test-report/', '/snow-report/', '/webcams/', '/trail-map/', '/photos/')
+CLEAN_RESORT_PATH = re.compile(r'.*/ski-resort/[a-zA-Z0-9-]+$')
+
+OUTPUT_FILE = "detailed_usa_ski_resorts.json"
+# Fields whose hit rate is reported by the crawl metrics
+INSTRUMENTED_FIELDS = [name for name in DetailedUSASkiResort.__slots__ if name not in ('name', 'resort_url')]
 
 class ImprovedUSASkiResortScraper:
     """Improved scraper with individual resort page fetching"""
     
     BASE_URL = "https://www.skiresort.info"
     USA_RESORTS_URL = "https://www.skiresort.info/ski-resorts/usa/"
-    
-    def __init__(self, delay_between_requests: float = 2.0):
+    # Consecutive listing pages that may fail before discovery gives up
+    MAX_FAILED_LISTING_PAGES = 3
+    
+    def __init__(self, delay_between_requests: float = 2.0, combined_field_scan: bool = False,
+                 max_workers: int = 1, requests_per_second: float = None,
+                 cache: HttpCache = None, journal: CrawlJournal = None,
+                 parser_backend: str = DEFAULT_BACKEND, fingerprints: FingerprintStore = None,
+                 parse_processes: int = 0, archive: HtmlArchive = None,
+                 seen_index: SeenUrlIndex = None, adaptive: bool = False,
+                 max_requests_per_second: float = None, max_retries: int = 3,
+                 http2: bool = False, metrics: CrawlMetrics = None):
         self.delay = delay_between_requests
-        self.session = requests.Session()
+        # HTML parser used for every page (see html_backends)
+        self.parser_backend = parser_backend
+        # Find all regex fields in one scan of the page text (see field_patterns)
+        self.combined_field_scan = combined_field_scan
+        # Optional worker processes for parsing, so it is not serialised by the GIL
+        self.parse_pool = ParsePool(parse_processes, parser_backend, combined_field_scan) if parse_processes > 0 else None
+        # Resort pages fetched (and parsed) in parallel by scrape_batch_of_resorts
+        self.max_workers = max(1, max_workers)
+        # Politeness: one token bucket per host, defaulting to one request per delay;
+        # adaptive mode then raises or lowers each host's rate with its health
+        if requests_per_second is None and self.delay > 0:
+            requests_per_second = 1.0 / self.delay
+        self.rate_limiter = HostRateLimiter(requests_per_second, adaptive=adaptive,
+                                            max_requests_per_second=max_requests_per_second)
+        # Transient failures (errors, timeouts, 429/5xx) are retried with backoff in the session
+        self.session = RateLimitedSession(self.rate_limiter, RetryPolicy(max_retries=max_retries))
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         })
+        # Keep-alive pool with one connection per fetching thread (the workers plus
+        # stream_resorts' discovery thread), compressed bodies, optional HTTP/2
+        self.transport_stats = mount_transport(self.session, pool_maxsize=self.max_workers + 1, http2=http2)
+        # Optional disk cache in front of the session (hits skip the rate limiter)
+        self.cache = cache
+        if cache:
+            self.session = CachingSession(self.session, cache)
+        # Optional checkpoint journal: completed URLs are skipped on restart
+        self.journal = journal
+        # Optional page fingerprints, used by incremental_update to skip unchanged resorts
+        self.fingerprints = fingerprints
+        # Optional permanent copy of every fetched resort page, for offline re-parsing
+        self.archive = archive
+        # Optional index of resort URLs already fetched (possibly shared with dataset_builder):
+        # discovery skips them and every successful fetch is added
+        self.seen_index = seen_index
+        # Optional instrumentation: fetch/parse/extractor timings, field hit rates
+        self.metrics = metrics
+    
+    def fetch_page(self, url: str) -> bytes:
+        """Fetch a page (cache, then rate-limited network) and return its body"""
+        return self.fetch_response(url).content
+    
+    def fetch_response(self, url: str, headers: Dict[str, str] = None) -> requests.Response:
+        """Fetch a page and return the response itself (status, validators, body)"""
+        start = time.perf_counter()
+        try:
+            response = self.session.get(url, headers=headers)
+            response.raise_for_status()
+        except Exception:
+            if self.metrics is not None:
+                self.metrics.inc('fetches_total', source='network', outcome='error')
+            raise
+        if self.metrics is not None:
+            source = 'cache' if getattr(response, 'from_cache', False) else 'network'
+            self.metrics.observe('fetch_seconds', time.perf_counter() - start, source=source)
+            self.metrics.inc('fetches_total', source=source, outcome='ok')
+            self.metrics.inc('fetch_bytes_total', len(response.content), source=source)
+        return response
         
     def discover_all_resort_urls(self, max_pages: int = None) -> Set[str]:
-        """Discover all unique resort URLs from the USA listing pages"""
+        """Discover all unique (canonical) resort URLs from the USA listing pages"""
         print("🔍 Discovering all USA ski resort URLs...")
         
-        resort_urls = set()
+        resort_urls = set(self.iter_resort_urls(max_pages))
+        
+        print(f"🎿 Total unique USA resort URLs discovered: {len(resort_urls)}")
+        return resort_urls
+    
+    def iter_resort_urls(self, max_pages: int = None, skip_seen: bool = True) -> Iterator[str]:
+        """Walk the USA listing pages, yielding each new resort URL as its page arrives
+        
+        URLs are canonical (see resort_urls), so one resort is yielded once
+        however its links are spelled; URLs in self.seen_index are skipped
+        unless skip_seen is False.
+        """
+        resort_urls = SeenUrlIndex()
         page = 1
+        failed_pages = 0
         
         while True:
             if max_pages and page > max_pages:
@@ -67,385 +192,406 @@ class ImprovedUSASkiResortScraper:
             print(f"📄 Scanning page {page}: {page_url}")
             
             try:
-                response = self.session.get(page_url)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Find resort links on this page
-                page_resort_urls = self.extract_resort_urls_from_page(soup)
+                # Find resort links and the next-page link in one pass over the anchors
+                page_resort_urls, next_page = self.scan_listing_page(self.fetch_page(page_url), page)
                 
+                if self.metrics is not None:
+                    self.metrics.inc('listing_pages_total', outcome='ok')
                 if not page_resort_urls:
                     print(f"📋 No more resorts found on page {page}. Stopping.")
                     break
                 
-                resort_urls.update(page_resort_urls)
-                print(f"✅ Found {len(page_resort_urls)} new resort URLs on page {page}")
+                new_urls = resort_urls.new_urls(sorted(page_resort_urls))
+                for url in new_urls:
+                    resort_urls.add(url)
+                if skip_seen and self.seen_index is not None:
+                    new_urls = self.seen_index.new_urls(new_urls)
+                print(f"✅ Found {len(new_urls)} new resort URLs on page {page}")
                 print(f"📊 Total unique URLs so far: {len(resort_urls)}")
                 
+                # Hand the URLs over before fetching the next listing page
+                yield from new_urls
+                
                 # Check if there's a next page indicator
-                if not self.has_next_page(soup, page):
+                if not next_page:
                     print(f"📋 No next page indicator found. Stopping at page {page}")
                     break
                 
                 page += 1
-                
-                # Be respectful to the server
-                print(f"⏳ Waiting {self.delay} seconds...")
-                time.sleep(self.delay)
+                failed_pages = 0
                 
             except Exception as e:
+                # The session already retried transient errors; skip this page,
+                # but stop if the listing keeps failing
+                failed_pages += 1
+                if self.metrics is not None:
+                    self.metrics.inc('listing_pages_total', outcome='error')
                 print(f"❌ Error scanning page {page}: {e}")
-                break
+                if failed_pages >= self.MAX_FAILED_LISTING_PAGES:
+                    print(f"📋 {failed_pages} listing pages failed in a row. Stopping.")
+                    break
+                page += 1
+    
+    def stream_resorts(self, max_pages: int = None, limit: int = None,
+                       queue_size: int = 100) -> Iterator[DetailedUSASkiResort]:
+        """Discover and scrape resorts as a pipeline, yielding results as they are scraped
+        
+        A discovery thread walks the listing pages and feeds resort URLs into a
+        bounded queue; max_workers detail workers consume them immediately, so
+        the first resorts are scraped while later listing pages are still being
+        fetched. limit caps the number of resort URLs scraped. URLs already
+        completed in the journal are skipped and not yielded again.
+        """
+        url_queue = queue.Queue(maxsize=queue_size)
+        result_queue = queue.Queue()
+        done = object()
+        stop = threading.Event()
+        
+        def discover():
+            try:
+                count = 0
+                for url in self.iter_resort_urls(max_pages):
+                    if stop.is_set():
+                        break
+                    if self.journal and self.journal.is_completed(url):
+                        continue
+                    count += 1
+                    # Blocks while the queue is full so discovery never runs far ahead
+                    url_queue.put(url)
+                    if limit and count >= limit:
+                        print(f"⚠️ Reached resort limit ({limit})")
+                        break
+            finally:
+                for _ in range(self.max_workers):
+                    url_queue.put(done)
+        
+        def work():
+            while True:
+                url = url_queue.get()
+                if url is done:
+                    break
+                if not stop.is_set():
+                    result_queue.put(self.scrape_resort_details(url))
+            result_queue.put(done)
         
-        print(f"🎿 Total unique USA resort URLs discovered: {len(resort_urls)}")
-        return resort_urls
+        threads = [threading.Thread(target=discover, daemon=True)]
+        threads += [threading.Thread(target=work, daemon=True) for _ in range(self.max_workers)]
+        for thread in threads:
+            thread.start()
+        
+        try:
+            finished = 0
+            while finished < self.max_workers:
+                resort = result_queue.get()
+                if resort is done:
+                    finished += 1
+                elif resort:
+                    yield resort
+        finally:
+            # Consumer stopped early: let the workers drain without scraping
+            stop.set()
+    
+    def scan_listing_page(self, content: Union[bytes, str], current_page: int) -> Tuple[Set[str], bool]:
+        """Parse only the anchors of a listing page; return (resort URLs, has next page)"""
+        resort_urls = set()
+        next_page = False
+        
+        for href, text in parse_links(content, self.parser_backend):
+            resort_url = self._resort_url_from_href(href)
+            if resort_url:
+                resort_urls.add(resort_url)
+            if not next_page and self._is_next_page_link(href, text, current_page):
+                next_page = True
+        
+        return resort_urls, next_page
     
-    def extract_resort_urls_from_page(self, soup: BeautifulSoup) -> Set[str]:
+    def extract_resort_urls_from_page(self, soup: Union[PageContext, BeautifulSoup]) -> Set[str]:
         """Extract resort URLs from a single page"""
         resort_urls = set()
         
         # Look for links to ski resorts - they can be either relative or absolute
-        links = soup.find_all('a', href=True)
+        links = PageContext.of(soup).links
         
-        for link in links:
-            href = link.get('href', '')
-            
-            # Check both relative and absolute URL patterns
-            is_ski_resort_link = (
-                href.startswith('/ski-resort/') or 
-                'skiresort.info/ski-resort/' in href
-            )
-            
-            if not is_ski_resort_link:
-                continue
-            
-            # Skip sub-pages (we only want main resort pages)
-            if any(subpage in href for subpage in ['/test-report/', '/snow-report/', '/webcams/', '/trail-map/', '/photos/']):
-                continue
-            
-            # Must end with / or be a clean resort name
-            if not (href.endswith('/') or re.match(r'.*/ski-resort/[a-zA-Z0-9-]+$', href)):
-                continue
-            
-            # Convert to full URL if it's relative
-            if href.startswith('/'):
-                full_url = 'https://www.skiresort.info' + href
-            else:
-                full_url = href
-                
-            resort_urls.add(full_url)
+        for href, _ in links:
+            resort_url = self._resort_url_from_href(href)
+            if resort_url:
+                resort_urls.add(resort_url)
         
         return resort_urls
     
-    def has_next_page(self, soup: BeautifulSoup, current_page: int) -> bool:
+    def _resort_url_from_href(self, href: str) -> Optional[str]:
+        """Full resort URL if href links to a main resort page, else None"""
+        # Check both relative and absolute URL patterns
+        is_ski_resort_link = (
+            href.startswith('/ski-resort/') or 
+            'skiresort.info/ski-resort/' in href
+        )
+        
+        if not is_ski_resort_link:
+            return None
+        
+        # Skip sub-pages (we only want main resort pages)
+        if any(subpage in href for subpage in RESORT_SUBPAGES):
+            return None
+        
+        # Must end with / or be a clean resort name
+        if not (href.endswith('/') or CLEAN_RESORT_PATH.match(href)):
+            return None
+        
+        # One spelling per resort: absolute, https, www, trailing slash
+        return canonical_resort_url(href, self.BASE_URL)
+    
+    def has_next_page(self, soup: Union[PageContext, BeautifulSoup], current_page: int) -> bool:
         """Check if there's a next page"""
+        links = PageContext.of(soup).links
+        return any(self._is_next_page_link(href, text, current_page) for href, text in links)
+    
+    def _is_next_page_link(self, href: str, text: str, current_page: int) -> bool:
+        """Check whether a listing-page link points to the next page"""
         # Look for next page links
         next_indicators = [
             f'page/{current_page + 1}/',
             '›', '»', 'Next'
         ]
-        
-        links = soup.find_all('a', href=True)
-        for link in links:
-            href = link.get('href', '')
-            text = link.get_text(strip=True)
-            
-            if any(indicator in href or indicator in text for indicator in next_indicators):
-                return True
-        
-        return False
+        return any(indicator in href or indicator in text for indicator in next_indicators)
     
     def scrape_resort_details(self, resort_url: str) -> Optional[DetailedUSASkiResort]:
         """Scrape detailed information from a single resort page"""
         try:
             print(f"🎿 Scraping: {resort_url}")
             
-            response = self.session.get(resort_url)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extract resort name
-            name = self.extract_resort_name(soup)
-            if not name:
+            response = self.fetch_response(resort_url)
+            if self.archive is not None:
+                self.archive.store(resort_url, response.content)
+            resort = self.parse_resort_page(response.content, resort_url)
+            self._record_resort(resort)
+            if not resort:
                 print(f"❌ Could not extract resort name from {resort_url}")
+                if self.journal:
+                    self.journal.record_failure(resort_url, "could not extract resort name")
                 return None
             
-            # Extract all details
-            resort_data = {
-                'name': name,
-                'state': self.extract_state(soup, resort_url),
-                'city': self.extract_city(soup),
-                'rating': self.extract_rating(soup),
-                'elevation_base': self.extract_elevation_base(soup),
-                'elevation_top': self.extract_elevation_top(soup),
-                'vertical_drop': self.extract_vertical_drop(soup),
-                'slopes_total_km': self.extract_slopes_total(soup),
-                'slopes_easy_km': self.extract_slopes_easy(soup),
-                'slopes_intermediate_km': self.extract_slopes_intermediate(soup),
-                'slopes_difficult_km': self.extract_slopes_difficult(soup),
-                'lifts_total': self.extract_lifts_total(soup),
-                'day_pass_price': self.extract_day_pass_price(soup),
-                'season_start': self.extract_season_start(soup),
-                'season_end': self.extract_season_end(soup),
-                'website': self.extract_website(soup),
-                'description': self.extract_description(soup),
-                'skiable_acres': self.extract_skiable_acres(soup),
-                'resort_url': resort_url
-            }
-            
-            resort = DetailedUSASkiResort(**resort_data)
-            
-            print(f"✅ {name} ({resort.state}) - Rating: {resort.rating or 'N/A'}/5")
+            print(f"✅ {resort.name} ({resort.state}) - Rating: {resort.rating or 'N/A'}/5")
+            if self.journal:
+                self.journal.record_success(resort_url, resort.to_dict())
+            if self.seen_index is not None:
+                self.seen_index.add(resort_url)
+            if self.fingerprints is not None:
+                self.fingerprints.update(resort_url, response)
             return resort
             
         except Exception as e:
             print(f"❌ Error scraping {resort_url}: {e}")
+            if self.metrics is not None:
+                self.metrics.inc('resorts_total', outcome='failed')
+            if self.journal:
+                self.journal.record_failure(resort_url, str(e))
             return None
     
-    def extract_resort_name(self, soup: BeautifulSoup) -> Optional[str]:
+    def parse_resort_page(self, content: Union[bytes, str], resort_url: str) -> Optional[DetailedUSASkiResort]:
+        """Parse a fetched resort page into a DetailedUSASkiResort (no network)"""
+        start = time.perf_counter()
+        if self.parse_pool:
+            resort = self.parse_pool.parse(content, resort_url)
+            if self.metrics is not None:
+                # Tree building and extraction together, plus the trip to the worker
+                self.metrics.observe('parse_seconds', time.perf_counter() - start, where='process')
+            return resort
+        page = parse_page(content, self.parser_backend)
+        if self.metrics is not None:
+            self.metrics.observe('parse_seconds', time.perf_counter() - start, where='inline')
+        return self.extract_resort(page, resort_url)
+    
+    def parse_resort_pages(self, pages: Iterable[Tuple[str, Union[bytes, str]]]) -> Iterator[Optional[DetailedUSASkiResort]]:
+        """Parse many (url, content) pages, across the parse pool if there is one"""
+        if self.parse_pool:
+            return self.parse_pool.map(pages)
+        return (self.parse_resort_page(content, url) for url, content in pages)
+    
+    def _record_resort(self, resort: Optional[DetailedUSASkiResort]):
+        """Count a parsed resort page and the fields found on it"""
+        if self.metrics is None:
+            return
+        self.metrics.inc('resorts_total', outcome='ok' if resort else 'failed')
+        if resort:
+            for field in INSTRUMENTED_FIELDS:
+                if getattr(resort, field) is not None:
+                    self.metrics.inc('field_hits_total', field=field)
+    
+    def _extract(self, field: str, extractor, *args):
+        """Call one extractor, timing it when metrics are enabled"""
+        if self.metrics is None:
+            return extractor(*args)
+        start = time.perf_counter()
+        try:
+            return extractor(*args)
+        finally:
+            self.metrics.observe('extract_seconds', time.perf_counter() - start, field=field)
+    
+    def collect_metrics(self):
+        """Copy session-level totals (retries, cache, connections, rates) into the metrics"""
+        if self.metrics is None:
+            return
+        self.metrics.set_total('retries_total', self.session.retries)
+        if self.cache:
+            self.metrics.set_total('cache_responses_total', self.session.hits, result='hit')
+            self.metrics.set_total('cache_responses_total', self.session.revalidated, result='revalidated')
+            self.metrics.set_total('cache_responses_total', self.session.misses, result='miss')
+        transport = self.transport_stats.as_dict()
+        self.metrics.set_total('connections_total', transport['connections'])
+        self.metrics.set_total('wire_bytes_total', transport['wire_bytes'])
+        for host, rate in self.rate_limiter.rates().items():
+            self.metrics.set('request_rate', rate, host=host)
+    
+    def print_request_stats(self):
+        """Report retries and, in adaptive mode, the rate each host settled at"""
+        print(self.transport_stats.summary())
+        print(f"🚦 {self.session.retries} requests retried")
+        if self.rate_limiter.adaptive:
+            for host, rate in self.rate_limiter.rates().items():
+                print(f"  • {host}: {rate:.2f} requests/s")
+        if self.metrics is not None:
+            self.collect_metrics()
+            self.metrics.print_summary(INSTRUMENTED_FIELDS)
+    
+    def close(self):
+        """Shut down the parse pool and close the archive and seen indexes, if any"""
+        if self.parse_pool:
+            self.parse_pool.close()
+        if self.archive is not None:
+            self.archive.close()
+        if self.seen_index is not None:
+            self.seen_index.close()
+    
+    def extract_resort(self, soup: Union[PageContext, BeautifulSoup], resort_url: str) -> Optional[DetailedUSASkiResort]:
+        """Run every field extractor over one parsed page"""
+        # Flatten the document once and share it between all extractors
+        page = PageContext.of(soup)
+        
+        # Extract resort name
+        name = self._extract('name', self.extract_resort_name, page)
+        if not name:
+            return None
+        
+        # Extract all details
+        if self.combined_field_scan:
+            resort_data = {
+                'name': name,
+                'state': self._extract('state', self.extract_state, page, resort_url),
+                **self._extract('combined_scan', scan_fields, page.text),
+                'website': self._extract('website', self.extract_website, page),
+                'description': self._extract('description', self.extract_description, page),
+                'resort_url': resort_url
+            }
+            return DetailedUSASkiResort(**resort_data)
+        
+        resort_data = {
+            'name': name,
+            'state': self._extract('state', self.extract_state, page, resort_url),
+            'city': self._extract('city', self.extract_city, page),
+            'rating': self._extract('rating', self.extract_rating, page),
+            'elevation_base': self._extract('elevation_base', self.extract_elevation_base, page),
+            'elevation_top': self._extract('elevation_top', self.extract_elevation_top, page),
+            'vertical_drop': self._extract('vertical_drop', self.extract_vertical_drop, page),
+            'slopes_total_km': self._extract('slopes_total_km', self.extract_slopes_total, page),
+            'slopes_easy_km': self._extract('slopes_easy_km', self.extract_slopes_easy, page),
+            'slopes_intermediate_km': self._extract('slopes_intermediate_km', self.extract_slopes_intermediate, page),
+            'slopes_difficult_km': self._extract('slopes_difficult_km', self.extract_slopes_difficult, page),
+            'lifts_total': self._extract('lifts_total', self.extract_lifts_total, page),
+            'day_pass_price': self._extract('day_pass_price', self.extract_day_pass_price, page),
+            'season_start': self._extract('season_start', self.extract_season_start, page),
+            'season_end': self._extract('season_end', self.extract_season_end, page),
+            'website': self._extract('website', self.extract_website, page),
+            'description': self._extract('description', self.extract_description, page),
+            'skiable_acres': self._extract('skiable_acres', self.extract_skiable_acres, page),
+            'resort_url': resort_url
+        }
+        
+        return DetailedUSASkiResort(**resort_data)
+    
+    def extract_resort_name(self, soup: Union[PageContext, BeautifulSoup]) -> Optional[str]:
         """Extract resort name"""
         # Try h1 tag first
-        h1 = soup.find('h1')
-        if h1:
-            name = h1.get_text(strip=True)
+        name = PageContext.of(soup).heading
+        if name:
             # Remove "Ski resort" prefix if present
-            name = re.sub(r'^Ski resort\\s+', '', name)
+            name = SKI_RESORT_PREFIX.sub('', name)
             return name
         return None
     
-    def extract_state(self, soup: BeautifulSoup, url: str) -> Optional[str]:
+    def extract_state(self, soup: Union[PageContext, BeautifulSoup], url: str) -> Optional[str]:
         """Extract state information"""
-        text = soup.get_text()
-        
-        # Common US states that have ski resorts
-        us_states = [
-            'Alaska', 'California', 'Colorado', 'Connecticut', 'Idaho', 'Illinois',
-            'Maine', 'Massachusetts', 'Michigan', 'Minnesota', 'Montana', 'Nevada',
-            'New Hampshire', 'New Mexico', 'New York', 'North Carolina', 'Oregon', 
-            'Pennsylvania', 'Rhode Island', 'South Dakota', 'Tennessee', 'Utah', 
-            'Vermont', 'Virginia', 'Washington', 'West Virginia', 'Wisconsin', 'Wyoming'
-        ]
+        text = PageContext.of(soup).text
         
         # Look for state in breadcrumb or location info
-        for state in us_states:
+        for state in US_STATES:
             if f'/{state.lower()}/' in url or state in text:
                 return state
         
         return None
     
-    def extract_city(self, soup: BeautifulSoup) -> Optional[str]:
+    def extract_city(self, soup: Union[PageContext, BeautifulSoup]) -> Optional[str]:
         """Extract city information"""
-        # Look for city in location breadcrumb or specific selectors
-        breadcrumb_text = soup.get_text()
-        
-        # Try to extract from common patterns
-        city_patterns = [
-            r'›\\s*([A-Za-z\\s]+)\\s*›\\s*USA',
-            r'City:\\s*([A-Za-z\\s]+)',
-            r'Location:\\s*([A-Za-z\\s]+)'
-        ]
-        
-        for pattern in city_patterns:
-            match = re.search(pattern, breadcrumb_text)
-            if match:
-                city = match.group(1).strip()
-                if len(city) > 1 and city != 'USA':
-                    return city
-        
-        return None
+        return match_field(PageContext.of(soup).text, 'city')
     
-    def extract_rating(self, soup: BeautifulSoup) -> Optional[float]:
+    def extract_rating(self, soup: Union[PageContext, BeautifulSoup]) -> Optional[float]:
         """Extract rating"""
-        text = soup.get_text()
-        
-        rating_patterns = [
-            r'(\\d+\\.\\d+)\\s+out of\\s+\\d+\\s+stars?',
-            r'Test report\\s+(\\d+\\.\\d+)\\s+out of\\s+\\d+',
-            r'Rating:\\s*(\\d+\\.\\d+)',
-            r'(\\d+\\.\\d+)\\s*/\\s*5'
-        ]
-        
-        for pattern in rating_patterns:
-            match = re.search(pattern, text)
-            if match:
-                return float(match.group(1))
-        
-        return None
+        return match_field(PageContext.of(soup).text, 'rating')
     
-    def extract_elevation_base(self, soup: BeautifulSoup) -> Optional[int]:
+    def extract_elevation_base(self, soup: Union[PageContext, BeautifulSoup]) -> Optional[int]:
         """Extract base elevation in meters"""
-        text = soup.get_text()
-        
-        # Look for elevation patterns
-        elevation_patterns = [
-            r'(\\d+)\\s*m\\s*[-–]\\s*\\d+\\s*m',  # "800 m - 2000 m"
-            r'Base:\\s*(\\d+)\\s*m',
-            r'Valley station:\\s*(\\d+)\\s*m'
-        ]
-        
-        for pattern in elevation_patterns:
-            match = re.search(pattern, text)
-            if match:
-                return int(match.group(1))
-        
-        return None
+        return match_field(PageContext.of(soup).text, 'elevation_base')
     
-    def extract_elevation_top(self, soup: BeautifulSoup) -> Optional[int]:
+    def extract_elevation_top(self, soup: Union[PageContext, BeautifulSoup]) -> Optional[int]:
         """Extract top elevation in meters"""
-        text = soup.get_text()
-        
-        elevation_patterns = [
-            r'\\d+\\s*m\\s*[-–]\\s*(\\d+)\\s*m',  # "800 m - 2000 m"
-            r'Top:\\s*(\\d+)\\s*m',
-            r'Summit:\\s*(\\d+)\\s*m',
-            r'Mountain station:\\s*(\\d+)\\s*m'
-        ]
-        
-        for pattern in elevation_patterns:
-            match = re.search(pattern, text)
-            if match:
-                return int(match.group(1))
-        
-        return None
+        return match_field(PageContext.of(soup).text, 'elevation_top')
     
-    def extract_vertical_drop(self, soup: BeautifulSoup) -> Optional[int]:
+    def extract_vertical_drop(self, soup: Union[PageContext, BeautifulSoup]) -> Optional[int]:
         """Extract vertical drop"""
-        text = soup.get_text()
-        
-        patterns = [
-            r'Difference\\s+(\\d+)\\s*m',
-            r'Vertical\\s*drop:\\s*(\\d+)\\s*m',
-            r'\\((\\d+)\\s*m\\s*difference\\)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text)
-            if match:
-                return int(match.group(1))
-        
-        return None
+        return match_field(PageContext.of(soup).text, 'vertical_drop')
     
-    def extract_slopes_total(self, soup: BeautifulSoup) -> Optional[float]:
+    def extract_slopes_total(self, soup: Union[PageContext, BeautifulSoup]) -> Optional[float]:
         """Extract total slopes in km"""
-        text = soup.get_text()
-        
-        patterns = [
-            r'Total:\\s*(\\d+(?:\\.\\d+)?)\\s*km',
-            r'Slopes:\\s*(\\d+(?:\\.\\d+)?)\\s*km',
-            r'Pistes:\\s*(\\d+(?:\\.\\d+)?)\\s*km'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text)
-            if match:
-                return float(match.group(1))
-        
-        return None
+        return match_field(PageContext.of(soup).text, 'slopes_total_km')
     
-    def extract_slopes_easy(self, soup: BeautifulSoup) -> Optional[float]:
+    def extract_slopes_easy(self, soup: Union[PageContext, BeautifulSoup]) -> Optional[float]:
         """Extract easy slopes"""
         return self._extract_slope_difficulty(soup, 'easy')
     
-    def extract_slopes_intermediate(self, soup: BeautifulSoup) -> Optional[float]:
+    def extract_slopes_intermediate(self, soup: Union[PageContext, BeautifulSoup]) -> Optional[float]:
         """Extract intermediate slopes"""
         return self._extract_slope_difficulty(soup, 'intermediate')
     
-    def extract_slopes_difficult(self, soup: BeautifulSoup) -> Optional[float]:
+    def extract_slopes_difficult(self, soup: Union[PageContext, BeautifulSoup]) -> Optional[float]:
         """Extract difficult slopes"""
         return self._extract_slope_difficulty(soup, 'difficult')
     
-    def _extract_slope_difficulty(self, soup: BeautifulSoup, difficulty: str) -> Optional[float]:
+    def _extract_slope_difficulty(self, soup: Union[PageContext, BeautifulSoup], difficulty: str) -> Optional[float]:
         """Helper to extract slope difficulty"""
-        text = soup.get_text()
-        
-        patterns = [
-            rf'{difficulty.capitalize()}\\s*(\\d+(?:\\.\\d+)?)\\s*km',
-            rf'{difficulty}:\\s*(\\d+(?:\\.\\d+)?)\\s*km'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return float(match.group(1))
-        
-        return None
+        return match_field(PageContext.of(soup).text, f'slopes_{difficulty}_km')
     
-    def extract_lifts_total(self, soup: BeautifulSoup) -> Optional[int]:
+    def extract_lifts_total(self, soup: Union[PageContext, BeautifulSoup]) -> Optional[int]:
         """Extract total lifts"""
-        text = soup.get_text()
-        
-        patterns = [
-            r'(\\d+)\\s+ski lifts?',
-            r'Total lifts?:\\s*(\\d+)',
-            r'Lifts?:\\s*(\\d+)',
-            r'(\\d+)\\s+lifts?'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text)
-            if match:
-                return int(match.group(1))
-        
-        return None
+        return match_field(PageContext.of(soup).text, 'lifts_total')
     
-    def extract_day_pass_price(self, soup: BeautifulSoup) -> Optional[str]:
+    def extract_day_pass_price(self, soup: Union[PageContext, BeautifulSoup]) -> Optional[str]:
         """Extract day pass price"""
-        text = soup.get_text()
-        
-        patterns = [
-            r'US\\$\\s*(\\d+(?:[\\.,]\\d{2})?)',
-            r'\\$\\s*(\\d+(?:[\\.,]\\d{2})?)',
-            r'Day pass:\\s*US\\$\\s*(\\d+(?:[\\.,]\\d{2})?)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text)
-            if match:
-                return f"US${match.group(1)}"
-        
-        return None
+        return match_field(PageContext.of(soup).text, 'day_pass_price')
     
-    def extract_season_start(self, soup: BeautifulSoup) -> Optional[str]:
+    def extract_season_start(self, soup: Union[PageContext, BeautifulSoup]) -> Optional[str]:
         """Extract season start"""
-        text = soup.get_text()
-        
-        patterns = [
-            r'Season:\\s*(\\w+\\s+\\d{4})',
-            r'Opens?:\\s*(\\w+)',
-            r'Opening:\\s*(\\w+)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text)
-            if match:
-                return match.group(1)
-        
-        return None
+        return match_field(PageContext.of(soup).text, 'season_start')
     
-    def extract_season_end(self, soup: BeautifulSoup) -> Optional[str]:
+    def extract_season_end(self, soup: Union[PageContext, BeautifulSoup]) -> Optional[str]:
         """Extract season end"""
-        text = soup.get_text()
-        
-        patterns = [
-            r'Closes?:\\s*(\\w+)',
-            r'Closing:\\s*(\\w+)',
-            r'Until:\\s*(\\w+)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text)
-            if match:
-                return match.group(1)
-        
-        return None
+        return match_field(PageContext.of(soup).text, 'season_end')
     
-    def extract_website(self, soup: BeautifulSoup) -> Optional[str]:
+    def extract_website(self, soup: Union[PageContext, BeautifulSoup]) -> Optional[str]:
         """Extract official website"""
         # Look for external links that might be the official website
-        links = soup.find_all('a', href=True)
+        links = PageContext.of(soup).links
         
-        for link in links:
-            href = link.get('href')
+        for href, _ in links:
             if (href and href.startswith('http') and 
                 'skiresort.info' not in href and
                 any(word in href.lower() for word in ['ski', 'resort', 'mountain'])):
@@ -453,87 +599,176 @@ class ImprovedUSASkiResortScraper:
         
         return None
     
-    def extract_description(self, soup: BeautifulSoup) -> Optional[str]:
+    def extract_description(self, soup: Union[PageContext, BeautifulSoup]) -> Optional[str]:
         """Extract resort description"""
         # Look for meta description
-        meta_desc = soup.find('meta', {'name': 'description'})
-        if meta_desc and meta_desc.get('content'):
-            desc = meta_desc['content'].strip()
+        content = PageContext.of(soup).meta_description
+        if content:
+            desc = content.strip()
             if len(desc) > 20:
                 return desc
         
         return None
     
-    def extract_skiable_acres(self, soup: BeautifulSoup) -> Optional[int]:
+    def extract_skiable_acres(self, soup: Union[PageContext, BeautifulSoup]) -> Optional[int]:
         """Extract skiable acres"""
-        text = soup.get_text()
-        
-        patterns = [
-            r'(\\d+(?:,\\d+)?)\\s*acres?',
-            r'Skiable area:\\s*(\\d+(?:,\\d+)?)\\s*acres?'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text)
-            if match:
-                acres_str = match.group(1).replace(',', '')
-                return int(acres_str)
-        
-        return None
+        return match_field(PageContext.of(soup).text, 'skiable_acres')
     
     def scrape_batch_of_resorts(self, resort_urls: List[str], start_idx: int = 0, batch_size: int = 50) -> List[DetailedUSASkiResort]:
         """Scrape a batch of resorts"""
         print(f"\\n🎿 Scraping batch: resorts {start_idx + 1} to {min(start_idx + batch_size, len(resort_urls))}")
         print("=" * 80)
         
+        batch_urls = resort_urls[start_idx:start_idx + batch_size]
+        if self.journal:
+            pending = self.journal.pending(batch_urls)
+            if len(pending) < len(batch_urls):
+                print(f"⏭️ Skipping {len(batch_urls) - len(pending)} resorts already in the journal")
+            batch_urls = pending
+        if self.max_workers > 1:
+            return self.scrape_resorts_concurrently(batch_urls)
+        
         resorts = []
         
-        for i, url in enumerate(resort_urls[start_idx:start_idx + batch_size], start=start_idx + 1):
+        # Rate limiting happens per request in the session
+        for i, url in enumerate(batch_urls, start=start_idx + 1):
             print(f"[{i}/{len(resort_urls)}] ", end="")
             
             resort = self.scrape_resort_details(url)
             if resort:
                 resorts.append(resort)
-            
-            # Rate limiting
-            if i < len(resort_urls):
-                time.sleep(self.delay)
         
         return resorts
     
-    def save_results(self, resorts: List[DetailedUSASkiResort], filename: str):
-        """Save results to JSON file"""
-        resort_dicts = [asdict(resort) for resort in resorts]
+    def scrape_resorts_concurrently(self, resort_urls: List[str]) -> List[DetailedUSASkiResort]:
+        """Scrape resorts on max_workers threads sharing the session and rate limiter
+        
+        Each worker fetches and parses its own pages, so parsing overlaps with
+        other workers' network waits and throughput is bound by the per-host
+        rate limit. Results keep the order of resort_urls.
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(self.scrape_resort_details, resort_urls))
+        return [resort for resort in results if resort]
+    
+    def refresh_resort(self, resort_url: str) -> Tuple[str, Optional[DetailedUSASkiResort]]:
+        """Conditionally re-fetch one resort and re-parse it only if the page changed
+        
+        Returns ('unchanged', None), ('changed', resort) or ('failed', None).
+        """
+        try:
+            response = self.fetch_response(resort_url, self.fingerprints.conditional_headers(resort_url))
+        except Exception as e:
+            print(f"❌ Error refreshing {resort_url}: {e}")
+            return 'failed', None
+        
+        if self.fingerprints.is_unchanged(resort_url, response):
+            self.fingerprints.update(resort_url, response)
+            # A 304 has no body, but an identical 200 can still fill a gap in the archive
+            if self.archive is not None and response.status_code == 200:
+                self.archive.store(resort_url, response.content)
+            return 'unchanged', None
+        
+        print(f"🎿 Re-scraping: {resort_url}")
+        if self.archive is not None:
+            self.archive.store(resort_url, response.content)
+        resort = self.parse_resort_page(response.content, resort_url)
+        self._record_resort(resort)
+        if not resort:
+            print(f"❌ Could not extract resort name from {resort_url}")
+            return 'failed', None
+        self.fingerprints.update(resort_url, response)
+        print(f"✅ {resort.name} ({resort.state}) - Rating: {resort.rating or 'N/A'}/5")
+        return 'changed', resort
+    
+    def incremental_update(self, previous: List[DetailedUSASkiResort], max_pages: int = None,
+                           prune_removed: bool = False) -> Tuple[List[DetailedUSASkiResort], Dict[str, int]]:
+        """Re-crawl against a previous dataset, fetching only new or changed resorts
+        
+        The listing pages are always walked to diff the URL set. URLs not in
+        previous are scraped in full; known URLs are re-fetched conditionally
+        (see refresh_resort) and keep their previous record when the page is
+        unchanged or fails to refresh. Resorts no longer listed are kept
+        unless prune_removed is set, since a max_pages crawl only sees part
+        of the listing. The seen index is not applied here: every listed
+        URL is diffed against previous. Requires self.fingerprints.
+        """
+        # Older datasets may hold other spellings of the same URL
+        known = {canonical_resort_url(resort.resort_url, self.BASE_URL) or resort.resort_url: resort
+                 for resort in previous}
+        discovered = list(self.iter_resort_urls(max_pages, skip_seen=False))
+        discovered_set = set(discovered)
+        
+        new_urls = [url for url in discovered if url not in known]
+        known_urls = [url for url in discovered if url in known]
+        removed_urls = [url for url in known if url not in discovered_set]
+        print(f"\n🔁 Incremental crawl: {len(new_urls)} new, {len(known_urls)} to revalidate, "
+              f"{len(removed_urls)} no longer listed")
+        
+        stats = {'new': 0, 'changed': 0, 'unchanged': 0, 'failed': 0, 'removed': 0}
+        
+        # Known resorts: conditional re-fetch, parse only what changed
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            refreshed = list(executor.map(self.refresh_resort, known_urls))
+        for url, (status, resort) in zip(known_urls, refreshed):
+            stats[status] += 1
+            if resort:
+                known[url] = resort
+        
+        # New resorts: full scrape
+        for resort in self.scrape_resorts_concurrently(new_urls):
+            known[resort.resort_url] = resort
+            stats['new'] += 1
+        stats['failed'] += len(new_urls) - stats['new']
+        
+        if prune_removed:
+            for url in removed_urls:
+                del known[url]
+                self.fingerprints.discard(url)
+            stats['removed'] = len(removed_urls)
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(resort_dicts, f, indent=2, ensure_ascii=False)
+        return list(known.values()), stats
+    
+    def iter_results(self, filename: str) -> Iterator[DetailedUSASkiResort]:
+        """Lazily read a dataset written by save_results (.json or .jsonl)"""
+        for resort in iter_resort_records(filename):
+            yield DetailedUSASkiResort(**resort)
+    
+    def load_results(self, filename: str) -> List[DetailedUSASkiResort]:
+        """Load a dataset written by save_results"""
+        return list(self.iter_results(filename))
+    
+    def save_results(self, resorts: Iterable[DetailedUSASkiResort], filename: str):
+        """Stream results to a JSON (or .jsonl) file, one record at a time"""
+        write_resorts(resorts, filename)
         
         print(f"\\n📁 Results saved to '{filename}'")
-        self.show_summary_stats(resorts)
+        self.show_summary_stats(self.iter_results(filename))
     
-    def show_summary_stats(self, resorts: List[DetailedUSASkiResort]):
-        """Show summary statistics"""
-        print(f"\\n📊 Dataset Summary:")
-        print(f"  📍 Total resorts: {len(resorts)}")
+    def show_summary_stats(self, resorts: Iterable[DetailedUSASkiResort]):
+        """Show summary statistics (vectorized over columns when numpy is installed)"""
+        if numpy_available():
+            print_summary(summarize(ResortColumns.from_records(resorts)))
+            return
         
         # Count by state
+        total = 0
         states = {}
         ratings = []
         prices = []
         
         for resort in resorts:
+            total += 1
             if resort.state:
                 states[resort.state] = states.get(resort.state, 0) + 1
             if resort.rating:
                 ratings.append(resort.rating)
-            if resort.day_pass_price and 'US$' in resort.day_pass_price:
-                try:
-                    price_match = re.search(r'US\\$(\\d+(?:\\.\\d+)?)', resort.day_pass_price)
-                    if price_match:
-                        prices.append(float(price_match.group(1)))
-                except:
-                    pass
+            price = parse_price(resort.day_pass_price)
+            if price is not None:
+                prices.append(price)
         
+        print(f"\\n📊 Dataset Summary:")
+        print(f"  📍 Total resorts: {total}")
         print(f"  🌍 States covered: {len(states)}")
         print(f"  ⭐ Resorts with ratings: {len(ratings)}")
         if ratings:
@@ -547,48 +782,166 @@ class ImprovedUSASkiResortScraper:
             for state, count in sorted(states.items(), key=lambda x: x[1], reverse=True)[:5]:
                 print(f"    • {state}: {count} resorts")
 
-def main():
+def export_dataset_columns(dataset_path: str):
+    """Columnar export stage: numeric fields as typed .npy columns next to the dataset"""
+    directory = default_columns_dir(dataset_path)
+    columns = export_columns(dataset_path, directory)
+    print(f"📦 {columns.rows} resorts exported as columns to '{directory}'")
+
+def main(argv: List[str] = None):
     """Main function"""
+    parser = argparse.ArgumentParser(description="Comprehensive USA ski resort scraper")
+    parser.add_argument('--workers', type=int, default=1,
+                        help='resort pages fetched and parsed concurrently (default: 1)')
+    parser.add_argument('--rps', type=float, default=None,
+                        help='max requests per second per host (default: 1 / delay)')
+    parser.add_argument('--delay', type=float, default=2.0,
+                        help='seconds between requests when --rps is not given (default: 2.0)')
+    parser.add_argument('--adaptive', action='store_true',
+                        help='adapt the request rate to latency and errors instead of keeping it fixed')
+    parser.add_argument('--max-rps', type=float, default=None,
+                        help='with --adaptive, ceiling for the request rate (default: twice the starting rate)')
+    parser.add_argument('--retries', type=int, default=3,
+                        help='retries per request on errors, timeouts, 429 and 5xx (default: 3)')
+    parser.add_argument('--http2', action='store_true',
+                        help='fetch https pages over HTTP/2 (needs httpx[http2])')
+    parser.add_argument('--parser', choices=PARSER_BACKENDS, default=DEFAULT_BACKEND,
+                        help=f'HTML parser backend (default: {DEFAULT_BACKEND})')
+    parser.add_argument('--parse-processes', type=int, default=0,
+                        help='parse pages in this many worker processes (default: 0, parse in the fetch threads)')
+    parser.add_argument('--cache-dir', default=None,
+                        help='cache responses on disk here and revalidate them on re-runs')
+    parser.add_argument('--cache-ttl', type=float, default=None,
+                        help='seconds a cached page is served without revalidation')
+    parser.add_argument('--cache-max-mb', type=float, default=None,
+                        help='evict least recently used cache entries beyond this size')
+    parser.add_argument('--archive', default='html_archive',
+                        help='keep the raw HTML of every resort page here for reparse.py (\'\' to disable)')
+    parser.add_argument('--offline', action='store_true',
+                        help='serve only from --cache-dir, never touch the network')
+    parser.add_argument('--journal', default='detailed_usa_ski_resorts.journal.jsonl',
+                        help='checkpoint journal; a restarted crawl skips completed resorts')
+    parser.add_argument('--fresh', action='store_true',
+                        help='discard the checkpoint journal and the seen index and crawl everything again')
+    parser.add_argument('--seen-index', default=SEEN_INDEX_FILE,
+                        help=f'resort URLs scraped by earlier runs, shared with dataset_builder.py; '
+                             f'discovery skips them (default: {SEEN_INDEX_FILE}, \'\' to disable)')
+    parser.add_argument('--stream-output', default='detailed_usa_ski_resorts.jsonl',
+                        help='JSONL file each resort is appended to as soon as it is scraped')
+    parser.add_argument('--columns', action='store_true',
+                        help='also export numeric fields as memory-mappable NumPy columns (needs numpy)')
+    parser.add_argument('--fingerprints', default='detailed_usa_ski_resorts.fingerprints.json',
+                        help='per-page content hashes and validators used by --incremental')
+    parser.add_argument('--incremental', action='store_true',
+                        help='update the existing dataset: scrape new resorts, re-parse only changed pages')
+    parser.add_argument('--prune-removed', action='store_true',
+                        help='with --incremental, drop resorts that are no longer listed')
+    parser.add_argument('--max-pages', type=int, default=15,
+                        help='max USA listing pages to walk (default: 15, ~11 pages total)')
+    parser.add_argument('--metrics', default=None,
+                        help='write crawl metrics here: Prometheus text for .prom, JSON otherwise')
+    parser.add_argument('--limit', type=int, default=40,
+                        help='max resorts to scrape, 0 for no limit (default: 40, for testing)')
+    args = parser.parse_args(argv)
+    if args.http2 and not http2_available():
+        parser.error("--http2 requires httpx with HTTP/2 support (pip install 'httpx[http2]')")
+    if args.max_rps is not None and not args.adaptive:
+        parser.error('--max-rps requires --adaptive')
+    if args.offline and not args.cache_dir:
+        parser.error('--offline requires --cache-dir')
+    if args.parser not in available_backends():
+        parser.error(f"parser backend '{args.parser}' is not installed")
+    if args.columns and not numpy_available():
+        parser.error('--columns requires numpy')
+    if args.incremental and not os.path.exists(OUTPUT_FILE):
+        parser.error(f"--incremental needs an existing '{OUTPUT_FILE}' to update")
+    
     print("🇺🇸 Comprehensive USA Ski Resort Scraper v2.0")
     print("=" * 60)
     print("Phase 1: Discover all resort URLs")
     print("Phase 2: Scrape detailed data from each resort")
+    print("(both phases run as one pipeline: resorts are scraped as listing pages arrive)")
     print("=" * 60)
     
-    scraper = ImprovedUSASkiResortScraper(delay_between_requests=2.0)
-    
-    # Phase 1: Discover all resort URLs (limit for testing)
-    print("\\n🔍 Phase 1: Discovering resort URLs...")
-    resort_urls = scraper.discover_all_resort_urls(max_pages=15)  # Get all USA pages (~11 pages total)
-    
-    if not resort_urls:
-        print("❌ No resort URLs found")
-        return
-    
-    resort_urls_list = list(resort_urls)
-    print(f"\\n🎿 Found {len(resort_urls_list)} unique resort URLs")
-    
-    # Phase 2: Scrape detailed data (limit for testing)
-    print("\\n📊 Phase 2: Scraping detailed resort data...")
-    
-    all_resorts = []
-    batch_size = 100  # Process efficiently
-    
-    # Process in batches
-    for start_idx in range(0, min(len(resort_urls_list), 40), batch_size):  # Limit to 40 resorts for testing
-        batch_resorts = scraper.scrape_batch_of_resorts(resort_urls_list, start_idx, batch_size)
-        all_resorts.extend(batch_resorts)
-        
-        print(f"\\n✅ Batch complete. Total resorts so far: {len(all_resorts)}")
-    
-    # Save results
-    if all_resorts:
-        scraper.save_results(all_resorts, "detailed_usa_ski_resorts.json")
+    cache = None
+    if args.cache_dir:
+        max_bytes = int(args.cache_max_mb * 1024 * 1024) if args.cache_max_mb else None
+        cache = HttpCache(args.cache_dir, ttl=args.cache_ttl, max_bytes=max_bytes, offline=args.offline)
+    
+    # Incremental runs diff every listed URL, so they never reset the index
+    seen_index = SeenUrlIndex(args.seen_index, fresh=args.fresh and not args.incremental) if args.seen_index else None
+    fingerprints = FingerprintStore(args.fingerprints)
+    scraper = ImprovedUSASkiResortScraper(delay_between_requests=args.delay,
+                                          max_workers=args.workers,
+                                          requests_per_second=args.rps,
+                                          adaptive=args.adaptive,
+                                          max_requests_per_second=args.max_rps,
+                                          max_retries=args.retries,
+                                          http2=args.http2,
+                                          metrics=CrawlMetrics(),
+                                          cache=cache,
+                                          journal=None if args.incremental else CrawlJournal(args.journal, fresh=args.fresh),
+                                          parser_backend=args.parser,
+                                          fingerprints=fingerprints,
+                                          parse_processes=args.parse_processes,
+                                          archive=HtmlArchive(args.archive) if args.archive else None,
+                                          seen_index=seen_index)
+    
+    if args.incremental:
+        previous = scraper.load_results(OUTPUT_FILE)
+        all_resorts, stats = scraper.incremental_update(previous, max_pages=args.max_pages,
+                                                        prune_removed=args.prune_removed)
+        scraper.close()
+        scraper.print_request_stats()
+        if args.metrics:
+            scraper.metrics.write(args.metrics)
+            print(f"📟 Metrics written to '{args.metrics}'")
+        fingerprints.save()
+        print(f"\n🔁 {stats['new']} new, {stats['changed']} changed, {stats['unchanged']} unchanged, "
+              f"{stats['failed']} failed, {stats['removed']} removed")
+        scraper.save_results(all_resorts, OUTPUT_FILE)
+        if args.columns:
+            export_dataset_columns(OUTPUT_FILE)
+        return len(all_resorts)
+    
+    resumed = len(scraper.journal.completed_urls())
+    if resumed:
+        print(f"\n⏭️ Resuming: {resumed} resorts already completed, "
+              f"{len(scraper.journal.failed_urls())} failed ones will be retried")
+    
+    print("\n🔍 Discovering and scraping resorts...")
+    
+    # Each resort is appended to the live JSONL as soon as it is scraped
+    scraped = 0
+    with JsonlWriter(args.stream_output, append=bool(resumed)) as live:
+        for resort in scraper.stream_resorts(max_pages=args.max_pages, limit=args.limit):
+            live.write(resort)
+            scraped += 1
+            
+            if scraped % 10 == 0:
+                print(f"\n✅ Total resorts so far: {scraped}")
+    
+    # The journal holds this run's resorts plus everything from earlier runs
+    scraper.close()
+    scraper.print_request_stats()
+    if args.metrics:
+        scraper.metrics.write(args.metrics)
+        print(f"📟 Metrics written to '{args.metrics}'")
+    scraper.journal.close()
+    fingerprints.save()
+    total = len(scraper.journal.completed_urls())
+    
+    # Save results, streamed from the journal rather than held in memory
+    if total:
+        scraper.save_results((DetailedUSASkiResort(**resort) for resort in scraper.journal.iter_resorts()),
+                             OUTPUT_FILE)
+        if args.columns:
+            export_dataset_columns(OUTPUT_FILE)
         print("\\n🎉 Scraping completed successfully!")
     else:
         print("❌ No resort data was collected")
     
-    return all_resorts
+    return total
 
 if __name__ == "__main__":
     results = main()
\ No newline at end of file
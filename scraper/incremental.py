@@ -0,0 +1,84 @@
+"""
+Page fingerprints for incremental re-crawls
+
+FingerprintStore remembers, per resort URL, the SHA-256 of the page body
+and its ETag / Last-Modified validators. An incremental run sends the
+validators as conditional request headers and compares body hashes, so
+only new or changed resort pages are re-parsed; everything else is
+carried over from the previous dataset.
+
+The store is a single JSON file kept next to the dataset:
+
+    {"https://...": {"sha256": "...", "etag": "...", "last_modified": "...", "checked_at": 0.0}}
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+import requests
+
+
+class FingerprintStore:
+    """Per-URL content hash and HTTP validators, persisted as JSON"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fingerprints: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                self._fingerprints = json.load(f)
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    def get(self, url: str) -> Optional[Dict]:
+        return self._fingerprints.get(url)
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since headers for url's last known version"""
+        fingerprint = self.get(url)
+        headers = {}
+        if fingerprint:
+            if fingerprint.get('etag'):
+                headers['If-None-Match'] = fingerprint['etag']
+            if fingerprint.get('last_modified'):
+                headers['If-Modified-Since'] = fingerprint['last_modified']
+        return headers
+
+    def is_unchanged(self, url: str, response: requests.Response) -> bool:
+        """True if response is a 304 or its body hashes to the stored fingerprint"""
+        fingerprint = self.get(url)
+        if not fingerprint:
+            return False
+        if response.status_code == 304:
+            return True
+        return hashlib.sha256(response.content).hexdigest() == fingerprint['sha256']
+
+    def update(self, url: str, response: requests.Response):
+        """Record the fingerprint of a freshly fetched page (a 304 only refreshes checked_at)"""
+        with self._lock:
+            if response.status_code == 304 and url in self._fingerprints:
+                self._fingerprints[url]['checked_at'] = time.time()
+                return
+            self._fingerprints[url] = {
+                'sha256': hashlib.sha256(response.content).hexdigest(),
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'checked_at': time.time(),
+            }
+
+    def discard(self, url: str):
+        with self._lock:
+            self._fingerprints.pop(url, None)
+
+    def save(self):
+        with self._lock:
+            tmp_path = f'{self.path}.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._fingerprints, f, indent=2)
+            os.replace(tmp_path, self.path)
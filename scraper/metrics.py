@@ -0,0 +1,233 @@
+"""
+Crawl instrumentation: counters, gauges and timings with JSON and Prometheus export
+
+The scraper records into a CrawlMetrics when given one (metrics=...):
+
+    fetch_seconds               per request, labelled by source (network/cache)
+    fetch_bytes_total           decoded page bytes, by source
+    fetches_total               by source and outcome (ok/error)
+    listing_pages_total         by outcome
+    parse_seconds               HTML tree building (or the round trip to a parse process)
+    extract_seconds             per field extractor (in-process parsing only)
+    field_hits_total            per field, pages where the field was found
+    resorts_total               by outcome (ok/failed)
+
+plus totals copied from the session at the end of a run (retries, cache
+responses, connections, wire bytes; counters) and the per-host request
+rate (a gauge). Every metric can carry labels:
+
+    metrics = CrawlMetrics()
+    with metrics.time('parse_seconds'):
+        ...
+    metrics.inc('field_hits_total', field='rating')
+    metrics.write('crawl.prom')          # or crawl.json
+"""
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Tuple
+
+# Prefix for every metric in the Prometheus export
+PROMETHEUS_PREFIX = 'skiresort_crawl_'
+
+HELP = {
+    'fetch_seconds': 'Time to fetch one page, including retries',
+    'fetch_bytes_total': 'Decoded bytes of fetched pages',
+    'fetches_total': 'Page fetches',
+    'listing_pages_total': 'USA listing pages scanned',
+    'parse_seconds': 'Time to build the HTML tree of one resort page',
+    'extract_seconds': 'Time spent in one field extractor for one page',
+    'field_hits_total': 'Resort pages on which the field was found',
+    'resorts_total': 'Resort pages scraped',
+    'retries_total': 'Requests retried after an error, timeout, 429 or 5xx',
+    'cache_responses_total': 'Responses answered by the HTTP cache',
+    'connections_total': 'Network connections opened',
+    'wire_bytes_total': 'Bytes received on the wire (before decompression)',
+    'request_rate': 'Current request rate per host (requests/second)',
+}
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, object]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+class Timing:
+    """Count, sum, min and max of observed durations"""
+
+    __slots__ = ('count', 'total', 'min', 'max')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+
+    def add(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        return {'count': self.count, 'sum': self.total, 'mean': self.mean,
+                'min': self.min if self.count else 0.0, 'max': self.max}
+
+
+class CrawlMetrics:
+    """Thread-safe registry of labelled counters, gauges and timings"""
+
+    def __init__(self):
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._gauges: Dict[str, Dict[LabelKey, float]] = {}
+        self._timings: Dict[str, Dict[LabelKey, Timing]] = {}
+        self._lock = threading.Lock()
+        self.started = time.time()
+
+    def inc(self, name: str, value: float = 1, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def set(self, name: str, value: float, **labels):
+        with self._lock:
+            self._gauges.setdefault(name, {})[_label_key(labels)] = value
+
+    def set_total(self, name: str, value: float, **labels):
+        """Set a counter to a running total kept elsewhere (e.g. the session's retries)"""
+        with self._lock:
+            self._counters.setdefault(name, {})[_label_key(labels)] = value
+
+    def observe(self, name: str, seconds: float, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            series = self._timings.setdefault(name, {})
+            timing = series.get(key)
+            if timing is None:
+                timing = series[key] = Timing()
+            timing.add(seconds)
+
+    @contextmanager
+    def time(self, name: str, **labels) -> Iterator[None]:
+        """Observe the duration of the with-block (also when it raises)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def counter(self, name: str, **labels) -> float:
+        with self._lock:
+            return self._counters.get(name, {}).get(_label_key(labels), 0)
+
+    def counters(self, name: str) -> Dict[LabelKey, float]:
+        """Every labelled value of a counter"""
+        with self._lock:
+            return dict(self._counters.get(name, {}))
+
+    def timings(self, name: str) -> Dict[LabelKey, Timing]:
+        with self._lock:
+            return dict(self._timings.get(name, {}))
+
+    def as_dict(self) -> Dict:
+        """{'counters'|'gauges'|'timings': {name: [{'labels': {...}, 'value'|...}]}}"""
+        def samples(registry, value):
+            return {name: [{'labels': dict(key), **value(item)} for key, item in sorted(series.items())]
+                    for name, series in sorted(registry.items())}
+
+        with self._lock:
+            return {
+                'started': self.started,
+                'elapsed_seconds': time.time() - self.started,
+                'counters': samples(self._counters, lambda v: {'value': v}),
+                'gauges': samples(self._gauges, lambda v: {'value': v}),
+                'timings': samples(self._timings, Timing.as_dict),
+            }
+
+    def to_json(self) -> str:
+        return json.dumps(self.as_dict(), indent=2)
+
+    def to_prometheus(self) -> str:
+        """Prometheus text exposition format; timings become summaries (_count/_sum)"""
+        lines: List[str] = []
+
+        def header(name, kind):
+            metric = PROMETHEUS_PREFIX + name
+            lines.append(f"# HELP {metric} {HELP.get(name, name.replace('_', ' '))}")
+            lines.append(f"# TYPE {metric} {kind}")
+            return metric
+
+        def labels(key, suffix=''):
+            if not key:
+                return suffix
+            pairs = ','.join(f'{name}="{_escape(value)}"' for name, value in key)
+            return f'{suffix}{{{pairs}}}'
+
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                metric = header(name, 'counter')
+                lines += [f"{metric}{labels(key)} {_number(value)}" for key, value in sorted(series.items())]
+            for name, series in sorted(self._gauges.items()):
+                metric = header(name, 'gauge')
+                lines += [f"{metric}{labels(key)} {_number(value)}" for key, value in sorted(series.items())]
+            for name, series in sorted(self._timings.items()):
+                metric = header(name, 'summary')
+                for key, timing in sorted(series.items()):
+                    lines.append(f"{metric}_count{labels(key)} {timing.count}")
+                    lines.append(f"{metric}_sum{labels(key)} {_number(timing.total)}")
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path: str):
+        """Write the metrics to path: Prometheus text for .prom/.txt, JSON otherwise"""
+        text = self.to_prometheus() if path.endswith(('.prom', '.txt')) else self.to_json()
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+    def print_summary(self, fields: List[str] = None):
+        """Where the crawl time went, slowest extractors first, and field hit rates"""
+        print("\n⏱️ Crawl metrics:")
+        for key, timing in sorted(self.timings('fetch_seconds').items()):
+            source = dict(key).get('source', 'all')
+            fetched = sum(value for series_key, value in self.counters('fetch_bytes_total').items()
+                          if dict(series_key).get('source') == source)
+            print(f"  🌐 {timing.count} {source} fetches: {timing.total:.1f}s total, "
+                  f"{timing.mean * 1000:.0f} ms mean, {timing.max * 1000:.0f} ms max, {fetched / 1024:.0f} KB")
+        for timing in self.timings('parse_seconds').values():
+            print(f"  🧱 {timing.count} pages parsed: {timing.total:.2f}s total, {timing.mean * 1000:.1f} ms mean")
+
+        extractors = sorted(((dict(key)['field'], timing) for key, timing in self.timings('extract_seconds').items()),
+                            key=lambda item: item[1].total, reverse=True)
+        if extractors:
+            print("  🔬 Extractors (slowest first):")
+            for field, timing in extractors:
+                print(f"    • {field:<24}{timing.total * 1000:>9.1f} ms{timing.mean * 1e6:>9.0f} µs/page")
+
+        pages = self.counter('resorts_total', outcome='ok')
+        if pages:
+            hits = {dict(key)['field']: value for key, value in self.counters('field_hits_total').items()}
+            print(f"  🎯 Field hit rates over {pages:.0f} resorts:")
+            for field in sorted(fields or hits, key=lambda field: hits.get(field, 0)):
+                rate = hits.get(field, 0) / pages
+                flag = '  ⚠️ never matched' if not hits.get(field) else ''
+                print(f"    • {field:<24}{rate:>6.0%}{flag}")
+
+        for name in ('retries_total', 'cache_responses_total', 'connections_total'):
+            for key, value in sorted(self.counters(name).items()):
+                label = ', '.join(f"{k}={v}" for k, v in key)
+                print(f"  📟 {name}{f' ({label})' if label else ''}: {_number(value)}")
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
@@ -0,0 +1,80 @@
+"""
+Per-page extraction context for the ski resort scrapers
+
+Parsing a resort page used to walk the full document once per field
+extractor (every extractor called soup.get_text() or soup.find_all()).
+PageContext flattens the document text and the anchor list once and is
+handed to every extractor instead.
+
+PageContext wraps a BeautifulSoup tree; other parser backends (see
+html_backends.py) subclass it and override the _compute_* methods, so
+extractors only ever see text, links, heading and meta_description.
+"""
+
+from typing import List, Optional, Tuple, Union
+from bs4 import BeautifulSoup
+
+
+class PageContext:
+    """Flattened, lazily computed view of a single parsed page"""
+
+    __slots__ = ('soup', '_text', '_links', '_heading', '_meta_description')
+
+    def __init__(self, soup: Optional[BeautifulSoup]):
+        self.soup = soup
+        self._text: Optional[str] = None
+        self._links: Optional[List[Tuple[str, str]]] = None
+        self._heading: Optional[str] = None
+        self._meta_description: Optional[str] = None
+
+    @classmethod
+    def of(cls, page: Union['PageContext', BeautifulSoup]) -> 'PageContext':
+        """Return page unchanged if it is already a context, otherwise wrap it"""
+        if isinstance(page, PageContext):
+            return page
+        return cls(page)
+
+    @property
+    def text(self) -> str:
+        """Full document text (one tree walk per page)"""
+        if self._text is None:
+            self._text = self._compute_text()
+        return self._text
+
+    @property
+    def links(self) -> List[Tuple[str, str]]:
+        """(href, stripped anchor text) for every <a href> in document order"""
+        if self._links is None:
+            self._links = self._compute_links()
+        return self._links
+
+    @property
+    def heading(self) -> str:
+        """Stripped text of the first <h1>, or '' if the page has none"""
+        if self._heading is None:
+            self._heading = self._compute_heading()
+        return self._heading
+
+    @property
+    def meta_description(self) -> str:
+        """Content of <meta name="description">, or '' if missing"""
+        if self._meta_description is None:
+            self._meta_description = self._compute_meta_description()
+        return self._meta_description
+
+    def _compute_text(self) -> str:
+        return self.soup.get_text()
+
+    def _compute_links(self) -> List[Tuple[str, str]]:
+        return [
+            (link.get('href', ''), link.get_text(strip=True))
+            for link in self.soup.find_all('a', href=True)
+        ]
+
+    def _compute_heading(self) -> str:
+        h1 = self.soup.find('h1')
+        return h1.get_text(strip=True) if h1 else ''
+
+    def _compute_meta_description(self) -> str:
+        meta_desc = self.soup.find('meta', {'name': 'description'})
+        return (meta_desc.get('content') or '') if meta_desc else ''
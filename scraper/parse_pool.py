@@ -0,0 +1,101 @@
+"""
+Process pool for CPU-bound resort page parsing
+
+Fetching is I/O-bound and runs on threads, but tree building and the
+field regexes hold the GIL, so parsing on threads never uses more than
+one core. ParsePool ships the fetched HTML bytes to worker processes,
+each with its own ImprovedUSASkiResortScraper, and only the parsed
+record's field values (a small tuple) come back to the parent.
+
+    with ParsePool(processes=4) as pool:
+        resort = pool.parse(content, url)              # one page, blocking
+        for resort in pool.map(pages):                 # (url, content) pairs
+            ...
+
+Workers are started with the 'spawn' method: the scraper parent runs
+discovery and fetch threads, which fork() would copy mid-flight.
+"""
+
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+# Per-process scraper, created by _init_worker
+_worker_scraper = None
+
+
+def _init_worker(parser_backend: str, combined_field_scan: bool):
+    global _worker_scraper
+    from improved_usa_scraper import ImprovedUSASkiResortScraper
+    _worker_scraper = ImprovedUSASkiResortScraper(delay_between_requests=0,
+                                                  combined_field_scan=combined_field_scan,
+                                                  parser_backend=parser_backend)
+
+
+def _parse_in_worker(page: Tuple[str, Union[bytes, str]]) -> Optional[tuple]:
+    """Parse one (url, content) page; the record comes back as a tuple of field values"""
+    url, content = page
+    resort = _worker_scraper.parse_resort_page(content, url)
+    if resort is None:
+        return None
+    return tuple(getattr(resort, name) for name in resort.__slots__)
+
+
+def _parse_chunk_in_worker(pages: List[Tuple[str, Union[bytes, str]]]) -> List[Optional[tuple]]:
+    return [_parse_in_worker(page) for page in pages]
+
+
+def _to_resort(values: Optional[tuple]):
+    from improved_usa_scraper import DetailedUSASkiResort
+    return DetailedUSASkiResort(*values) if values is not None else None
+
+
+class ParsePool:
+    """Runs ImprovedUSASkiResortScraper.parse_resort_page in worker processes"""
+
+    def __init__(self, processes: int = None, parser_backend: str = None, combined_field_scan: bool = False):
+        from html_backends import DEFAULT_BACKEND
+        self.processes = processes or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(parser_backend or DEFAULT_BACKEND, combined_field_scan),
+        )
+
+    def parse(self, content: Union[bytes, str], url: str):
+        """Parse one page in a worker and wait for the DetailedUSASkiResort (or None)
+
+        Safe to call from many threads at once; each call occupies one worker.
+        """
+        return _to_resort(self._executor.submit(_parse_in_worker, (url, content)).result())
+
+    def map(self, pages: Iterable[Tuple[str, Union[bytes, str]]], chunksize: int = 8) -> Iterator:
+        """Parse (url, content) pairs across all workers, yielding results in input order
+
+        pages is consumed lazily: at most two chunks per worker are in
+        flight, so a large corpus is never all held in memory at once.
+        """
+        in_flight = deque()
+        pages = iter(pages)
+        while True:
+            chunk = list(islice(pages, chunksize))
+            if chunk:
+                in_flight.append(self._executor.submit(_parse_chunk_in_worker, chunk))
+            if in_flight and (not chunk or len(in_flight) >= 2 * self.processes):
+                for values in in_flight.popleft().result():
+                    yield _to_resort(values)
+            if not chunk and not in_flight:
+                return
+
+    def close(self):
+        self._executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
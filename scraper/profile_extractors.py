@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Profiler: where does field extraction spend its time?
+
+Runs every extract_* method of ImprovedUSASkiResortScraper individually
+over a corpus of resort pages (the saved fixtures, or the crawler's HTML
+archive) and prints three ranked tables:
+
+  * extractors - total and per-page wall time of each extractor on an
+                 already flattened page, its hit rate, and which document
+                 walks (PageContext text/links/heading/meta) it triggers
+                 on a fresh page
+  * walks      - how many times each page is walked and what that costs
+  * patterns   - every regex in field_patterns in the order match_field
+                 tries them: how often it is reached and matches, time per
+                 search, and ns per character scanned (the whole text on a
+                 miss, up to the match on a hit). Python's re does not
+                 expose backtracking steps; a high ns/char is the symptom.
+
+--save writes the numbers as JSON; --compare checks a run against a
+saved one and exits non-zero if an extractor got slower than --tolerance.
+
+Usage:
+    python3 profile_extractors.py [fixture_dir] [--archive DIR] [--pages N] [--rounds N]
+                                  [--parser BACKEND] [--save FILE] [--compare FILE] [--tolerance F]
+"""
+
+import argparse
+import inspect
+import json
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Tuple
+
+from bench_extraction import FIXTURE_DIR, load_fixtures
+from field_patterns import FIELD_SPECS
+from html_backends import DEFAULT_BACKEND, PARSER_BACKENDS, available_backends, parse_page
+from improved_usa_scraper import ImprovedUSASkiResortScraper
+from page_context import PageContext
+
+# extract_* methods that are not per-field resort page extractors
+NOT_FIELD_EXTRACTORS = {'extract_resort', 'extract_resort_urls_from_page'}
+# PageContext computations that walk the whole document
+WALKS = ('_compute_text', '_compute_links', '_compute_heading', '_compute_meta_description')
+
+
+def extractors(scraper: ImprovedUSASkiResortScraper) -> List[Tuple[str, Callable, bool]]:
+    """(name, bound method, takes the url) for every field extractor, in source order"""
+    found = []
+    for name, method in inspect.getmembers(scraper, inspect.ismethod):
+        if name.startswith('extract_') and name not in NOT_FIELD_EXTRACTORS:
+            takes_url = 'url' in inspect.signature(method).parameters
+            found.append((name, method, takes_url))
+    return sorted(found, key=lambda item: inspect.getsourcelines(item[1])[1])
+
+
+@contextmanager
+def record_walks(context_class: type):
+    """Count and time every PageContext walk on context_class, per current owner"""
+    calls: Dict[Tuple[str, str], int] = defaultdict(int)
+    seconds: Dict[str, float] = defaultdict(float)
+    state = {'owner': None}
+    originals = {name: getattr(context_class, name) for name in WALKS}
+    own = {name for name in WALKS if name in vars(context_class)}
+
+    def wrap(name, original):
+        def walk(self):
+            start = time.perf_counter()
+            try:
+                return original(self)
+            finally:
+                seconds[name] += time.perf_counter() - start
+                calls[(state['owner'], name)] += 1
+        return walk
+
+    for name, original in originals.items():
+        setattr(context_class, name, wrap(name, original))
+    try:
+        yield state, calls, seconds
+    finally:
+        for name, original in originals.items():
+            if name in own:
+                setattr(context_class, name, original)
+            else:
+                # Inherited from PageContext: drop the override again
+                delattr(context_class, name)
+
+
+def best_time(run: Callable[[], object], rounds: int, min_seconds: float = 0.005) -> float:
+    """Seconds per run() call: the fastest of rounds batches, each long enough to time reliably"""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        if time.perf_counter() - start >= min_seconds:
+            break
+        number *= 2
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def warm(page: PageContext):
+    """Flatten a page completely so extractor timings exclude the walks"""
+    page.text, page.links, page.heading, page.meta_description
+
+
+def profile_extractors(scraper, corpus: List[Tuple[str, bytes]], parser_backend: str, rounds: int) -> Dict:
+    methods = extractors(scraper)
+
+    # Fresh pages, extractors in order: which extractor pays for which walk
+    fresh = [(url, parse_page(content, parser_backend)) for url, content in corpus]
+    context_class = type(fresh[0][1])
+    with record_walks(context_class) as (state, walk_calls, walk_seconds):
+        for url, page in fresh:
+            for name, method, takes_url in methods:
+                state['owner'] = name
+                method(page, url) if takes_url else method(page)
+
+    pages = fresh
+    for _, page in pages:
+        warm(page)
+
+    rows = []
+    for name, method, takes_url in methods:
+        hits = sum((method(page, url) if takes_url else method(page)) is not None for url, page in pages)
+        if takes_url:
+            elapsed = best_time(lambda: [method(page, url) for url, page in pages], rounds)
+        else:
+            elapsed = best_time(lambda: [method(page) for _, page in pages], rounds)
+        walks = {walk[len('_compute_'):]: count / len(pages)
+                 for (owner, walk), count in walk_calls.items() if owner == name}
+        rows.append({'extractor': name, 'total_ms': elapsed * 1000,
+                     'us_per_page': elapsed * 1e6 / len(pages),
+                     'hit_rate': hits / len(pages), 'walks': walks})
+
+    walks = []
+    for walk in WALKS:
+        count = sum(value for (_, name), value in walk_calls.items() if name == walk)
+        walks.append({'walk': walk[len('_compute_'):], 'per_page': count / len(pages),
+                      'us_per_page': walk_seconds[walk] * 1e6 / len(pages)})
+    return {'extractors': rows, 'walks': walks, 'context_class': context_class.__name__}
+
+
+def profile_patterns(texts: List[str], rounds: int) -> List[Dict]:
+    """Cost of every field pattern, counting only the searches match_field really makes"""
+    rows = []
+    for spec in FIELD_SPECS:
+        # Pages still unresolved when this pattern's turn comes
+        pending = list(range(len(texts)))
+        for priority, pattern in enumerate(spec.patterns):
+            tried = len(pending)
+            hits, scanned = 0, 0
+            still_pending = []
+            searched = [texts[index] for index in pending]
+            seconds = best_time(lambda: [pattern.search(text) for text in searched], rounds) if searched else 0.0
+            for index in pending:
+                text = texts[index]
+                match = pattern.search(text)
+                scanned += match.end() if match else len(text)
+                if match:
+                    hits += 1
+                if not match or spec.value_from(match) is None:
+                    still_pending.append(index)
+            pending = still_pending
+            rows.append({'field': spec.field, 'priority': priority, 'pattern': pattern.pattern,
+                         'tried_rate': tried / len(texts), 'hit_rate': hits / tried if tried else 0.0,
+                         'total_ms': seconds * 1000,
+                         'us_per_search': seconds * 1e6 / tried if tried else 0.0,
+                         'ns_per_char': seconds * 1e9 / scanned if scanned else 0.0})
+    return rows
+
+
+def print_report(report: Dict):
+    pages = report['pages']
+    extraction = sum(row['total_ms'] for row in report['extractors'])
+    print(f"📊 {pages} pages, parser {report['parser']} ({report['context_class']}), {report['rounds']} rounds")
+
+    print(f"\n🔬 Extractors, slowest first (flattened pages; {extraction:.2f} ms per corpus pass):")
+    print(f"  {'extractor':<30}{'total ms':>10}{'µs/page':>10}{'share':>8}{'hits':>7}  walks on a fresh page")
+    for row in sorted(report['extractors'], key=lambda row: row['total_ms'], reverse=True):
+        walks = ', '.join(f"{name} x{count:g}" for name, count in row['walks'].items()) or '-'
+        share = row['total_ms'] / extraction if extraction else 0.0
+        print(f"  {row['extractor']:<30}{row['total_ms']:>10.3f}{row['us_per_page']:>10.1f}"
+              f"{share:>8.0%}{row['hit_rate']:>7.0%}  {walks}")
+
+    print("\n🌳 Document walks:")
+    print(f"  {'walk':<20}{'per page':>10}{'µs/page':>10}")
+    for row in sorted(report['walks'], key=lambda row: row['us_per_page'], reverse=True):
+        print(f"  {row['walk']:<20}{row['per_page']:>10.2f}{row['us_per_page']:>10.1f}")
+
+    print("\n🧵 Regex patterns, most expensive first (searches match_field makes):")
+    print(f"  {'field':<24}{'#':>3}{'tried':>7}{'hits':>7}{'total ms':>10}{'µs/search':>11}{'ns/char':>9}  pattern")
+    for row in sorted(report['patterns'], key=lambda row: row['total_ms'], reverse=True):
+        if not row['tried_rate']:
+            continue
+        print(f"  {row['field']:<24}{row['priority']:>3}{row['tried_rate']:>7.0%}{row['hit_rate']:>7.0%}"
+              f"{row['total_ms']:>10.3f}{row['us_per_search']:>11.1f}{row['ns_per_char']:>9.1f}  {row['pattern']}")
+    unreached = [row for row in report['patterns'] if not row['tried_rate']]
+    if unreached:
+        print(f"  ({len(unreached)} fallback patterns never reached: an earlier pattern always matched)")
+
+
+def compare(report: Dict, baseline: Dict, tolerance: float) -> bool:
+    """Print per-extractor changes against a saved report; False if any regressed beyond tolerance"""
+    if (baseline['pages'], baseline['parser']) != (report['pages'], report['parser']):
+        print(f"⚠️ The baseline used {baseline['pages']} pages with {baseline['parser']}; "
+              f"timings are per page but the corpus differs")
+    before = {row['extractor']: row['us_per_page'] for row in baseline['extractors']}
+    regressions = []
+    print(f"\n📈 Against the baseline (tolerance {tolerance:.0%}):")
+    for row in sorted(report['extractors'], key=lambda row: row['total_ms'], reverse=True):
+        old = before.get(row['extractor'])
+        if not old:
+            print(f"  {row['extractor']:<30}{'new':>10}")
+            continue
+        change = row['us_per_page'] / old - 1
+        flag = ''
+        if change > tolerance:
+            regressions.append(row['extractor'])
+            flag = '  ❌ slower'
+        print(f"  {row['extractor']:<30}{old:>9.1f} → {row['us_per_page']:.1f} µs/page ({change:+.0%}){flag}")
+    if regressions:
+        print(f"❌ {len(regressions)} extractors regressed: {', '.join(regressions)}")
+    else:
+        print("✅ No extractor regressed")
+    return not regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('fixture_dir', nargs='?', default=FIXTURE_DIR)
+    parser.add_argument('--archive', default=None, help='profile over the pages of this HTML archive instead')
+    parser.add_argument('--pages', type=int, default=None,
+                        help='corpus size (fixtures are repeated, an archive is truncated)')
+    parser.add_argument('--rounds', type=int, default=5,
+                        help='timing repetitions; the fastest is reported (default: 5)')
+    parser.add_argument('--parser', choices=PARSER_BACKENDS, default=DEFAULT_BACKEND,
+                        help=f'HTML parser backend (default: {DEFAULT_BACKEND})')
+    parser.add_argument('--save', default=None, help='write the report as JSON')
+    parser.add_argument('--compare', default=None, help='JSON report of an earlier run to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='allowed slowdown per extractor with --compare (default: 0.25)')
+    args = parser.parse_args()
+    if args.parser not in available_backends():
+        parser.error(f"parser backend '{args.parser}' is not installed")
+
+    if args.archive:
+        from html_archive import HtmlArchive
+        with HtmlArchive(args.archive) as archive:
+            urls = archive.urls()[:args.pages] if args.pages else archive.urls()
+            corpus = [(url, archive.read(url)) for url in urls]
+    else:
+        fixtures = load_fixtures(args.fixture_dir)
+        count = args.pages or len(fixtures)
+        corpus = [fixtures[i % len(fixtures)] for i in range(count)] if fixtures else []
+    if not corpus:
+        print(f"❌ No pages found in {args.archive or args.fixture_dir}")
+        return
+
+    scraper = ImprovedUSASkiResortScraper(delay_between_requests=0, parser_backend=args.parser)
+    report = {'pages': len(corpus), 'parser': args.parser, 'rounds': args.rounds}
+    report.update(profile_extractors(scraper, corpus, args.parser, args.rounds))
+    texts = [parse_page(content, args.parser).text for _, content in corpus]
+    report['patterns'] = profile_patterns(texts, args.rounds)
+    print_report(report)
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n📁 Report saved to '{args.save}'")
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if not compare(report, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
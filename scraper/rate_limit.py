@@ -0,0 +1,295 @@
+"""
+Per-host token bucket rate limiting for the ski resort scrapers
+
+Replaces the blind time.sleep(delay) between requests: each host gets a
+token bucket refilled at requests_per_second, and every request takes one
+token before it goes out on the wire (RateLimitedSession), so responses
+served from a cache cost no tokens. Time spent parsing or waiting on the
+network counts towards the next token, so concurrent workers are limited
+by the configured rate rather than by latency.
+
+The session also retries transient failures (connection errors, timeouts,
+429 and 5xx responses) with bounded exponential backoff, honouring
+Retry-After, and with adaptive=True each host's rate is steered by an
+AIMD controller (AdaptiveThrottle): it creeps up while responses are fast
+and clean, and is cut back on 429/5xx, errors or rising latency.
+"""
+
+import email.utils
+import random
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+
+# Responses worth retrying: rate limited, or a server/proxy having a bad moment
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Responses that mean "slow down" to the adaptive throttle
+THROTTLE_STATUSES = frozenset({429, 503})
+
+
+class TokenBucket:
+    """Thread-safe token bucket"""
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def set_rate(self, rate: float):
+        """Change the refill rate, keeping the tokens accrued so far"""
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = rate
+
+    def acquire(self) -> float:
+        """Block until a token is available; return the time spent waiting"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return waited
+                wait = (1.0 - self._tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+    def hold(self, seconds: float):
+        """Hand out no tokens for the next `seconds` (e.g. a Retry-After), then resume at rate"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, 0.0) - seconds * self.rate
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+class AdaptiveThrottle:
+    """AIMD control of one host's TokenBucket rate
+
+    Every clean response adds increase requests/second (up to max_rate)
+    while the smoothed latency stays within latency_factor x the best
+    latency seen (or within latency_margin seconds of it); a throttling
+    status (429/503), a network error or a slow response multiplies the
+    rate by decrease (down to min_rate). Decreases are spaced at least one
+    current request interval apart, so a burst of failures from requests
+    already in flight counts as one congestion signal.
+    """
+
+    def __init__(self, bucket: TokenBucket, min_rate: float, max_rate: float,
+                 increase: float = 0.05, decrease: float = 0.5, latency_factor: float = 2.0,
+                 latency_margin: float = 0.1, smoothing: float = 0.2):
+        self.bucket = bucket
+        self.min_rate = min(min_rate, bucket.rate)
+        self.max_rate = max(max_rate, bucket.rate)
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_factor = latency_factor
+        self.latency_margin = latency_margin
+        self.smoothing = smoothing
+        self.latency: Optional[float] = None
+        self.base_latency: Optional[float] = None
+        self.decreases = 0
+        self._last_decrease = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        return self.bucket.rate
+
+    def record(self, latency: Optional[float], status: Optional[int]):
+        """Feed one outcome: latency in seconds (None on network errors) and HTTP status"""
+        with self._lock:
+            if latency is not None:
+                self.latency = latency if self.latency is None else (
+                    self.smoothing * latency + (1 - self.smoothing) * self.latency)
+                if self.base_latency is None or latency < self.base_latency:
+                    self.base_latency = latency
+            congested = (latency is None or status in THROTTLE_STATUSES
+                         or (status is not None and status >= 500)
+                         or self._latency_rising())
+            if congested:
+                self._slow_down()
+            elif self.bucket.rate < self.max_rate:
+                self.bucket.set_rate(min(self.max_rate, self.bucket.rate + self.increase))
+
+    def _latency_rising(self) -> bool:
+        # The margin keeps jitter on millisecond latencies from reading as congestion
+        return self.latency > max(self.latency_factor * self.base_latency,
+                                  self.base_latency + self.latency_margin)
+
+    def _slow_down(self):
+        now = time.monotonic()
+        if now - self._last_decrease < 1.0 / self.bucket.rate:
+            return
+        self._last_decrease = now
+        rate = max(self.min_rate, self.bucket.rate * self.decrease)
+        if rate < self.bucket.rate:
+            self.bucket.set_rate(rate)
+            self.decreases += 1
+        # Judge later latencies against the new conditions, not only the best case
+        if self.latency is not None and self.base_latency is not None:
+            self.base_latency = max(self.base_latency, self.latency / self.latency_factor)
+
+
+class HostRateLimiter:
+    """One TokenBucket per host; requests_per_second=None disables limiting
+
+    With adaptive=True each bucket starts at requests_per_second and an
+    AdaptiveThrottle moves it, in steps of a twentieth of the start rate,
+    between min_requests_per_second (default: an eighth of the start rate)
+    and max_requests_per_second (default: twice it).
+    """
+
+    def __init__(self, requests_per_second: Optional[float], burst: float = 1.0,
+                 adaptive: bool = False, min_requests_per_second: float = None,
+                 max_requests_per_second: float = None):
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.adaptive = adaptive
+        self.min_requests_per_second = min_requests_per_second
+        self.max_requests_per_second = max_requests_per_second
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._throttles: Dict[str, AdaptiveThrottle] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, url: str) -> Optional[TokenBucket]:
+        """Return the bucket for url's host (created on first use)"""
+        if not self.requests_per_second:
+            return None
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.requests_per_second, self.burst)
+                self._buckets[host] = bucket
+                if self.adaptive:
+                    rate = self.requests_per_second
+                    self._throttles[host] = AdaptiveThrottle(
+                        bucket,
+                        increase=rate / 20,
+                        min_rate=self.min_requests_per_second or rate / 8,
+                        max_rate=self.max_requests_per_second or rate * 2)
+            return bucket
+
+    def acquire(self, url: str) -> float:
+        """Wait for permission to request url; return the time spent waiting"""
+        bucket = self.bucket(url)
+        return bucket.acquire() if bucket else 0.0
+
+    def record(self, url: str, latency: Optional[float], status: Optional[int]):
+        """Report a request outcome to the host's AdaptiveThrottle (no-op unless adaptive)"""
+        if self.bucket(url) is None:
+            return
+        throttle = self._throttles.get(urlparse(url).netloc.lower())
+        if throttle:
+            throttle.record(latency, status)
+
+    def hold(self, url: str, seconds: float):
+        """Pause all requests to url's host for seconds"""
+        bucket = self.bucket(url)
+        if bucket:
+            bucket.hold(seconds)
+
+    def rates(self) -> Dict[str, float]:
+        """Current requests/second per host"""
+        with self._lock:
+            return {host: bucket.rate for host, bucket in self._buckets.items()}
+
+
+class RetryPolicy:
+    """Bounded exponential backoff with jitter for idempotent requests"""
+
+    def __init__(self, max_retries: int = 3, backoff: float = 1.0, max_backoff: float = 60.0,
+                 max_retry_after: float = 300.0, statuses=RETRY_STATUSES):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.statuses = statuses
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait before retry number attempt + 1"""
+        delay = min(self.max_backoff, self.backoff * 2 ** attempt)
+        # Half fixed, half random, so concurrent retries spread out but never fire at once
+        return delay / 2 + random.uniform(0, delay / 2)
+
+
+def retry_after_seconds(response: requests.Response) -> Optional[float]:
+    """Seconds asked for by a Retry-After header (delta-seconds or HTTP date), if any"""
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimitedSession(requests.Session):
+    """requests.Session that takes a rate limiter token before every network send
+
+    GET/HEAD requests that fail transiently are retried per retry policy;
+    a Retry-After pauses the whole host, other retries back off only this
+    request. Every attempt's latency and status feed the rate limiter's
+    adaptive throttle. Requests without a timeout get the session's.
+    """
+
+    def __init__(self, rate_limiter: HostRateLimiter, retry: RetryPolicy = None, timeout: float = 30.0):
+        super().__init__()
+        self.rate_limiter = rate_limiter
+        self.retry = retry or RetryPolicy()
+        self.timeout = timeout
+        self.retries = 0
+        self._lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+        retry = self.retry if request.method in ('GET', 'HEAD') else RetryPolicy(max_retries=0)
+        attempt = 0
+        while True:
+            self.rate_limiter.acquire(request.url)
+            start = time.monotonic()
+            try:
+                response = super().send(request, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self.rate_limiter.record(request.url, None, None)
+                if attempt >= retry.max_retries:
+                    raise
+                delay = retry.delay(attempt)
+                print(f"🔁 {type(e).__name__} for {request.url}, retry {attempt + 1}/{retry.max_retries} in {delay:.1f}s")
+            else:
+                self.rate_limiter.record(request.url, time.monotonic() - start, response.status_code)
+                if response.status_code not in retry.statuses or attempt >= retry.max_retries:
+                    return response
+                wait = retry_after_seconds(response)
+                if wait is not None and wait > retry.max_retry_after:
+                    return response
+                response.close()
+                if wait is not None:
+                    # The server asked everyone to wait, not just this request
+                    self.rate_limiter.hold(request.url, wait)
+                    delay = 0.0
+                else:
+                    delay = retry.delay(attempt)
+                print(f"🔁 HTTP {response.status_code} for {request.url}, "
+                      f"retry {attempt + 1}/{retry.max_retries} in {wait if wait is not None else delay:.1f}s")
+            attempt += 1
+            with self._lock:
+                self.retries += 1
+            time.sleep(delay)
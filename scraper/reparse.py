@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Rebuild the resort dataset from the HTML archive, without the network
+
+Runs the current extractors of ImprovedUSASkiResortScraper over every
+page in the archive the crawler keeps (see html_archive.py), in parallel
+worker processes, and streams the records to a fresh dataset. Use it
+after fixing an extractor: a full rebuild takes seconds of CPU instead
+of an hour of rate-limited crawling.
+
+The dataset holds only the archived pages, so --output has no default:
+point it at the crawler's dataset only when the archive covers every
+resort in it.
+
+Usage:
+    python3 reparse.py --output FILE [--archive DIR] [--processes N] [--parser BACKEND] [--columns]
+"""
+
+import argparse
+import os
+import time
+
+from html_archive import HtmlArchive
+from html_backends import DEFAULT_BACKEND, PARSER_BACKENDS, available_backends
+from improved_usa_scraper import ImprovedUSASkiResortScraper, export_dataset_columns
+from columnar import numpy_available
+from resort_stream import write_resorts
+
+
+def reparse(archive: HtmlArchive, output: str, processes: int = 0,
+            parser_backend: str = DEFAULT_BACKEND) -> int:
+    """Re-extract every archived page into output (.json or .jsonl); returns the resort count"""
+    scraper = ImprovedUSASkiResortScraper(delay_between_requests=0, parser_backend=parser_backend,
+                                          parse_processes=processes)
+    failed = []
+
+    def resorts():
+        pages = archive.iter_pages()
+        urls = archive.urls()
+        for url, resort in zip(urls, scraper.parse_resort_pages(pages)):
+            if resort:
+                yield resort
+            else:
+                failed.append(url)
+
+    try:
+        start = time.perf_counter()
+        parsed = write_resorts(resorts(), output)
+        elapsed = time.perf_counter() - start
+    finally:
+        scraper.close()
+
+    print(f"\n♻️ Re-parsed {len(archive)} archived pages in {elapsed:.1f}s "
+          f"({len(archive) / elapsed:.0f} pages/s): {parsed} resorts, {len(failed)} without a resort name")
+    for url in failed[:10]:
+        print(f"  ❌ {url}")
+    print(f"📁 Results saved to '{output}'")
+    scraper.show_summary_stats(scraper.iter_results(output))
+    return parsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--archive', default='html_archive', help='archive written by the crawler')
+    parser.add_argument('--output', required=True,
+                        help='dataset to write (.json or .jsonl); pages missing from the archive are not in it')
+    parser.add_argument('--processes', type=int, default=os.cpu_count() or 1,
+                        help='parse worker processes, 0 to parse in this process (default: CPU count)')
+    parser.add_argument('--parser', choices=PARSER_BACKENDS, default=DEFAULT_BACKEND,
+                        help=f'HTML parser backend (default: {DEFAULT_BACKEND})')
+    parser.add_argument('--columns', action='store_true',
+                        help='also export numeric fields as NumPy columns (needs numpy)')
+    args = parser.parse_args()
+    if args.parser not in available_backends():
+        parser.error(f"parser backend '{args.parser}' is not installed")
+    if args.columns and not numpy_available():
+        parser.error('--columns requires numpy')
+    if not os.path.exists(os.path.join(args.archive, HtmlArchive.INDEX)):
+        parser.error(f"no HTML archive in '{args.archive}' (crawl with --archive first)")
+
+    with HtmlArchive(args.archive) as archive:
+        if not len(archive):
+            print("❌ The archive is empty")
+            return
+        reparse(archive, args.output, args.processes, args.parser)
+    if args.columns:
+        export_dataset_columns(args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Local HTTP query service over the scraped resort dataset
+
+Loads the dataset written by improved_usa_scraper.py (.json or .jsonl)
+once into a ResortStore plus a search index, and answers read-only JSON
+queries from memory:
+
+    GET /resorts?FIELD__OP=VALUE&state=...      filter (see resort_store.py)
+    GET /search?q=TERM[&filters]                name/city/state search (see search_index.py)
+    GET /states                                 states with resort counts
+    GET /states/<state>                         the resorts of one state (Unknown: no state)
+    GET /stats                                  request, cache and dataset counters
+
+/resorts, /search and /states/<state> take limit (default 50, at most
+1000) and offset, and return {"total": N, "offset": ..., "resorts": [...]}. Bad parameters get a
+400 with {"error": ...}.
+
+Responses are kept in an LRU cache keyed by path and sorted query, with
+their gzip encoding and ETags computed once. Clients that accept gzip
+(q > 0) get the pre-compressed body, whose ETag carries a "-gz" suffix.
+A request whose If-None-Match list matches the ETag of the encoding it
+would get (weak comparison, or "*") gets a 304. Connections are kept alive (HTTP/1.1), one thread
+per connection.
+
+Usage:
+    python3 resort_service.py [dataset] [--host HOST] [--port PORT] [--cache-size N]
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+from resort_store import DATASET, UNKNOWN_STATE, ResortStore
+from search_index import SearchIndex, build_search_index
+
+DEFAULT_PORT = 8787
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 1000
+# Bodies smaller than this are sent uncompressed (gzip would not pay off)
+GZIP_MIN_BYTES = 1024
+
+
+class ServiceError(Exception):
+    """A request the service refuses, with the HTTP status to answer"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    gzipped: Optional[bytes]
+    etag: str
+    gzip_etag: str
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """True if an Accept-Encoding header allows gzip (gzip;q=0 refuses it, * counts when gzip is not listed)"""
+    qualities: Dict[str, float] = {}
+    for item in accept_encoding.split(','):
+        coding, *options = item.split(';')
+        quality = 1.0
+        for option in options:
+            name, _, value = option.strip().partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.strip().lower()] = quality
+    for coding in ('gzip', 'x-gzip', '*'):
+        if coding in qualities:
+            return qualities[coding] > 0
+    return False
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of etag against an If-None-Match list (W/ prefixes ignored, * matches anything)"""
+    if if_none_match.strip() == '*':
+        return True
+    opaque = etag[2:] if etag.startswith('W/') else etag
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+class LRUCache:
+    """Thread-safe mapping that evicts the least recently used entry beyond maxsize"""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[object, object]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ResortService:
+    """Answers the service's queries from a ResortStore, caching encoded responses"""
+
+    def __init__(self, store: ResortStore, cache_size: int = 1024):
+        self.store = store
+        self.search_index = SearchIndex(build_search_index(
+            {'id': str(row), 'name': record.get('name'),
+             'location': {'state': record.get('state'), 'city': record.get('city')}}
+            for row, record in enumerate(store.records)
+        ))
+        self.cache = LRUCache(cache_size)
+        self.requests = 0
+        self.started = time.time()
+        self._lock = threading.Lock()
+
+    def respond(self, path: str, params: List[Tuple[str, str]]) -> CachedResponse:
+        """Encoded response for a GET, from the cache when possible; raises ServiceError"""
+        with self._lock:
+            self.requests += 1
+        if path == '/stats':
+            return self.encode(self.stats())
+
+        key = (path, tuple(sorted(params)))
+        response = self.cache.get(key)
+        if response is None:
+            response = self.encode(self.answer(path, dict(params)))
+            self.cache.put(key, response)
+        return response
+
+    @staticmethod
+    def encode(payload) -> CachedResponse:
+        body = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        gzipped = gzip.compress(body, compresslevel=6) if len(body) >= GZIP_MIN_BYTES else None
+        digest = hashlib.sha1(body).hexdigest()[:20]
+        return CachedResponse(body, gzipped, f'"{digest}"', f'"{digest}-gz"')
+
+    def answer(self, path: str, params: Dict[str, str]):
+        if path == '/resorts':
+            return self.page(self.filter_rows(params), params)
+        if path == '/search':
+            if not params.get('q'):
+                raise ServiceError(400, "missing search term (q)")
+            return self.page(self.filter_rows(params), params)
+        if path == '/states':
+            states = [{'state': self.store.records[rows[0]].get('state') or UNKNOWN_STATE, 'count': len(rows)}
+                      for rows in self.store.states.values()]
+            return sorted(states, key=lambda entry: entry['state'])
+        if path.startswith('/states/'):
+            state = unquote(path[len('/states/'):])
+            rows = self.store.states.get(state.lower())
+            if not rows:
+                raise ServiceError(404, f"no resorts in state {state!r}")
+            return self.page(rows, params)
+        raise ServiceError(404, f"unknown endpoint {path}")
+
+    def filter_rows(self, params: Dict[str, str]) -> List[int]:
+        """Rows matching the search term and every field condition, in dataset order"""
+        conditions: Dict[str, object] = {}
+        for name, value in params.items():
+            if name in ('q', 'limit', 'offset'):
+                continue
+            if name == 'state':
+                conditions[name] = value
+                continue
+            try:
+                conditions[name] = float(value)
+            except ValueError:
+                raise ServiceError(400, f"{name} must be a number, got {value!r}")
+        try:
+            rows = self.store.query_rows(**conditions) if conditions else None
+        except ValueError as e:
+            raise ServiceError(400, str(e))
+
+        term = params.get('q', '')
+        if not term:
+            return rows if rows is not None else list(range(len(self.store)))
+        matches = self.search_index.text_docs(term)
+        if rows is None:
+            return matches
+        members = set(rows)
+        return [row for row in matches if row in members]
+
+    def page(self, rows: List[int], params: Dict[str, str]) -> Dict:
+        try:
+            limit = max(min(int(params.get('limit', DEFAULT_LIMIT)), MAX_LIMIT), 0)
+            offset = max(int(params.get('offset', 0)), 0)
+        except ValueError:
+            raise ServiceError(400, "limit and offset must be integers")
+        return {
+            'total': len(rows),
+            'offset': offset,
+            'resorts': [self.store.records[row] for row in rows[offset:offset + limit]],
+        }
+
+    def stats(self) -> Dict:
+        return {
+            'resorts': len(self.store),
+            'requests': self.requests,
+            'cache': {'entries': len(self.cache), 'size': self.cache.maxsize,
+                      'hits': self.cache.hits, 'misses': self.cache.misses},
+            'uptime_seconds': round(time.time() - self.started, 1),
+        }
+
+
+class ResortRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are separate writes; with Nagle on, every keep-alive
+    # response would wait for the client's delayed ACK (~40 ms)
+    disable_nagle_algorithm = True
+    server_version = 'ResortService/1.0'
+    quiet = True
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        path = url.path.rstrip('/') or '/'
+        try:
+            response = self.server.service.respond(path, parse_qsl(url.query))
+        except ServiceError as e:
+            self.send_body(e.status, ResortService.encode({'error': str(e)}))
+            return
+        use_gzip = self.use_gzip(response)
+        etag = response.gzip_etag if use_gzip else response.etag
+        if etag_matches(self.headers.get('If-None-Match', ''), etag):
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Vary', 'Accept-Encoding')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        self.send_body(200, response)
+
+    def use_gzip(self, response: CachedResponse) -> bool:
+        return response.gzipped is not None and accepts_gzip(self.headers.get('Accept-Encoding', ''))
+
+    def send_body(self, status: int, response: CachedResponse):
+        use_gzip = self.use_gzip(response)
+        body = response.gzipped if use_gzip else response.body
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', response.gzip_etag if use_gzip else response.etag)
+        self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        if use_gzip:
+            self.send_header('Content-Encoding', 'gzip')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+
+class ResortHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, address: Tuple[str, int], service: ResortService):
+        super().__init__(address, ResortRequestHandler)
+        self.service = service
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('dataset', nargs='?', default=DATASET, help=f'.json or .jsonl dataset (default: {DATASET})')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--cache-size', type=int, default=1024, help='responses kept in the LRU cache (0 disables it)')
+    parser.add_argument('--verbose', action='store_true', help='log every request')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    service = ResortService(ResortStore.load(args.dataset), cache_size=args.cache_size)
+    ResortRequestHandler.quiet = not args.verbose
+    server = ResortHTTPServer((args.host, args.port), service)
+    print(f"🗄️ Loaded {len(service.store):,} resorts from {args.dataset} "
+          f"in {(time.perf_counter() - start) * 1000:.0f} ms")
+    print(f"🌐 Serving on http://{args.host}:{server.server_address[1]}/ (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n🛑 Stopped")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Vectorized summary statistics over columnar resort data
+
+Works on ResortColumns (see columnar.py) instead of looping over resort
+objects: every statistic is a handful of NumPy passes over whole columns,
+so a 100k-resort dataset summarises in milliseconds.
+
+summarize() returns a JSON-ready report:
+
+    {
+      "total": 40,
+      "group_by": "state",
+      "groups": {"Colorado": {"count": 9, "means": {"rating": 4.1, ...}}, ...},
+      "metrics": {
+        "rating": {"count": 31, "mean": 3.9, "min": 2.1, "max": 4.8,
+                   "percentiles": {"p10": ..., "p50": ..., "p90": ...},
+                   "histogram": {"edges": [...], "counts": [...]}},
+        ...
+      }
+    }
+
+print_summary() renders the console summary the scrapers show after
+saving. Missing values (null masks) are excluded from every statistic.
+
+Usage:
+    python3 resort_stats.py [dataset.json|.jsonl|.columns dir] [--json FILE] [--bins N]
+"""
+
+import argparse
+import json
+import os
+from typing import Dict, Optional, Sequence
+
+from columnar import ResortColumns, load_columns, np, numpy_available
+from resort_stream import iter_resort_records
+
+# Columns summarised, with their console label and unit
+METRICS = {
+    'rating': ('Rating', '/5'),
+    'day_pass_usd': ('Day pass', ' US$'),
+    'elevation_base': ('Base elevation', ' m'),
+    'elevation_top': ('Top elevation', ' m'),
+    'vertical_drop': ('Vertical drop', ' m'),
+    'slopes_total_km': ('Slopes', ' km'),
+    'lifts_total': ('Lifts', ''),
+}
+
+PERCENTILES = (10, 25, 50, 75, 90)
+
+
+def _number(value) -> Optional[float]:
+    """numpy scalar -> JSON number (None for NaN)"""
+    value = float(value)
+    return None if value != value else round(value, 4)
+
+
+def metric_stats(columns: ResortColumns, metric: str, bins: int = 10) -> Dict:
+    """Count, mean, min/max, percentiles and histogram of one column's present values"""
+    values = columns.present(metric)
+    if not len(values):
+        return {'count': 0}
+    percentiles = np.percentile(values, PERCENTILES)
+    counts, edges = np.histogram(values, bins=bins)
+    return {
+        'count': int(len(values)),
+        'mean': _number(values.mean()),
+        'min': _number(values.min()),
+        'max': _number(values.max()),
+        'percentiles': {f'p{p}': _number(v) for p, v in zip(PERCENTILES, percentiles)},
+        'histogram': {'edges': [_number(e) for e in edges], 'counts': counts.tolist()},
+    }
+
+
+def group_stats(columns: ResortColumns, group_by: str, metrics: Sequence[str]) -> Dict[str, Dict]:
+    """Per-category resort counts and metric means, via bincount over the category codes"""
+    codes = columns.values[group_by]
+    names = columns.categories[group_by]
+    grouped = columns.valid[group_by]
+    counts = np.bincount(codes[grouped], minlength=len(names))
+
+    means = {}
+    for metric in metrics:
+        present = grouped & columns.valid[metric]
+        sums = np.bincount(codes[present], weights=columns.values[metric][present], minlength=len(names))
+        present_counts = np.bincount(codes[present], minlength=len(names))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means[metric] = sums / present_counts
+
+    return {
+        name: {
+            'count': int(counts[code]),
+            'means': {metric: _number(means[metric][code]) for metric in metrics},
+        }
+        for code, name in enumerate(names)
+    }
+
+
+def summarize(columns: ResortColumns, group_by: str = 'state', bins: int = 10,
+              metrics: Sequence[str] = tuple(METRICS)) -> Dict:
+    """Machine-readable summary report of a columnar dataset"""
+    return {
+        'total': len(columns),
+        'group_by': group_by,
+        'groups': group_stats(columns, group_by, metrics) if group_by in columns.categories else {},
+        'metrics': {metric: metric_stats(columns, metric, bins) for metric in metrics},
+    }
+
+
+def print_summary(report: Dict, top: int = 5):
+    """Console summary in the scrapers' usual format"""
+    group_label = report['group_by'].replace('_', ' ')
+    groups_label = group_label[:-1] + 'ies' if group_label.endswith('y') else group_label + 's'
+    print("\n📊 Dataset Summary:")
+    print(f"  📍 Total resorts: {report['total']}")
+    print(f"  🌍 {groups_label.capitalize()} covered: {len(report['groups'])}")
+
+    rating = report['metrics'].get('rating', {'count': 0})
+    print(f"  ⭐ Resorts with ratings: {rating['count']}")
+    if rating['count']:
+        print(f"  📈 Average rating: {rating['mean']:.1f}/5")
+    price = report['metrics'].get('day_pass_usd', {'count': 0})
+    if price['count']:
+        print(f"  💰 Average day pass: US${price['mean']:.0f} (median US${price['percentiles']['p50']:.0f})")
+    for metric, (label, unit) in METRICS.items():
+        stats = report['metrics'].get(metric, {'count': 0})
+        if metric in ('rating', 'day_pass_usd') or not stats['count']:
+            continue
+        print(f"  📏 {label}: mean {stats['mean']:.0f}{unit}, "
+              f"p10-p90 {stats['percentiles']['p10']:.0f}-{stats['percentiles']['p90']:.0f}{unit} "
+              f"({stats['count']} resorts)")
+
+    if report['groups']:
+        print(f"  🏔️ Top {top} {groups_label}:")
+        ranked = sorted(report['groups'].items(), key=lambda item: item[1]['count'], reverse=True)
+        for name, group in ranked[:top]:
+            print(f"    • {name}: {group['count']} resorts")
+
+
+def load_any(path: str) -> ResortColumns:
+    """Columns from an exported .columns directory or straight from a .json/.jsonl dataset"""
+    if os.path.isdir(path):
+        return load_columns(path)
+    return ResortColumns.from_records(iter_resort_records(path))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('dataset', nargs='?', default='detailed_usa_ski_resorts.json')
+    parser.add_argument('--json', default=None, help='write the full report to this file')
+    parser.add_argument('--bins', type=int, default=10, help='histogram bins per metric')
+    args = parser.parse_args()
+
+    if not numpy_available():
+        parser.error('resort_stats.py requires numpy')
+    report = summarize(load_any(args.dataset), bins=args.bins)
+    print_summary(report)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\n📁 Report saved to '{args.json}'")
+
+
+if __name__ == "__main__":
+    main()
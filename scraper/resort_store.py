@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+In-memory query engine over the resort dataset with secondary indexes
+
+ResortStore loads the scraper's dataset once (.json array or .jsonl, see
+resort_stream.py) and builds:
+
+  * a hash index on state (case-insensitive; resorts without a state are
+    filed under UNKNOWN_STATE, so state='Unknown' finds them);
+  * a sorted index per numeric field: elevation (elevation_top) and
+    vertical in meters, lifts, acres, price (day pass in US$, see
+    columnar.parse_price) and rating. Resorts without a value are left
+    out of that index.
+
+A compound query is answered without scanning the dataset. Each condition
+is sized with a binary search, then the smallest candidate set is built and
+narrowed by the others. A condition that matches far more rows than are
+left is checked per candidate instead of being expanded:
+
+    store = ResortStore.load('detailed_usa_ski_resorts.json')
+    store.query(state='Utah', vertical__gt=600, price__lt=120)
+    store.count(elevation__gte=2700, rating__gte=4.5)   # meters
+
+Conditions are field=value or field__op=value, with op one of eq, gt,
+gte, lt, lte; "state" only supports equality. Results keep dataset order.
+
+Usage:
+    python3 resort_store.py [dataset] [--state STATE] [--where FIELD__OP=VALUE ...]
+"""
+
+import argparse
+import operator
+from bisect import bisect_left, bisect_right
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from columnar import parse_price
+from resort_stream import iter_resort_records
+
+DATASET = 'detailed_usa_ski_resorts.json'
+# State of resorts whose record has none
+UNKNOWN_STATE = 'Unknown'
+
+# Query field -> function of a dataset record returning the indexed value
+INDEXED_FIELDS: Dict[str, Callable[[Dict], Optional[float]]] = {
+    'elevation': lambda record: record.get('elevation_top'),
+    'vertical': lambda record: record.get('vertical_drop'),
+    'lifts': lambda record: record.get('lifts_total'),
+    'acres': lambda record: record.get('skiable_acres'),
+    'price': lambda record: parse_price(record.get('day_pass_price')),
+    'rating': lambda record: record.get('rating'),
+}
+
+OPERATORS = {
+    'eq': operator.eq,
+    'gt': operator.gt,
+    'gte': operator.ge,
+    'lt': operator.lt,
+    'lte': operator.le,
+}
+
+# Check a condition per candidate instead of expanding its index slice when
+# the slice is this many times larger than the candidates left
+PROBE_RATIO = 8
+
+
+class SortedIndex:
+    """Values of one field in ascending order, with the row each came from"""
+
+    def __init__(self, column: List[Optional[float]]):
+        pairs = sorted((value, row) for row, value in enumerate(column) if value is not None)
+        self.values = [value for value, _ in pairs]
+        self.rows = [row for _, row in pairs]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def bounds(self, op: str, value: float) -> Tuple[int, int]:
+        """Slice of the index matching 'field op value' (two binary searches at most)"""
+        if op == 'eq':
+            return bisect_left(self.values, value), bisect_right(self.values, value)
+        if op == 'gt':
+            return bisect_right(self.values, value), len(self.values)
+        if op == 'gte':
+            return bisect_left(self.values, value), len(self.values)
+        if op == 'lt':
+            return 0, bisect_left(self.values, value)
+        if op == 'lte':
+            return 0, bisect_right(self.values, value)
+        raise ValueError(f"unknown operator {op!r}")
+
+
+def state_key(state: Optional[str]) -> str:
+    """Key of a state in the hash index"""
+    return (state or UNKNOWN_STATE).lower()
+
+
+class ResortStore:
+    """Resort records with a state hash index and sorted numeric indexes"""
+
+    def __init__(self, records: Iterable[Dict]):
+        self.records: List[Dict] = list(records)
+        self.states: Dict[str, List[int]] = {}
+        for row, record in enumerate(self.records):
+            self.states.setdefault(state_key(record.get('state')), []).append(row)
+        self.columns: Dict[str, List[Optional[float]]] = {
+            field: [value(record) for record in self.records] for field, value in INDEXED_FIELDS.items()
+        }
+        self.indexes: Dict[str, SortedIndex] = {field: SortedIndex(column) for field, column in self.columns.items()}
+
+    @classmethod
+    def load(cls, path: str = DATASET) -> 'ResortStore':
+        return cls(iter_resort_records(path))
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def _conditions(self, conditions: Dict[str, object]) -> List[Tuple[str, str, object]]:
+        parsed = []
+        for key, value in conditions.items():
+            field, _, op = key.partition('__')
+            op = op or 'eq'
+            if field == 'state':
+                if op != 'eq':
+                    raise ValueError("state only supports equality")
+            elif field not in INDEXED_FIELDS:
+                raise ValueError(f"unknown field {field!r} (one of state, {', '.join(INDEXED_FIELDS)})")
+            elif op not in OPERATORS:
+                raise ValueError(f"unknown operator {op!r} in {key!r} (one of {', '.join(OPERATORS)})")
+            parsed.append((field, op, value))
+        return parsed
+
+    def query_rows(self, **conditions) -> List[int]:
+        """Row numbers matching every condition, ascending"""
+        if not conditions:
+            return list(range(len(self.records)))
+
+        # (size, field, op, value, rows or index slice), smallest first
+        plans = []
+        for field, op, value in self._conditions(conditions):
+            if field == 'state':
+                rows = self.states.get(state_key(str(value)), [])
+                plans.append((len(rows), field, op, value, rows))
+            else:
+                start, end = self.indexes[field].bounds(op, value)
+                plans.append((end - start, field, op, value, (start, end)))
+        plans.sort(key=lambda plan: plan[0])
+
+        candidates: Optional[Set[int]] = None
+        for size, field, op, value, lookup in plans:
+            if candidates is not None and not candidates:
+                break
+            if candidates is not None and size > PROBE_RATIO * len(candidates):
+                candidates = {row for row in candidates if self._matches(row, field, op, value)}
+                continue
+            rows = lookup if field == 'state' else self.indexes[field].rows[lookup[0]:lookup[1]]
+            candidates = set(rows) if candidates is None else candidates.intersection(rows)
+        return sorted(candidates)
+
+    def _matches(self, row: int, field: str, op: str, value: object) -> bool:
+        if field == 'state':
+            return state_key(self.records[row].get('state')) == state_key(str(value))
+        current = self.columns[field][row]
+        return current is not None and OPERATORS[op](current, value)
+
+    def query(self, **conditions) -> List[Dict]:
+        """Records matching every condition, in dataset order"""
+        return [self.records[row] for row in self.query_rows(**conditions)]
+
+    def count(self, **conditions) -> int:
+        """Number of matching records; a single condition is answered from the index bounds alone"""
+        if len(conditions) == 1:
+            (field, op, value), = self._conditions(conditions)
+            if field == 'state':
+                return len(self.states.get(state_key(str(value)), []))
+            start, end = self.indexes[field].bounds(op, value)
+            return end - start
+        return len(self.query_rows(**conditions))
+
+
+def _parse_condition(spec: str) -> Tuple[str, float]:
+    key, _, value = spec.partition('=')
+    if not value:
+        raise argparse.ArgumentTypeError(f"expected FIELD__OP=VALUE, got {spec!r}")
+    return key, float(value)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('dataset', nargs='?', default=DATASET, help=f'.json or .jsonl dataset (default: {DATASET})')
+    parser.add_argument('--state', help='only resorts in this state')
+    parser.add_argument('--where', action='append', type=_parse_condition, default=[], metavar='FIELD__OP=VALUE',
+                        help=f"numeric condition, e.g. vertical__gt=600 (meters); fields: {', '.join(INDEXED_FIELDS)}")
+    args = parser.parse_args()
+
+    store = ResortStore.load(args.dataset)
+    conditions = dict(args.where)
+    if args.state:
+        conditions['state'] = args.state
+    try:
+        resorts = store.query(**conditions)
+    except ValueError as e:
+        parser.error(str(e))
+    print(f"🔍 {len(resorts)} of {len(store)} resorts match")
+    for resort in resorts:
+        print(f"   • {resort.get('name')} ({resort.get('state') or UNKNOWN_STATE})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Streaming output for scraped resorts
+
+Resorts are written one at a time instead of being collected into one
+big list and passed to json.dump:
+
+  * JsonlWriter    - one JSON object per line, flushed as each resort is
+                     scraped, so other tools can tail the file mid-crawl
+  * write_resorts  - stream any iterable of resorts to .jsonl, or to a
+                     .json array byte-identical to json.dump(indent=2)
+
+and read back lazily, one record at a time:
+
+  * iter_resort_records - dicts from a .jsonl or .json file; a truncated
+                          last line (a crawl still writing) is skipped
+
+Peak memory stays at one record regardless of dataset size.
+"""
+
+import json
+import os
+import re
+from dataclasses import asdict
+from typing import Dict, Iterable, Iterator, TextIO, Union
+
+Record = Union[Dict, object]
+
+# Whitespace and the comma between array elements
+_SEPARATOR = re.compile(r'\s*,?\s*')
+
+
+def resort_dict(resort: Record) -> Dict:
+    """Plain dict for a resort dataclass (or an already plain dict)"""
+    if isinstance(resort, dict):
+        return resort
+    if hasattr(resort, 'to_dict'):
+        return resort.to_dict()
+    return asdict(resort)
+
+
+class JsonlWriter:
+    """Append resorts to a JSONL file, one flushed line per resort"""
+
+    def __init__(self, path: str, append: bool = False):
+        self.path = path
+        self.count = 0
+        self._file = open(path, 'a' if append else 'w', encoding='utf-8')
+
+    def write(self, resort: Record):
+        self._file.write(json.dumps(resort_dict(resort), ensure_ascii=False) + '\n')
+        self._file.flush()
+        self.count += 1
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _write_json_array(resorts: Iterable[Record], f: TextIO) -> int:
+    # Same bytes as json.dump(list, f, indent=2, ensure_ascii=False)
+    count = 0
+    f.write('[')
+    for resort in resorts:
+        item = json.dumps(resort_dict(resort), indent=2, ensure_ascii=False)
+        f.write((',\n  ' if count else '\n  ') + item.replace('\n', '\n  '))
+        count += 1
+    f.write('\n]' if count else ']')
+    return count
+
+
+def write_resorts(resorts: Iterable[Record], path: str) -> int:
+    """Stream resorts to path (.jsonl lines, otherwise a JSON array); returns the count
+
+    The file is written under a temporary name and moved into place, so
+    readers never see a half-written dataset.
+    """
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        if path.endswith('.jsonl'):
+            count = 0
+            for resort in resorts:
+                f.write(json.dumps(resort_dict(resort), ensure_ascii=False) + '\n')
+                count += 1
+        else:
+            count = _write_json_array(resorts, f)
+    os.replace(tmp_path, path)
+    return count
+
+
+def iter_jsonl(path: str) -> Iterator[Dict]:
+    """Records from a JSONL file, skipping a partially written last line"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.endswith('\n'):
+                # Still being written (or cut off by a crash)
+                return
+            if line.strip():
+                yield json.loads(line)
+
+
+def iter_json_array(path: str, chunk_size: int = 65536) -> Iterator[Dict]:
+    """Elements of a top-level JSON array, decoded one at a time"""
+    decoder = json.JSONDecoder()
+    with open(path, 'r', encoding='utf-8') as f:
+        buffer = f.read(chunk_size).lstrip()
+        if not buffer.startswith('['):
+            raise ValueError(f"{path} does not contain a JSON array")
+        pos = 1
+        eof = False
+        while True:
+            pos = _SEPARATOR.match(buffer, pos).end()
+            if buffer.startswith(']', pos):
+                return
+            try:
+                record, pos = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # Element runs past the buffered text: read on and retry
+                if eof:
+                    raise
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buffer = buffer[pos:] + chunk
+                pos = 0
+                continue
+            yield record
+
+
+def iter_resort_records(path: str) -> Iterator[Dict]:
+    """Lazily read resort dicts from a .jsonl or .json dataset"""
+    if path.endswith('.jsonl'):
+        return iter_jsonl(path)
+    return iter_json_array(path)
@@ -0,0 +1,97 @@
+"""
+Canonical resort URLs and a persistent seen-URL index for discovery
+
+The same resort shows up under several spellings in skiresort.info links:
+relative or absolute, http or https, with or without "www.", with or
+without the trailing slash, with query strings or fragments, or as a
+sub-page (/test-report/, /webcams/, ...). canonical_resort_url maps all of
+them to one form:
+
+    https://www.skiresort.info/ski-resort/<slug>/
+
+SeenUrlIndex is a set of canonical URLs, optionally persisted as a plain
+text file (one URL per line, append-only) so that discovery in a later
+run can skip resorts an earlier run already scraped.
+"""
+
+import os
+import re
+import threading
+from typing import Iterable, List, Optional
+from urllib.parse import urljoin, urlsplit, urlunsplit
+
+SKIRESORT_BASE = 'https://www.skiresort.info'
+SKIRESORT_HOSTS = ('skiresort.info', 'www.skiresort.info')
+# Seen index shared by improved_usa_scraper.py and dataset_builder.py
+SEEN_INDEX_FILE = '.seen_resort_urls.txt'
+
+# Everything up to the resort slug; anything after it is a sub-page
+_RESORT_PATH = re.compile(r'^(.*?/ski-resort/[A-Za-z0-9-]+)(/.*)?$')
+
+
+def canonical_resort_url(href: str, base: str = SKIRESORT_BASE) -> Optional[str]:
+    """Canonical main-page URL of the resort href points at, or None if it is not a resort link"""
+    if not href:
+        return None
+    parts = urlsplit(urljoin(base + '/', href.strip()))
+    if parts.scheme not in ('http', 'https') or not parts.hostname:
+        return None
+    match = _RESORT_PATH.match(parts.path)
+    if not match:
+        return None
+
+    scheme, netloc = parts.scheme, parts.hostname
+    if parts.port:
+        netloc = f'{netloc}:{parts.port}'
+    if parts.hostname in SKIRESORT_HOSTS:
+        scheme, netloc = 'https', 'www.skiresort.info'
+    return urlunsplit((scheme, netloc, match.group(1).lower() + '/', '', ''))
+
+
+class SeenUrlIndex:
+    """Set of canonical resort URLs, optionally persisted one per line"""
+
+    def __init__(self, path: str = None, fresh: bool = False):
+        self.path = path
+        self._urls = set()
+        self._lock = threading.Lock()
+        self._file = None
+        if path:
+            if fresh and os.path.exists(path):
+                os.remove(path)
+            if os.path.exists(path):
+                with open(path, 'r', encoding='utf-8') as f:
+                    self._urls.update(line.strip() for line in f if line.strip())
+            self._file = open(path, 'a', encoding='utf-8')
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._urls
+
+    def __len__(self) -> int:
+        return len(self._urls)
+
+    def add(self, url: str) -> bool:
+        """Record url; returns False if it was already in the index"""
+        with self._lock:
+            if url in self._urls:
+                return False
+            self._urls.add(url)
+            if self._file:
+                self._file.write(url + '\n')
+                self._file.flush()
+            return True
+
+    def new_urls(self, urls: Iterable[str]) -> List[str]:
+        """urls not yet in the index, deduplicated, in order (the index is not changed)"""
+        new, batch = [], set()
+        for url in urls:
+            if url not in self._urls and url not in batch:
+                batch.add(url)
+                new.append(url)
+        return new
+
+    def close(self):
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Build-time search index for the app's resort data, and a reference query over it
+
+convert_usa_data.py writes search.json next to the per-state shards. With
+it, the app answers a search without scanning (or even downloading) every
+resort:
+
+    ids, states     resort id and state (index into "stateNames") per document;
+                    a document number is the resort's position in the dataset
+    text            normalized "name\\ncity\\nstate" per document
+    tokens          sorted vocabulary of normalized words, with "postings"
+                    the sorted document numbers of each word (prefix lookups
+                    are a binary search over the vocabulary)
+    trigrams        {trigram: sorted document numbers} over each field
+    ranges          {field: {"values": sorted values, "docs": document per value}}
+
+A search term matches like a substring search over name, city and state:
+terms of three characters or more intersect the postings of their
+rarest trigrams and confirm the candidates against "text"; shorter terms match
+the start of a word. Range filters are two binary searches each, and all
+lookups are intersected smallest first. src/services/searchIndex.ts is the
+TypeScript port of SearchIndex below; --check compares this implementation
+with a linear scan of the shards.
+
+Usage:
+    python3 search_index.py [TERM] [--index FILE] [--state STATE] [--range FIELD:MIN:MAX ...]
+    python3 search_index.py --check [--index FILE]
+"""
+
+import argparse
+import json
+import os
+import re
+import unicodedata
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+SEARCH_INDEX_VERSION = 1
+SEARCH_INDEX_FILE = '../public/data/resorts/search.json'
+
+# Range field -> path into a converted resort (SkiResort in the app)
+RANGE_FIELDS = {
+    'summit': ('elevation', 'summit'),
+    'base': ('elevation', 'base'),
+    'vertical': ('elevation', 'vertical'),
+    'lifts': ('lifts', 'total'),
+    'trails': ('trails', 'total'),
+    'acres': ('skiableAcres',),
+}
+
+# Shortest term looked up by trigrams; shorter terms use word prefixes
+TRIGRAM = 3
+# Trigram postings this many times longer than the candidates left are not
+# intersected; checking the candidates' text is cheaper
+PROBE_RATIO = 8
+
+_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+
+
+def normalize(text: Optional[str]) -> str:
+    """Lowercase, strip accents and collapse everything but letters and digits to single spaces"""
+    if not text:
+        return ''
+    decomposed = unicodedata.normalize('NFKD', text.lower())
+    stripped = ''.join(c for c in decomposed if not unicodedata.category(c).startswith('M'))
+    return _NON_ALNUM.sub(' ', stripped).strip()
+
+
+def trigrams(text: str) -> Set[str]:
+    return {text[i:i + TRIGRAM] for i in range(len(text) - TRIGRAM + 1)}
+
+
+def _range_value(resort: Dict, path: Tuple[str, ...]) -> float:
+    value = resort
+    for key in path:
+        value = value.get(key) if isinstance(value, dict) else None
+    return value or 0
+
+
+class SearchIndexBuilder:
+    """Accumulates converted resorts one at a time; build() returns the index
+
+    Lets a pipeline that already streams the dataset (convert_usa_data.py)
+    build the index in the same pass.
+    """
+
+    def __init__(self):
+        self.ids: List[str] = []
+        self.doc_states: List[int] = []
+        self.state_numbers: Dict[str, int] = {}
+        self.texts: List[str] = []
+        self.words: Dict[str, List[int]] = {}
+        self.grams: Dict[str, List[int]] = {}
+        self.values: Dict[str, List[Tuple[float, int]]] = {field: [] for field in RANGE_FIELDS}
+
+    def add(self, resort: Dict):
+        doc = len(self.ids)
+        location = resort.get('location', {})
+        state = location.get('state') or 'Unknown'
+        self.ids.append(resort['id'])
+        self.doc_states.append(self.state_numbers.setdefault(state, len(self.state_numbers)))
+
+        fields = [normalize(resort.get('name')), normalize(location.get('city')), normalize(state)]
+        self.texts.append('\n'.join(fields))
+        # Documents arrive in order, so every posting list stays sorted
+        for word in {word for field in fields for word in field.split()}:
+            self.words.setdefault(word, []).append(doc)
+        for gram in set().union(*(trigrams(field) for field in fields)):
+            self.grams.setdefault(gram, []).append(doc)
+        for field, path in RANGE_FIELDS.items():
+            self.values[field].append((_range_value(resort, path), doc))
+
+    def build(self) -> Dict:
+        vocabulary = sorted(self.words)
+        ranges = {}
+        for field, pairs in self.values.items():
+            pairs = sorted(pairs)
+            ranges[field] = {'values': [value for value, _ in pairs], 'docs': [doc for _, doc in pairs]}
+        return {
+            'version': SEARCH_INDEX_VERSION,
+            'ids': self.ids,
+            'states': self.doc_states,
+            'stateNames': list(self.state_numbers),
+            'text': self.texts,
+            'tokens': vocabulary,
+            'postings': [self.words[word] for word in vocabulary],
+            'trigrams': {gram: self.grams[gram] for gram in sorted(self.grams)},
+            'ranges': ranges,
+        }
+
+
+def build_search_index(resorts: Iterable[Dict]) -> Dict:
+    """Search index over converted resorts (see the module docstring for the layout)"""
+    builder = SearchIndexBuilder()
+    for resort in resorts:
+        builder.add(resort)
+    return builder.build()
+
+
+def write_search_index(index: Dict, path: str):
+    """Write a built index as compact JSON (atomically)"""
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
+        f.write('\n')
+    os.replace(tmp_path, path)
+
+
+def _intersect(lists: List[List[int]]) -> List[int]:
+    """Intersection of sorted document lists, starting from the shortest"""
+    if not lists:
+        return []
+    lists = sorted(lists, key=len)
+    result = lists[0]
+    for other in lists[1:]:
+        if not result:
+            break
+        members = set(other)
+        result = [doc for doc in result if doc in members]
+    return result
+
+
+class SearchIndex:
+    """Reference implementation of the queries the app runs over search.json"""
+
+    def __init__(self, data: Dict):
+        if data.get('version') != SEARCH_INDEX_VERSION:
+            raise ValueError(f"unsupported search index version {data.get('version')!r}")
+        self.data = data
+        self.ids: List[str] = data['ids']
+        self._state_docs: Dict[str, List[int]] = {normalize(name): [] for name in data['stateNames']}
+        for doc, number in enumerate(data['states']):
+            self._state_docs[normalize(data['stateNames'][number])].append(doc)
+
+    @classmethod
+    def load(cls, path: str = SEARCH_INDEX_FILE) -> 'SearchIndex':
+        with open(path, encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def prefix_docs(self, prefix: str) -> List[int]:
+        """Documents with a word starting with prefix (a binary search over the vocabulary)"""
+        tokens = self.data['tokens']
+        start = bisect_left(tokens, prefix)
+        docs: Set[int] = set()
+        for i in range(start, len(tokens)):
+            if not tokens[i].startswith(prefix):
+                break
+            docs.update(self.data['postings'][i])
+        return sorted(docs)
+
+    def text_docs(self, term: str) -> List[int]:
+        """Documents whose name, city or state contains term (after normalization)"""
+        query = normalize(term)
+        if len(query) < TRIGRAM:
+            return self.prefix_docs(query)
+        postings = self.data['trigrams']
+        lists = []
+        for gram in trigrams(query):
+            if gram not in postings:
+                return []
+            lists.append(postings[gram])
+        lists.sort(key=len)
+        candidates = lists[0]
+        for other in lists[1:]:
+            if len(other) > PROBE_RATIO * len(candidates):
+                break
+            candidates = _intersect([candidates, other])
+        texts = self.data['text']
+        return [doc for doc in candidates
+                if any(query in field for field in texts[doc].split('\n'))]
+
+    def range_docs(self, field: str, low: Optional[float] = None, high: Optional[float] = None) -> List[int]:
+        """Documents with low <= field <= high (either bound optional), sorted"""
+        column = self.data['ranges'][field]
+        values = column['values']
+        start = bisect_left(values, low) if low is not None else 0
+        end = bisect_right(values, high) if high is not None else len(values)
+        return sorted(column['docs'][start:end])
+
+    def state_docs(self, state: str) -> List[int]:
+        return self._state_docs.get(normalize(state), [])
+
+    def search(self, term: str = '', state: Optional[str] = None,
+               ranges: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]] = None) -> List[int]:
+        """Matching document numbers in dataset order; ranges maps a field to (min, max)"""
+        lists = []
+        if normalize(term):
+            lists.append(self.text_docs(term))
+        if state:
+            lists.append(self.state_docs(state))
+        for field, (low, high) in (ranges or {}).items():
+            if low is not None or high is not None:
+                lists.append(self.range_docs(field, low, high))
+        if not lists:
+            return list(range(len(self)))
+        return _intersect(lists)
+
+    def search_ids(self, *args, **kwargs) -> List[str]:
+        return [self.ids[doc] for doc in self.search(*args, **kwargs)]
+
+
+def _scan(resorts: List[Dict], term: str = '', state: Optional[str] = None,
+          ranges: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]] = None) -> List[str]:
+    """Linear scan with the same matching rules as SearchIndex.search (for --check)"""
+    query = normalize(term)
+    matches = []
+    for resort in resorts:
+        location = resort.get('location', {})
+        fields = [normalize(resort.get('name')), normalize(location.get('city')),
+                  normalize(location.get('state') or 'Unknown')]
+        if query:
+            if len(query) < TRIGRAM:
+                found = any(word.startswith(query) for field in fields for word in field.split())
+            else:
+                found = any(query in field for field in fields)
+            if not found:
+                continue
+        if state and fields[2] != normalize(state):
+            continue
+        in_range = True
+        for field, (low, high) in (ranges or {}).items():
+            value = _range_value(resort, RANGE_FIELDS[field])
+            if (low is not None and value < low) or (high is not None and value > high):
+                in_range = False
+        if in_range:
+            matches.append(resort['id'])
+    return matches
+
+
+def check(index_path: str) -> int:
+    """Compare indexed searches with a linear scan over the shards next to the index"""
+    directory = os.path.dirname(index_path) or '.'
+    with open(os.path.join(directory, 'index.json'), encoding='utf-8') as f:
+        shards = json.load(f)['states']
+    resorts = []
+    for shard in shards:
+        with open(os.path.join(directory, shard['file']), encoding='utf-8') as f:
+            resorts.extend(json.load(f))
+    index = SearchIndex.load(index_path)
+    order = {resort_id: doc for doc, resort_id in enumerate(index.ids)}
+    resorts.sort(key=lambda resort: order.get(resort['id'], len(order)))
+
+    terms = {''}
+    for text in index.data['text']:
+        for field in text.split('\n'):
+            terms.update(field[i:i + n] for n in (1, 2, 4, 9) for i in range(0, len(field), 5))
+    queries = [(term, None, None) for term in sorted(terms)]
+    summits = index.data['ranges']['summit']['values']
+    median = summits[len(summits) // 2] if summits else 0
+    for shard in shards:
+        queries.append(('', shard['state'], None))
+        queries.append(('ski', shard['state'], {'summit': (median, None)}))
+    queries.append(('', None, {'summit': (None, median), 'lifts': (3, None)}))
+
+    failures = 0
+    for term, state, ranges in queries:
+        expected = _scan(resorts, term, state, ranges)
+        found = index.search_ids(term, state, ranges)
+        if found != expected:
+            failures += 1
+            print(f"❌ {term!r} state={state} ranges={ranges}: index {len(found)}, scan {len(expected)}")
+    print(f"{'✅' if not failures else '❌'} {len(queries) - failures}/{len(queries)} queries match a linear scan "
+          f"over {len(resorts)} resorts")
+    return failures
+
+
+def _parse_range(spec: str) -> Tuple[str, Tuple[Optional[float], Optional[float]]]:
+    field, _, bounds = spec.partition(':')
+    if field not in RANGE_FIELDS:
+        raise argparse.ArgumentTypeError(f"unknown range field {field!r} (one of {', '.join(RANGE_FIELDS)})")
+    low, _, high = bounds.partition(':')
+    return field, (float(low) if low else None, float(high) if high else None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('term', nargs='?', default='', help='search term (name, city or state)')
+    parser.add_argument('--index', default=SEARCH_INDEX_FILE, help=f'search index (default: {SEARCH_INDEX_FILE})')
+    parser.add_argument('--state', help='only resorts in this state')
+    parser.add_argument('--range', dest='ranges', action='append', type=_parse_range, default=[],
+                        metavar='FIELD:MIN:MAX',
+                        help=f"inclusive range, either bound may be empty; fields: {', '.join(RANGE_FIELDS)}")
+    parser.add_argument('--check', action='store_true', help='compare indexed searches with a linear scan')
+    args = parser.parse_args()
+
+    if args.check:
+        raise SystemExit(1 if check(args.index) else 0)
+
+    index = SearchIndex.load(args.index)
+    ids = index.search_ids(args.term, args.state, dict(args.ranges))
+    print(f"🔍 {len(ids)} of {len(index)} resorts match")
+    for resort_id in ids:
+        print(f"   • {resort_id}")
+
+
+if __name__ == "__main__":
+    main()
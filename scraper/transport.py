@@ -0,0 +1,211 @@
+"""
+HTTP transport for the crawlers: pooled keep-alive connections, compression, optional HTTP/2
+
+mount_transport configures a requests session (normally a
+RateLimitedSession) so that every page is fetched over a reused
+connection with a compressed body:
+
+  * PooledHTTPAdapter keeps up to pool_maxsize keep-alive connections per
+    host and makes extra threads wait for one instead of opening (and then
+    discarding) throwaway connections;
+  * Accept-Encoding advertises every encoding urllib3 can decode: gzip and
+    deflate always, br with the brotli package, zstd with zstandard;
+  * with http2=True and httpx[http2] installed, https:// goes through
+    Http2Adapter instead: one multiplexed connection per host.
+
+Both adapters count requests, new connections and bytes on the wire vs
+decoded, in a shared TransportStats:
+
+    stats = mount_transport(session, pool_maxsize=8, http2=True)
+    ...
+    print(stats.summary())
+"""
+
+import threading
+from typing import Dict
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util import make_headers
+
+try:
+    import httpx
+except ImportError:  # optional: only needed for HTTP/2
+    httpx = None
+
+# Every content coding urllib3 can decode with the packages installed here
+ACCEPT_ENCODING = make_headers(accept_encoding=True)['accept-encoding']
+
+
+def http2_available() -> bool:
+    """True if httpx with HTTP/2 support (the h2 package) is installed"""
+    if httpx is None:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class TransportStats:
+    """Thread-safe request, connection and byte counters"""
+
+    def __init__(self):
+        self.requests = 0
+        self.connections = 0
+        self.wire_bytes = 0
+        self.body_bytes = 0
+        self.versions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, version: str, wire_bytes: int, body_bytes: int, new_connections: int = 0):
+        with self._lock:
+            self.requests += 1
+            self.connections += new_connections
+            self.wire_bytes += wire_bytes
+            self.body_bytes += body_bytes
+            self.versions[version] = self.versions.get(version, 0) + 1
+
+    def add_connection(self):
+        with self._lock:
+            self.connections += 1
+
+    @property
+    def reused(self) -> int:
+        """Requests sent over a connection that was already open"""
+        return max(0, self.requests - self.connections)
+
+    def as_dict(self) -> Dict:
+        with self._lock:
+            return {'requests': self.requests, 'connections': self.connections,
+                    'reused': self.reused, 'wire_bytes': self.wire_bytes,
+                    'body_bytes': self.body_bytes, 'versions': dict(self.versions)}
+
+    def summary(self) -> str:
+        stats = self.as_dict()
+        if not stats['requests']:
+            return "🔌 No network requests"
+        saved = 1 - stats['wire_bytes'] / stats['body_bytes'] if stats['body_bytes'] else 0.0
+        versions = ', '.join(f"{version}: {count}" for version, count in sorted(stats['versions'].items()))
+        connections = 'connection' if stats['connections'] == 1 else 'connections'
+        return (f"🔌 {stats['requests']} requests over {stats['connections']} {connections} "
+                f"({stats['reused']} reused); {stats['wire_bytes'] / 1024:.0f} KB on the wire for "
+                f"{stats['body_bytes'] / 1024:.0f} KB of pages ({saved:.0%} saved by compression); {versions}")
+
+
+class _CountingConnection:
+    """Connection mixin that counts every socket opened (first connect or reconnect)"""
+
+    stats: TransportStats = None
+
+    def _new_conn(self):
+        sock = super()._new_conn()
+        self.stats.add_connection()
+        return sock
+
+
+def _counting_pool_classes(stats: TransportStats) -> Dict[str, type]:
+    """urllib3 pool classes for http/https whose connections report to stats"""
+    classes = {}
+    for scheme, pool_cls, connection_cls in (('http', HTTPConnectionPool, HTTPConnection),
+                                             ('https', HTTPSConnectionPool, HTTPSConnection)):
+        counting = type(f'Counting{connection_cls.__name__}', (_CountingConnection, connection_cls),
+                        {'stats': stats})
+        classes[scheme] = type(f'Counting{pool_cls.__name__}', (pool_cls,), {'ConnectionCls': counting})
+    return classes
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter with a blocking per-host keep-alive pool that feeds TransportStats
+
+    pool_connections is the number of hosts whose pools are kept;
+    pool_maxsize the connections kept per host (match it to the threads fetching concurrently).
+    """
+
+    def __init__(self, pool_maxsize: int = 10, pool_connections: int = 10, stats: TransportStats = None):
+        self.stats = stats if stats is not None else TransportStats()
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=True)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = _counting_pool_classes(self.stats)
+
+    def send(self, request, stream=False, **kwargs):
+        response = super().send(request, stream=stream, **kwargs)
+        if stream:
+            return response
+        # Read the body here (requests would do it right after) so the
+        # compressed byte count is known; response.content is cached
+        body = response.content or b''
+        self.stats.record(f"HTTP/{response.raw.version / 10:.1f}", response.raw.tell(), len(body))
+        return response
+
+
+class Http2Adapter(BaseAdapter):
+    """requests adapter backed by an httpx.Client with HTTP/2 (needs httpx[http2])
+
+    Responses are converted to requests.Response with the body already
+    decoded; network errors are re-raised as the matching requests
+    exceptions so RateLimitedSession's retries still apply.
+    """
+
+    def __init__(self, max_connections: int = 10, stats: TransportStats = None):
+        if not http2_available():
+            raise RuntimeError("HTTP/2 needs httpx with the h2 package (pip install 'httpx[http2]')")
+        super().__init__()
+        self.stats = stats if stats is not None else TransportStats()
+        self._client = httpx.Client(http2=True, follow_redirects=False,
+                                    limits=httpx.Limits(max_connections=max_connections,
+                                                        max_keepalive_connections=max_connections))
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        opened = []
+
+        def trace(event, info):
+            if event == 'connection.connect_tcp.complete':
+                opened.append(event)
+
+        if isinstance(timeout, tuple):
+            timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+        try:
+            reply = self._client.request(request.method, request.url, headers=dict(request.headers),
+                                         content=request.body, timeout=timeout,
+                                         extensions={'trace': trace})
+        except httpx.TimeoutException as e:
+            raise requests.Timeout(e, request=request)
+        except httpx.TransportError as e:
+            raise requests.ConnectionError(e, request=request)
+
+        response = requests.Response()
+        response.status_code = reply.status_code
+        response.reason = reply.reason_phrase
+        response.url = str(reply.url)
+        response.headers = CaseInsensitiveDict(reply.headers)
+        response._content = reply.content
+        response._content_consumed = True
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.request = request
+        response.connection = self
+        self.stats.record(reply.http_version, reply.num_bytes_downloaded, len(reply.content), len(opened))
+        return response
+
+    def close(self):
+        self._client.close()
+
+
+def mount_transport(session: requests.Session, pool_maxsize: int = 10, pool_connections: int = 10,
+                    http2: bool = False, stats: TransportStats = None) -> TransportStats:
+    """Mount the pooled (and optionally HTTP/2) adapters on session; returns their shared stats"""
+    stats = stats if stats is not None else TransportStats()
+    adapter = PooledHTTPAdapter(pool_maxsize, pool_connections, stats)
+    session.mount('http://', adapter)
+    session.mount('https://', Http2Adapter(pool_maxsize, stats) if http2 else adapter)
+    session.headers.update({
+        'Accept-Encoding': ACCEPT_ENCODING,
+        'Connection': 'keep-alive',
+    })
+    return stats
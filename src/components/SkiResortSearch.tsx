@@ -1,6 +1,6 @@
-import React, { useState, useMemo } from 'react';
+import React, { useState, useMemo, useEffect } from 'react';
 import type { SearchFilters } from '../types/ski-resort';
-import { useSkiResortsFromAPI } from '../hooks/useSkiResortsAPI';
+import { useResortIndex, useSearchSkiResortsFromAPI } from '../hooks/useSkiResortsAPI';
 import SkiResortCard from './SkiResortCard';
 import SearchForm from './SearchForm';
 
@@ -8,46 +8,20 @@ const SkiResortSearch: React.FC = () => {
   const [searchTerm, setSearchTerm] = useState('');
   const [filters, setFilters] = useState<SearchFilters>({});
   
-  // Fetch resorts from API
-  const { resorts: apiResorts, loading, error } = useSkiResortsFromAPI();
-
-  // Filter and search resorts based on current criteria
-  const filteredResorts = useMemo(() => {
-    return apiResorts.filter(resort => {
-      // Text search
-      const matchesSearch = !searchTerm || 
-        resort.name.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        resort.location.city?.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        resort.location.state.toLowerCase().includes(searchTerm.toLowerCase());
-
-      // Filter by state
-      const matchesState = !filters.state || 
-        resort.location.state.toLowerCase() === filters.state.toLowerCase();
-
-      // Filter by elevation
-      const matchesMinElevation = !filters.minElevation || 
-        resort.elevation.summit >= filters.minElevation;
-
-      const matchesMaxElevation = !filters.maxElevation || 
-        resort.elevation.summit <= filters.maxElevation;
-
-      // Filter by lifts
-      const matchesMinLifts = !filters.minLifts || 
-        resort.lifts.total >= filters.minLifts;
-
-      // Filter by trails
-      const matchesMinTrails = !filters.minTrails || 
-        resort.trails.total >= filters.minTrails;
-
-      // Filter by skiable acres
-      const matchesMinAcres = !filters.minSkiableAcres || 
-        resort.skiableAcres >= filters.minSkiableAcres;
-
-      return matchesSearch && matchesState && matchesMinElevation && 
-             matchesMaxElevation && matchesMinLifts && matchesMinTrails && 
-             matchesMinAcres;
-    });
-  }, [searchTerm, filters, apiResorts]);
+  // Only the state index is loaded up front. A search or filter runs
+  // against the search index, which downloads just the shards of the states
+  // with matching resorts
+  const { index, error: indexError } = useResortIndex();
+  const browsing = !searchTerm && !filters.state && !filters.minElevation && !filters.maxElevation &&
+    !filters.minLifts && !filters.minTrails && !filters.minSkiableAcres;
+  const { searchResorts, resorts: filteredResorts, loading, error } = useSearchSkiResortsFromAPI();
+  const states = useMemo(() => index?.states.map(shard => shard.state) ?? [], [index]);
+
+  useEffect(() => {
+    if (!browsing) {
+      searchResorts(searchTerm, filters);
+    }
+  }, [browsing, searchTerm, filters, searchResorts]);
 
   return (
     <div className="ski-resort-search">
@@ -61,17 +35,39 @@ const SkiResortSearch: React.FC = () => {
         onSearchTermChange={setSearchTerm}
         filters={filters}
         onFiltersChange={setFilters}
+        states={states}
       />
 
-      {error && (
+      {(indexError || error) && (
         <div className="api-error">
           <p style={{ color: '#d9534f', padding: '1rem', background: '#f9f2f4', borderRadius: '4px' }}>
-            ⚠️ {error}
+            ⚠️ {indexError || error}
           </p>
         </div>
       )}
 
-      {loading ? (
+      {browsing ? (
+        index && (
+          <>
+            <div className="results-summary">
+              <p>{index.total} ski resorts in {index.states.length} states. Pick a state or search to see resorts.</p>
+            </div>
+
+            <div className="state-overview">
+              {index.states.map(shard => (
+                <button
+                  key={shard.slug}
+                  type="button"
+                  className="state-overview-btn"
+                  onClick={() => setFilters({ ...filters, state: shard.state })}
+                >
+                  {shard.state} <span className="state-count">({shard.count})</span>
+                </button>
+              ))}
+            </div>
+          </>
+        )
+      ) : loading ? (
         <div className="loading">
           <p style={{ textAlign: 'center', padding: '2rem', fontSize: '1.1rem' }}>
             🎿 Loading ski resort data...
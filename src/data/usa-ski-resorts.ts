@@ -1,1766 +0,0 @@
-// Auto-generated USA ski resort data from comprehensive web scraping
-// Generated on 2025-10-30 16:00:57
-// Source: skiresort.info comprehensive USA dataset
-
-export const usaSkiResorts = [
-  {
-    "id": "usa-resort-1",
-    "name": "Ski resort Alyeska Resort – Girdwood",
-    "location": {
-      "state": "Alaska",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/alyeska-resort-girdwood/",
-    "description": "All information about the ski resort Alyeska Resort – Girdwood. Skiing, snowboarding and ski holidays: Alyeska Resort – Girdwood",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  },
-  {
-    "id": "usa-resort-2",
-    "name": "Ski resort Dodge Ridge",
-    "location": {
-      "state": "California",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/dodge-ridge/",
-    "description": "All information about the ski resort Dodge Ridge. Skiing, snowboarding and ski holidays: Dodge Ridge",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  },
-  {
-    "id": "usa-resort-3",
-    "name": "Ski resort Big Boulder",
-    "location": {
-      "state": "Pennsylvania",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/big-boulder/",
-    "description": "All information about the ski resort Big Boulder. Skiing, snowboarding and ski holidays: Big Boulder",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  },
-  {
-    "id": "usa-resort-4",
-    "name": "Ski resort Rotarun",
-    "location": {
-      "state": "Idaho",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/rotarun/",
-    "description": "All information about the ski resort Rotarun. Skiing, snowboarding and ski holidays: Rotarun",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  },
-  {
-    "id": "usa-resort-5",
-    "name": "Ski resort Stagecoach Mountain",
-    "location": {
-      "state": "Colorado",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/stagecoach-mountain/",
-    "description": "All information about the ski resort Stagecoach Mountain. Skiing, snowboarding and ski holidays: Stagecoach Mountain",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  },
-  {
-    "id": "usa-resort-6",
-    "name": "Ski resort Hunter Mountain",
-    "location": {
-      "state": "New York",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/hunter-mountain/",
-    "description": "All information about the ski resort Hunter Mountain. Skiing, snowboarding and ski holidays: Hunter Mountain",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  },
-  {
-    "id": "usa-resort-7",
-    "name": "Ski resort Bear Mountain – Big Bear Lake",
-    "location": {
-      "state": "California",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/bear-mountain-big-bear-lake/",
-    "description": "All information about the ski resort Bear Mountain – Big Bear Lake. Skiing, snowboarding and ski holidays: Bear Mountain – Big Bear Lake",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  },
-  {
-    "id": "usa-resort-8",
-    "name": "Ski resort Granlibakken",
-    "location": {
-      "state": "California",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/granlibakken/",
-    "description": "All information about the ski resort Granlibakken. Skiing, snowboarding and ski holidays: Granlibakken",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  },
-  {
-    "id": "usa-resort-9",
-    "name": "Ski resort Palisades Tahoe",
-    "location": {
-      "state": "California",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/palisades-tahoe/",
-    "description": "All information about the ski resort Palisades Tahoe. Skiing, snowboarding and ski holidays: Palisades Tahoe",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  },
-  {
-    "id": "usa-resort-10",
-    "name": "Ski resort Black River Basin (Snowriver Mountain Resort)",
-    "location": {
-      "state": "Michigan",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/black-river-basin-snowriver-mountain-resort/",
-    "description": "All information about the ski resort Black River Basin (Snowriver Mountain Resort). Skiing, snowboarding and ski holidays: Black River Basin (Snowriver Mountain Resort)",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  },
-  {
-    "id": "usa-resort-11",
-    "name": "Ski resort Snowstar",
-    "location": {
-      "state": "Illinois",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/snowstar/",
-    "description": "All information about the ski resort Snowstar. Skiing, snowboarding and ski holidays: Snowstar",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  },
-  {
-    "id": "usa-resort-12",
-    "name": "Ski resort Aspen Mountain",
-    "location": {
-      "state": "Colorado",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/aspen-mountain/",
-    "description": "All information about the ski resort Aspen Mountain. Skiing, snowboarding and ski holidays: Aspen Mountain",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  },
-  {
-    "id": "usa-resort-13",
-    "name": "Ski resort Snowshoe Mountain",
-    "location": {
-      "state": "Virginia",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/snowshoe-mountain/",
-    "description": "All information about the ski resort Snowshoe Mountain. Skiing, snowboarding and ski holidays: Snowshoe Mountain",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  },
-  {
-    "id": "usa-resort-14",
-    "name": "Ski resort Maple Ski Ridge",
-    "location": {
-      "state": "New York",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/maple-ski-ridge/",
-    "description": "All information about the ski resort Maple Ski Ridge. Skiing, snowboarding and ski holidays: Maple Ski Ridge",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  },
-  {
-    "id": "usa-resort-15",
-    "name": "Ski resort Elk Mountain",
-    "location": {
-      "state": "Pennsylvania",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/elk-mountain/",
-    "description": "All information about the ski resort Elk Mountain. Skiing, snowboarding and ski holidays: Elk Mountain",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  },
-  {
-    "id": "usa-resort-16",
-    "name": "Ski resort Crystal Mountain (WA)",
-    "location": {
-      "state": "Washington",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/crystal-mountain-wa/",
-    "description": "All information about the ski resort Crystal Mountain (WA). Skiing, snowboarding and ski holidays: Crystal Mountain (WA)",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  },
-  {
-    "id": "usa-resort-17",
-    "name": "Ski resort McCauley Mountain",
-    "location": {
-      "state": "New York",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/mccauly-mountain/",
-    "description": "All information about the ski resort McCauley Mountain. Skiing, snowboarding and ski holidays: McCauley Mountain",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  },
-  {
-    "id": "usa-resort-18",
-    "name": "Ski resort Pine Mountain",
-    "location": {
-      "state": "Michigan",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/pine-mountain/",
-    "description": "All information about the ski resort Pine Mountain. Skiing, snowboarding and ski holidays: Pine Mountain",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  },
-  {
-    "id": "usa-resort-19",
-    "name": "Ski resort Alpine Mountain Ski & Snow Tubing Center",
-    "location": {
-      "state": "New York",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/alpine-mountain-ski-snow-tubing-center/",
-    "description": "All information about the ski resort Alpine Mountain Ski & Snow Tubing Center. Skiing, snowboarding and ski holidays: Alpine Mountain Ski & Snow Tubing Center",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  },
-  {
-    "id": "usa-resort-20",
-    "name": "Video Aletsch Arena – Riederalp/​Bettmeralp/​Fiesch Eggishorn",
-    "location": {
-      "state": "Unknown",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/aletsch-arena-riederalpbettmeralpfiesch-eggishorn/video/",
-    "description": "Film/video of the ski resort Aletsch Arena – Riederalp/Bettmeralp/Fiesch Eggishorn, Towns/villages at the ski resort: Bettmeralp, Riederalp, Fiescheralp, Mörel, Fiesch, Greich, Betten, Ried-Mörel, Fieschertal, Lax, Grengiols, Ernen, Mühlebach",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  },
-  {
-    "id": "usa-resort-21",
-    "name": "Ski resort Buena Vista",
-    "location": {
-      "state": "Minnesota",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/buena-vista/",
-    "description": "All information about the ski resort Buena Vista. Skiing, snowboarding and ski holidays: Buena Vista",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  },
-  {
-    "id": "usa-resort-22",
-    "name": "Ski resort Mt. Baldy",
-    "location": {
-      "state": "California",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/mt-baldy/",
-    "description": "All information about the ski resort Mt. Baldy. Skiing, snowboarding and ski holidays: Mt. Baldy",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  },
-  {
-    "id": "usa-resort-23",
-    "name": "Ski resort Blandford",
-    "location": {
-      "state": "Massachusetts",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/blandford/",
-    "description": "All information about the ski resort Blandford. Skiing, snowboarding and ski holidays: Blandford",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  },
-  {
-    "id": "usa-resort-24",
-    "name": "Ski resort Tenney Mountain",
-    "location": {
-      "state": "New Hampshire",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/tenney-mountain/",
-    "description": "All information about the ski resort Tenney Mountain. Skiing, snowboarding and ski holidays: Tenney Mountain",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  },
-  {
-    "id": "usa-resort-25",
-    "name": "Ski resort Elk Ridge – Williams",
-    "location": {
-      "state": "Unknown",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/elk-ridge-williams/",
-    "description": "All information about the ski resort Elk Ridge – Williams. Skiing, snowboarding and ski holidays: Elk Ridge – Williams",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  },
-  {
-    "id": "usa-resort-26",
-    "name": "Ski resort Crotched Mountain",
-    "location": {
-      "state": "New Hampshire",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/crotched-mountain/",
-    "description": "All information about the ski resort Crotched Mountain. Skiing, snowboarding and ski holidays: Crotched Mountain",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  },
-  {
-    "id": "usa-resort-27",
-    "name": "Ski resort Bear Valley",
-    "location": {
-      "state": "California",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/bear-valley/",
-    "description": "All information about the ski resort Bear Valley. Skiing, snowboarding and ski holidays: Bear Valley",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  },
-  {
-    "id": "usa-resort-28",
-    "name": "Ski resort Norway Mountain",
-    "location": {
-      "state": "Michigan",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/norway-mountain/",
-    "description": "All information about the ski resort Norway Mountain. Skiing, snowboarding and ski holidays: Norway Mountain",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  },
-  {
-    "id": "usa-resort-29",
-    "name": "Ski resort Blacktail Mountain",
-    "location": {
-      "state": "Montana",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/blacktail-mountain/",
-    "description": "All information about the ski resort Blacktail Mountain. Skiing, snowboarding and ski holidays: Blacktail Mountain",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  },
-  {
-    "id": "usa-resort-30",
-    "name": "Ski resort Lyndon Outing Club",
-    "location": {
-      "state": "Vermont",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/lyndon-outing-club/",
-    "description": "All information about the ski resort Lyndon Outing Club. Skiing, snowboarding and ski holidays: Lyndon Outing Club",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  },
-  {
-    "id": "usa-resort-31",
-    "name": "Ski resort Gunstock",
-    "location": {
-      "state": "New Hampshire",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/gunstock/",
-    "description": "All information about the ski resort Gunstock. Skiing, snowboarding and ski holidays: Gunstock",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  },
-  {
-    "id": "usa-resort-32",
-    "name": "Ski resort Mount Snow",
-    "location": {
-      "state": "Montana",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/mount-snow/",
-    "description": "All information about the ski resort Mount Snow. Skiing, snowboarding and ski holidays: Mount Snow",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  },
-  {
-    "id": "usa-resort-33",
-    "name": "Ski resort Hatley Pointe",
-    "location": {
-      "state": "North Carolina",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/wolf-ridge/",
-    "description": "All information about the ski resort Hatley Pointe. Skiing, snowboarding and ski holidays: Hatley Pointe",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  },
-  {
-    "id": "usa-resort-34",
-    "name": "Ski resort Crystal Mountain (MI)",
-    "location": {
-      "state": "Michigan",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/crystal-mountain-mi/",
-    "description": "All information about the ski resort Crystal Mountain (MI). Skiing, snowboarding and ski holidays: Crystal Mountain (MI)",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  },
-  {
-    "id": "usa-resort-35",
-    "name": "Ski resort Schweitzer Mountain Resort",
-    "location": {
-      "state": "Idaho",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/schweitzer-mountain-resort/",
-    "description": "All information about the ski resort Schweitzer Mountain Resort. Skiing, snowboarding and ski holidays: Schweitzer Mountain Resort",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  },
-  {
-    "id": "usa-resort-36",
-    "name": "Ski resort Whitetail Ridge – Fort McCoy",
-    "location": {
-      "state": "Wisconsin",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/whitetail-ridge-fort-mccoy/",
-    "description": "All information about the ski resort Whitetail Ridge – Fort McCoy. Skiing, snowboarding and ski holidays: Whitetail Ridge – Fort McCoy",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  },
-  {
-    "id": "usa-resort-37",
-    "name": "Ski resort Montage Mountain Resort",
-    "location": {
-      "state": "New York",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/montage-mountain-resort/",
-    "description": "All information about the ski resort Montage Mountain Resort. Skiing, snowboarding and ski holidays: Montage Mountain Resort",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  },
-  {
-    "id": "usa-resort-38",
-    "name": "Ski resort Mountain High East",
-    "location": {
-      "state": "California",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/mountain-high-east/",
-    "description": "All information about the ski resort Mountain High East. Skiing, snowboarding and ski holidays: Mountain High East",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  },
-  {
-    "id": "usa-resort-39",
-    "name": "Ski resort Sipapu",
-    "location": {
-      "state": "New Mexico",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/sipapu/",
-    "description": "All information about the ski resort Sipapu. Skiing, snowboarding and ski holidays: Sipapu",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  },
-  {
-    "id": "usa-resort-40",
-    "name": "Ski resort Bittersweet",
-    "location": {
-      "state": "Michigan",
-      "coordinates": {
-        "latitude": 0.0,
-        "longitude": 0.0
-      }
-    },
-    "elevation": {
-      "base": 0,
-      "summit": 0,
-      "vertical": 0
-    },
-    "lifts": {
-      "total": 0,
-      "chairlifts": 0,
-      "surfaceLifts": 0,
-      "gondolas": 0
-    },
-    "trails": {
-      "total": 0,
-      "beginner": 0,
-      "intermediate": 0,
-      "advanced": 0,
-      "expert": 0
-    },
-    "skiableAcres": 0,
-    "snowmaking": {
-      "percentage": 50,
-      "acres": 0
-    },
-    "seasonDates": {
-      "opening": "December",
-      "closing": "April"
-    },
-    "website": "https://www.skiresort.de/skigebiet/bittersweet/",
-    "description": "All information about the ski resort Bittersweet. Skiing, snowboarding and ski holidays: Bittersweet",
-    "amenities": [],
-    "liftTicketPrice": {
-      "adult": 75
-    }
-  }
-];
@@ -1,44 +1,37 @@
-import { useState, useEffect } from 'react';
-import type { SkiResort, SearchFilters } from '../types/ski-resort';
+import { useState, useEffect, useCallback, useRef } from 'react';
+import type { SkiResort, SearchFilters, ResortIndex } from '../types/ski-resort';
 import { SkiResortAPI } from '../services/skiResortAPI';
 
-interface UseSkiResortsFromAPI {
-  resorts: SkiResort[];
+interface UseResortIndex {
+  index: ResortIndex | null;
   loading: boolean;
   error: string | null;
-  refetch: () => void;
 }
 
-export const useSkiResortsFromAPI = (): UseSkiResortsFromAPI => {
-  const [resorts, setResorts] = useState<SkiResort[]>([]);
-  const [loading, setLoading] = useState<boolean>(true);
+// The small state index: enough to render the state list and counts at startup
+export const useResortIndex = (): UseResortIndex => {
+  const [index, setIndex] = useState<ResortIndex | null>(null);
   const [error, setError] = useState<string | null>(null);
 
-  const fetchResorts = async () => {
-    setLoading(true);
-    setError(null);
-    
-    try {
-      const data = await SkiResortAPI.getAllResorts();
-      setResorts(data);
-    } catch (err) {
-      console.error('Failed to fetch resorts from API:', err);
-      setError('Failed to load ski resort data from API.');
-      setResorts([]); // Empty array as fallback
-    } finally {
-      setLoading(false);
-    }
-  };
-
   useEffect(() => {
-    fetchResorts();
+    let cancelled = false;
+    SkiResortAPI.getIndex()
+      .then(data => {
+        if (!cancelled) setIndex(data);
+      })
+      .catch(err => {
+        console.error('Failed to fetch resort index:', err);
+        if (!cancelled) setError('Failed to load the list of states.');
+      });
+    return () => {
+      cancelled = true;
+    };
   }, []);
 
   return {
-    resorts,
-    loading,
+    index,
+    loading: !index && !error,
     error,
-    refetch: fetchResorts,
   };
 };
 
@@ -53,22 +46,27 @@ export const useSearchSkiResortsFromAPI = (): UseSearchSkiResortsFromAPI => {
   const [resorts, setResorts] = useState<SkiResort[]>([]);
   const [loading, setLoading] = useState<boolean>(false);
   const [error, setError] = useState<string | null>(null);
+  // Only the latest search may update the results (one runs per keystroke)
+  const latestSearch = useRef<number>(0);
 
-  const searchResorts = async (searchTerm?: string, filters?: SearchFilters) => {
+  const searchResorts = useCallback(async (searchTerm?: string, filters?: SearchFilters) => {
+    const search = ++latestSearch.current;
     setLoading(true);
     setError(null);
     
     try {
       const data = await SkiResortAPI.searchResorts(searchTerm || '', filters);
-      setResorts(data);
+      if (search === latestSearch.current) setResorts(data);
     } catch (err) {
       console.error('Failed to search resorts from API:', err);
-      setError('Failed to search ski resorts. Please try again.');
-      setResorts([]);
+      if (search === latestSearch.current) {
+        setError('Failed to search ski resorts. Please try again.');
+        setResorts([]);
+      }
     } finally {
-      setLoading(false);
+      if (search === latestSearch.current) setLoading(false);
     }
-  };
+  }, []);
 
   return {
     searchResorts,
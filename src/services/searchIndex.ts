@@ -0,0 +1,171 @@
+import type { SearchFilters } from '../types/ski-resort';
+
+// Search index written by scraper/search_index.py (search.json next to the
+// state shards); SearchIndex mirrors the Python reference implementation
+export interface SearchIndexData {
+  version: number;
+  ids: string[]; // resort id per document
+  states: number[]; // index into stateNames per document
+  stateNames: string[];
+  text: string[]; // normalized "name\ncity\nstate" per document
+  tokens: string[]; // sorted vocabulary
+  postings: number[][]; // sorted documents per token
+  trigrams: Record<string, number[]>;
+  ranges: Record<RangeField, { values: number[]; docs: number[] }>;
+}
+
+export type RangeField = 'summit' | 'base' | 'vertical' | 'lifts' | 'trails' | 'acres';
+
+export const SEARCH_INDEX_VERSION = 1;
+
+// Shortest term looked up by trigrams; shorter terms match word prefixes
+const TRIGRAM = 3;
+// Trigram postings this many times longer than the candidates left are not
+// intersected; checking the candidates' text is cheaper
+const PROBE_RATIO = 8;
+
+// Lowercase, strip accents and collapse everything but letters and digits to single spaces
+export const normalize = (text: string | undefined): string =>
+  (text ?? '')
+    .toLowerCase()
+    .normalize('NFKD')
+    .replace(/\p{M}/gu, '')
+    .replace(/[^a-z0-9]+/g, ' ')
+    .trim();
+
+const trigrams = (text: string): Set<string> => {
+  const grams = new Set<string>();
+  for (let i = 0; i + TRIGRAM <= text.length; i++) {
+    grams.add(text.slice(i, i + TRIGRAM));
+  }
+  return grams;
+};
+
+// First position in a sorted array whose value is >= target (or > target with upper)
+const bisect = <T>(values: T[], target: T, upper = false): number => {
+  let low = 0;
+  let high = values.length;
+  while (low < high) {
+    const mid = (low + high) >> 1;
+    if (values[mid] < target || (upper && values[mid] === target)) {
+      low = mid + 1;
+    } else {
+      high = mid;
+    }
+  }
+  return low;
+};
+
+// Intersection of sorted document lists, starting from the shortest
+const intersect = (lists: number[][]): number[] => {
+  if (lists.length === 0) return [];
+  const [first, ...rest] = [...lists].sort((a, b) => a.length - b.length);
+  let result = first;
+  for (const other of rest) {
+    if (result.length === 0) break;
+    const members = new Set(other);
+    result = result.filter(doc => members.has(doc));
+  }
+  return result;
+};
+
+export class SearchIndex {
+  private readonly data: SearchIndexData;
+  private readonly stateDocs = new Map<string, number[]>();
+
+  constructor(data: SearchIndexData) {
+    if (data.version !== SEARCH_INDEX_VERSION) {
+      throw new Error(`Unsupported search index version ${data.version}`);
+    }
+    this.data = data;
+    data.stateNames.forEach(name => this.stateDocs.set(normalize(name), []));
+    data.states.forEach((number, doc) => {
+      this.stateDocs.get(normalize(data.stateNames[number]))?.push(doc);
+    });
+  }
+
+  get size(): number {
+    return this.data.ids.length;
+  }
+
+  id(doc: number): string {
+    return this.data.ids[doc];
+  }
+
+  state(doc: number): string {
+    return this.data.stateNames[this.data.states[doc]];
+  }
+
+  // Documents with a word starting with prefix (a binary search over the vocabulary)
+  prefixDocs(prefix: string): number[] {
+    const { tokens, postings } = this.data;
+    const docs = new Set<number>();
+    for (let i = bisect(tokens, prefix); i < tokens.length && tokens[i].startsWith(prefix); i++) {
+      postings[i].forEach(doc => docs.add(doc));
+    }
+    return [...docs].sort((a, b) => a - b);
+  }
+
+  // Documents whose name, city or state contains term (after normalization)
+  textDocs(term: string): number[] {
+    const query = normalize(term);
+    if (query.length < TRIGRAM) {
+      return this.prefixDocs(query);
+    }
+    const lists: number[][] = [];
+    for (const gram of trigrams(query)) {
+      const docs = this.data.trigrams[gram];
+      if (!docs) return [];
+      lists.push(docs);
+    }
+    lists.sort((a, b) => a.length - b.length);
+    let candidates = lists[0];
+    for (const other of lists.slice(1)) {
+      if (other.length > PROBE_RATIO * candidates.length) break;
+      candidates = intersect([candidates, other]);
+    }
+    return candidates.filter(doc =>
+      this.data.text[doc].split('\n').some(field => field.includes(query))
+    );
+  }
+
+  // Documents with low <= field <= high (either bound optional), sorted
+  rangeDocs(field: RangeField, low?: number, high?: number): number[] {
+    const { values, docs } = this.data.ranges[field];
+    const start = low === undefined ? 0 : bisect(values, low);
+    const end = high === undefined ? values.length : bisect(values, high, true);
+    return docs.slice(start, end).sort((a, b) => a - b);
+  }
+
+  stateDocsFor(state: string): number[] {
+    return this.stateDocs.get(normalize(state)) ?? [];
+  }
+
+  // Matching documents in dataset order; unset (or zero) filters are ignored
+  // like in the original linear filter
+  search(searchTerm: string, filters: SearchFilters = {}): number[] {
+    const lists: number[][] = [];
+    if (normalize(searchTerm)) {
+      lists.push(this.textDocs(searchTerm));
+    }
+    if (filters.state) {
+      lists.push(this.stateDocsFor(filters.state));
+    }
+    if (filters.minElevation || filters.maxElevation) {
+      lists.push(this.rangeDocs('summit', filters.minElevation || undefined, filters.maxElevation || undefined));
+    }
+    if (filters.minLifts) {
+      lists.push(this.rangeDocs('lifts', filters.minLifts));
+    }
+    if (filters.minTrails) {
+      lists.push(this.rangeDocs('trails', filters.minTrails));
+    }
+    if (filters.minSkiableAcres) {
+      lists.push(this.rangeDocs('acres', filters.minSkiableAcres));
+    }
+    if (lists.length === 0) {
+      return this.data.ids.map((_, doc) => doc);
+    }
+    return intersect(lists);
+  }
+}
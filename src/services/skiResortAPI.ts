@@ -1,48 +1,94 @@
-import type { SkiResort } from '../types/ski-resort';
-import { usaSkiResorts } from '../data/usa-ski-resorts';
+import type { SkiResort, ResortIndex, SearchFilters } from '../types/ski-resort';
+import { SearchIndex } from './searchIndex';
+import type { SearchIndexData } from './searchIndex';
+
+// Per-state shards and their index, written by scraper/convert_usa_data.py
+const DATA_URL = `${import.meta.env.BASE_URL}data/resorts/`;
+
+// Each file is fetched at most once per page load; failed requests are
+// dropped from the cache so they can be retried
+let indexRequest: Promise<ResortIndex> | null = null;
+let searchIndexRequest: Promise<SearchIndex> | null = null;
+const shardRequests = new Map<string, Promise<SkiResort[]>>();
+
+const fetchJson = async <T>(file: string): Promise<T> => {
+  const response = await fetch(DATA_URL + file);
+  if (!response.ok) {
+    throw new Error(`Failed to load ${file}: HTTP ${response.status}`);
+  }
+  return response.json() as Promise<T>;
+};
 
 // API service for ski resort data
 export class SkiResortAPI {
-  // Fetch all ski resorts
+  // Fetch the state index (a few KB: states, resort counts and shard files)
+  static getIndex(): Promise<ResortIndex> {
+    if (!indexRequest) {
+      indexRequest = fetchJson<ResortIndex>('index.json').catch(err => {
+        indexRequest = null;
+        throw err;
+      });
+    }
+    return indexRequest;
+  }
+
+  // Fetch the search index (tokens, trigrams and sorted numeric columns of
+  // every resort, without the resorts themselves)
+  static getSearchIndex(): Promise<SearchIndex> {
+    if (!searchIndexRequest) {
+      searchIndexRequest = fetchJson<SearchIndexData>('search.json')
+        .then(data => new SearchIndex(data))
+        .catch(err => {
+          searchIndexRequest = null;
+          throw err;
+        });
+    }
+    return searchIndexRequest;
+  }
+
+  // Fetch all ski resorts (every state shard, in parallel)
   static async getAllResorts(): Promise<SkiResort[]> {
-    console.log('ℹ️ Using comprehensive USA ski resort dataset');
-    return Promise.resolve(usaSkiResorts);
+    console.log('ℹ️ Loading every state of the USA ski resort dataset');
+    const index = await this.getIndex();
+    const shards = await Promise.all(index.states.map(shard => this.getResortsByState(shard.state)));
+    return shards.flat();
   }
 
-  // Get resorts by state
+  // Get resorts by state (only that state's shard is downloaded)
   static async getResortsByState(state: string): Promise<SkiResort[]> {
-    console.log(`🎿 Filtering resorts by state: ${state}`);
-    const allResorts = await this.getAllResorts();
-    return allResorts.filter(resort => 
-      resort.location.state.toLowerCase() === state.toLowerCase()
+    console.log(`🎿 Loading resorts for state: ${state}`);
+    const index = await this.getIndex();
+    const shard = index.states.find(entry =>
+      entry.state.toLowerCase() === state.toLowerCase()
     );
+    if (!shard) {
+      return [];
+    }
+
+    let request = shardRequests.get(shard.file);
+    if (!request) {
+      request = fetchJson<SkiResort[]>(shard.file).catch(err => {
+        shardRequests.delete(shard.file);
+        throw err;
+      });
+      shardRequests.set(shard.file, request);
+    }
+    return request;
   }
 
-  // Search resorts
-  static async searchResorts(
-    searchTerm: string, 
-    filters: { state?: string; minElevation?: number; maxElevation?: number } = {}
-  ): Promise<SkiResort[]> {
+  // Search resorts: the search index picks the matching resorts, then only
+  // the shards of the states they are in are downloaded
+  static async searchResorts(searchTerm: string, filters: SearchFilters = {}): Promise<SkiResort[]> {
     console.log(`🔍 Searching resorts with term: "${searchTerm}"`);
-    const allResorts = await this.getAllResorts();
-    
-    return allResorts.filter(resort => {
-      const matchesSearch = !searchTerm || 
-        resort.name.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        resort.location.city?.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        resort.location.state.toLowerCase().includes(searchTerm.toLowerCase());
-
-      const matchesState = !filters.state || 
-        resort.location.state.toLowerCase() === filters.state.toLowerCase();
-
-      const matchesMinElevation = !filters.minElevation || 
-        resort.elevation.summit >= filters.minElevation;
-
-      const matchesMaxElevation = !filters.maxElevation || 
-        resort.elevation.summit <= filters.maxElevation;
+    const index = await this.getSearchIndex();
+    const docs = index.search(searchTerm, filters);
 
-      return matchesSearch && matchesState && matchesMinElevation && matchesMaxElevation;
-    });
+    const states = [...new Set(docs.map(doc => index.state(doc)))];
+    const shards = await Promise.all(states.map(state => this.getResortsByState(state)));
+    const resortsById = new Map(shards.flat().map(resort => [resort.id, resort]));
+    return docs
+      .map(doc => resortsById.get(index.id(doc)))
+      .filter((resort): resort is SkiResort => resort !== undefined);
   }
 }
 
@@ -59,6 +59,21 @@ export interface SearchFilters {
   minSkiableAcres?: number;
 }
 
+// Summary written next to the per-state data shards (public/data/resorts/index.json)
+export interface ResortIndex {
+  generated: string;
+  total: number;
+  states: StateShard[];
+}
+
+export interface StateShard {
+  state: string;
+  slug: string;
+  count: number; // resorts in the shard
+  file: string; // shard file name, relative to the index
+  bytes: number;
+}
+
 export interface LiftStats {
   resortId: string;
   liftName: string;